@@ -0,0 +1,493 @@
+"""
+Summary of ``AsyncPgSQL.py``
+----------------------------
+
+An ``asyncio`` counterpart to ``PostgreSQL``, for use inside
+async applications (like a web service) where many independent
+queries should be in flight at once without tying up threads.
+
+Requires the optional ``asyncpg`` package.
+
+Examples
+--------
+
+    >>> import asyncio
+    >>> import postgis_helpers as pGIS
+    >>> async def main():
+    ...     async with pGIS.AsyncPostgreSQL("my_database_name") as db:
+    ...         bikes, roads = await asyncio.gather(
+    ...             db.query_as_geo_df("select * from bike_lanes"),
+    ...             db.query_as_geo_df("select * from roads"),
+    ...         )
+    >>> asyncio.run(main())
+
+"""
+import os
+import asyncio
+
+import pandas as pd
+import geopandas as gpd
+
+from pathlib import Path
+
+from .PgSQL import PostgreSQL
+from .copy_helpers import postgres_type, create_table_sql, TYPE_INFERENCE_SAMPLE_SIZE
+from .geopandas_helpers import geometries_to_hex_ewkb, hex_ewkb_to_geometries
+from .config_helpers import DEFAULT_DATA_OUTBOX
+
+try:
+    import asyncpg
+except ImportError:
+    asyncpg = None
+
+
+class AsyncPostgreSQL:
+    """
+    Awaitable version of the most-used ``PostgreSQL`` methods,
+    backed by an ``asyncpg`` connection pool.
+
+    Geometry is sent and received as binary EWKB, and is decoded
+    all at once per query instead of row by row.
+    """
+
+    def __init__(
+        self,
+        working_db: str,
+        un: str = "postgres",
+        pw: str = "password1",
+        host: str = "localhost",
+        port: int = 5432,
+        sslmode: str = None,
+        super_db: str = "postgres",
+        super_un: str = "postgres",
+        super_pw: str = "password2",
+        active_schema: str = "public",
+        verbosity: str = "full",
+        data_outbox: Path = DEFAULT_DATA_OUTBOX,
+        pool_min_size: int = 1,
+        pool_max_size: int = 10,
+    ):
+        """
+        Initialize a database object. No connections are made
+        until the first query.
+
+        :param working_db: Name of the database you want to connect to
+        :type working_db: str
+        :param pool_min_size: number of connections to open with the pool,
+                              defaults to 1
+        :type pool_min_size: int, optional
+        :param pool_max_size: maximum number of open connections, which is
+                              also how many queries can run at once,
+                              defaults to 10
+        :type pool_max_size: int, optional
+
+        All other parameters match ``PostgreSQL()``.
+        """
+
+        if asyncpg is None:
+            raise ImportError("AsyncPostgreSQL requires asyncpg: pip install asyncpg")
+
+        self.DATABASE = working_db
+        self.USER = un
+        self.PASSWORD = pw
+        self.HOST = host
+        self.PORT = port
+        self.SSLMODE = sslmode
+        self.SUPER_DB = super_db
+        self.SUPER_USER = super_un
+        self.SUPER_PASSWORD = super_pw
+        self.ACTIVE_SCHEMA = active_schema
+        self.DATA_OUTBOX = data_outbox
+
+        verbosity_options = ["full", "minimal", "errors"]
+
+        if verbosity in verbosity_options:
+            self.VERBOSITY = verbosity
+        else:
+            msg = f"verbosity must be one of: {verbosity_options}"
+            raise ValueError(msg)
+
+        self.POOL_MIN_SIZE = int(pool_min_size)
+        self.POOL_MAX_SIZE = int(pool_max_size)
+
+        self._pools = {}
+        self._pools_lock = None
+
+    # These don't touch the database, so they're shared with PostgreSQL()
+    uri = PostgreSQL.uri
+    connection_details = PostgreSQL.connection_details
+    _print = PostgreSQL._print
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    # CONNECTIONS to the database
+    # ---------------------------
+
+    @staticmethod
+    async def _init_connection(connection) -> None:
+        """
+        Send and receive PostGIS geometry as binary EWKB bytes.
+        The bytes are decoded in bulk by ``query_as_geo_df()``.
+        """
+
+        geometry_schema = await connection.fetchval(
+            """
+            SELECT n.nspname FROM pg_type t
+            JOIN pg_namespace n ON n.oid = t.typnamespace
+            WHERE t.typname = 'geometry'
+            """
+        )
+
+        # The super db may not have PostGIS installed
+        if geometry_schema:
+            await connection.set_type_codec(
+                "geometry",
+                schema=geometry_schema,
+                encoder=bytes,
+                decoder=bytes,
+                format="binary",
+            )
+
+    async def _pool(self, super_uri: bool = False):
+        """
+        Get the pool for either set of credentials, creating it if needed.
+
+        :param super_uri: flag for the super db/user pool, defaults to False
+        :type super_uri: bool, optional
+        :return: ``asyncpg`` connection pool
+        """
+        uri = self.uri(super_uri=super_uri)
+
+        # The lock has to be made inside the running event loop
+        if self._pools_lock is None:
+            self._pools_lock = asyncio.Lock()
+
+        async with self._pools_lock:
+            if uri not in self._pools:
+                self._pools[uri] = await asyncpg.create_pool(
+                    uri,
+                    min_size=self.POOL_MIN_SIZE,
+                    max_size=self.POOL_MAX_SIZE,
+                    init=self._init_connection,
+                )
+
+        return self._pools[uri]
+
+    async def close(self) -> None:
+        """ Close every connection in every pool """
+
+        pools, self._pools = list(self._pools.values()), {}
+
+        for pool in pools:
+            await pool.close()
+
+    # QUERY the database
+    # ------------------
+
+    async def _fetch(self, query: str, super_uri: bool = False) -> tuple:
+        """
+        Run a query and get the rows along with the column names,
+        which are known even when no rows come back.
+
+        :return: tuple of (list of column names, list of records)
+        :rtype: tuple
+        """
+        pool = await self._pool(super_uri=super_uri)
+
+        async with pool.acquire() as connection:
+            statement = await connection.prepare(query)
+            column_names = [attribute.name for attribute in statement.get_attributes()]
+            rows = await statement.fetch()
+
+        return column_names, rows
+
+    async def query_as_list(self, query: str, super_uri: bool = False) -> list:
+        """
+        Query the database and get the result as a list of tuples
+
+        :param query: any valid SQL query string
+        :type query: str
+        :param super_uri: flag that will execute against the
+                          super db/user, defaults to False
+        :type super_uri: bool, optional
+        :return: list with each item being a row from the query result
+        :rtype: list
+        """
+        self._print(1, "... querying ...")
+
+        _, rows = await self._fetch(query, super_uri=super_uri)
+
+        return [tuple(row) for row in rows]
+
+    async def query_as_single_item(self, query: str, super_uri: bool = False):
+        """
+        Query the database and get the first value of the first row
+
+        :param query: any valid SQL query string
+        :type query: str
+        :param super_uri: flag that will execute against the
+                          super db/user, defaults to False
+        :type super_uri: bool, optional
+        :return: a single value, or None if there are no rows
+        """
+        pool = await self._pool(super_uri=super_uri)
+
+        return await pool.fetchval(query)
+
+    async def query_as_df(self, query: str, super_uri: bool = False) -> pd.DataFrame:
+        """
+        Query the database and get the result as a ``pandas.DataFrame``
+
+        :param query: any valid SQL query string
+        :type query: str
+        :return: dataframe with the query result
+        :rtype: pd.DataFrame
+        """
+        self._print(1, "... querying ...")
+
+        column_names, rows = await self._fetch(query, super_uri=super_uri)
+
+        return pd.DataFrame.from_records(
+            [tuple(row) for row in rows], columns=column_names, coerce_float=True
+        )
+
+    async def query_as_geo_df(self, query: str, geom_col: str = "geom") -> gpd.GeoDataFrame:
+        """
+        Query the database and get the result as a ``geopandas.GeoDataFrame``
+
+        :param query: any valid SQL query string
+        :type query: str
+        :param geom_col: name of the column that holds the geometry,
+                         defaults to 'geom'
+        :type geom_col: str
+        :return: geodataframe with the query result
+        :rtype: gpd.GeoDataFrame
+        """
+        df = await self.query_as_df(query)
+
+        geoms, srid = hex_ewkb_to_geometries(df[geom_col])
+        df[geom_col] = geoms
+
+        crs = f"EPSG:{srid}" if srid else None
+
+        return gpd.GeoDataFrame(df, geometry=geom_col, crs=crs)
+
+    # EXECUTE queries to make them persistent
+    # ---------------------------------------
+
+    async def execute(self, query: str, autocommit: bool = False) -> None:
+        """
+        Execute a query for a persistent result in the database.
+        Use ``autocommit=True`` when creating and deleting databases.
+
+        :param query: any valid SQL query string
+        :type query: str
+        :param autocommit: flag that will execute against the
+                           super db/user, outside of a transaction,
+                           defaults to False
+        :type autocommit: bool, optional
+        """
+        self._print(1, "... executing ...")
+
+        pool = await self._pool(super_uri=autocommit)
+
+        async with pool.acquire() as connection:
+            if autocommit:
+                await connection.execute(query)
+            else:
+                async with connection.transaction():
+                    await connection.execute(query)
+
+    # IMPORT data into the database
+    # -----------------------------
+
+    async def _copy_dataframe(
+        self,
+        dataframe: pd.DataFrame,
+        table_name: str,
+        schema: str,
+        if_exists: str,
+        column_types: dict,
+    ) -> int:
+        """
+        Create a table and load a dataframe into it with binary ``COPY``.
+
+        :return: number of rows written
+        :rtype: int
+        """
+        if if_exists not in ["fail", "replace", "append"]:
+            raise ValueError(f"'{if_exists}' is not valid for if_exists")
+
+        full_table_name = f"{schema}.{table_name}"
+
+        sample = dataframe.iloc[:TYPE_INFERENCE_SAMPLE_SIZE]
+        sql_types = {col: postgres_type(sample[col]) for col in dataframe.columns}
+        sql_types.update(column_types)
+
+        # Binary COPY is strict about Python types,
+        # so send text columns as str and missing values as None
+        values = dataframe.astype(object)
+        for col, sql_type in sql_types.items():
+            if sql_type == "TEXT":
+                values[col] = values[col].map(lambda v: v if pd.isna(v) else str(v))
+        values = values.where(dataframe.notna(), None)
+
+        pool = await self._pool()
+
+        async with pool.acquire() as connection:
+            async with connection.transaction():
+                table_exists = await connection.fetchval(
+                    "SELECT to_regclass($1) IS NOT NULL", full_table_name
+                )
+
+                if table_exists and if_exists == "fail":
+                    raise ValueError(f"Table '{table_name}' already exists.")
+
+                if table_exists and if_exists == "replace":
+                    await connection.execute(f"DROP TABLE {full_table_name};")
+                    table_exists = False
+
+                if not table_exists:
+                    await connection.execute(create_table_sql(full_table_name, sql_types))
+
+                await connection.copy_records_to_table(
+                    table_name,
+                    schema_name=schema,
+                    columns=list(dataframe.columns),
+                    records=values.itertuples(index=False, name=None),
+                )
+
+        return len(dataframe)
+
+    async def import_dataframe(
+        self,
+        dataframe: pd.DataFrame,
+        table_name: str,
+        if_exists: str = "fail",
+        schema: str = None,
+    ) -> None:
+        """
+        Import an in-memory ``pandas.DataFrame`` to the SQL database
+        with binary ``COPY``.
+
+        :param dataframe: dataframe with data you want to save
+        :type dataframe: pd.DataFrame
+        :param table_name: name of the table that will get created
+        :type table_name: str
+        :param if_exists: one of ``"fail"``, ``"replace"``, or ``"append"``,
+                          defaults to "fail"
+        :type if_exists: str, optional
+        """
+        if not schema:
+            schema = self.ACTIVE_SCHEMA
+
+        self._print(2, f"Importing dataframe to: {schema}.{table_name}")
+
+        dataframe = dataframe.copy()
+        PostgreSQL._sanitize_column_names(dataframe)
+
+        await self.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
+        await self._copy_dataframe(dataframe, table_name, schema, if_exists, {})
+
+    async def import_geodataframe(
+        self,
+        gdf: gpd.GeoDataFrame,
+        table_name: str,
+        if_exists: str = "replace",
+        schema: str = None,
+        uid_col: str = "uid",
+    ) -> None:
+        """
+        Import an in-memory ``geopandas.GeoDataFrame`` to the SQL database,
+        with the geometry sent as binary EWKB. The table gets a ``uid``
+        primary key and a spatial index, like ``PostgreSQL().import_geodataframe()``.
+
+        :param gdf: geodataframe with data you want to save
+        :type gdf: gpd.GeoDataFrame
+        :param table_name: name of the table that will get created
+        :type table_name: str
+        :param if_exists: one of ``"fail"``, ``"replace"``, or ``"append"``,
+                          defaults to "replace"
+        :type if_exists: str, optional
+        """
+        if not schema:
+            schema = self.ACTIVE_SCHEMA
+
+        epsg_code = gdf.crs.to_epsg()
+        geom_typ = max(gdf.geometry.geom_type.dropna().unique(), key=len).upper()
+
+        self._print(2, f"Importing {geom_typ} geodataframe to: {schema}.{table_name}")
+
+        hex_geoms = geometries_to_hex_ewkb(gdf.geometry, epsg_code)
+
+        df = pd.DataFrame(gdf.drop(columns=gdf.geometry.name))
+        df.columns = [c.lower() for c in df.columns]
+        df = df.drop(columns=[c for c in ["geom", "gid"] if c in df.columns])
+        df = df.rename(columns={uid_col: f"old_{uid_col}"})
+        df["geom"] = [None if h is None else bytes.fromhex(h) for h in hex_geoms]
+
+        column_types = {"geom": f"geometry({geom_typ}, {epsg_code})"}
+
+        await self.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
+        await self._copy_dataframe(df, table_name, schema, if_exists, column_types)
+
+        await self.execute(
+            f"""
+            ALTER TABLE {schema}.{table_name} DROP COLUMN IF EXISTS {uid_col};
+            ALTER TABLE {schema}.{table_name} ADD {uid_col} serial PRIMARY KEY;
+            CREATE INDEX ON {schema}.{table_name} USING GIST (geom);
+            """
+        )
+
+    # EXPORT data to file / disk
+    # --------------------------
+
+    async def export_shapefile(
+        self,
+        table_name: str,
+        output_folder: Path = None,
+        where_clause: str = None,
+        schema: str = None,
+    ) -> gpd.GeoDataFrame:
+        """
+        Save a spatial SQL table to shapefile. The query is awaited,
+        and the file is written in a worker thread.
+
+        :param table_name: Name of the table to export
+        :type table_name: str
+        :param output_folder: Folder path to write to, defaults to ``DATA_OUTBOX``
+        :type output_folder: Path
+        :param where_clause: Any valid SQL where clause, defaults to None
+        :type where_clause: str, optional
+        """
+        if not schema:
+            schema = self.ACTIVE_SCHEMA
+
+        if not output_folder:
+            output_folder = self.DATA_OUTBOX
+
+        self._print(2, f"Exporting {schema}.{table_name} to shapefile")
+
+        query = f"SELECT * FROM {schema}.{table_name} "
+
+        if where_clause:
+            query += where_clause
+
+        gdf = await self.query_as_geo_df(query)
+
+        # Force any boolean columns into strings
+        for c in gdf.columns:
+            if gdf[c].dtype.name == "bool":
+                gdf[c] = gdf[c].astype(str)
+
+        output_path = os.path.join(output_folder, f"{table_name}.shp")
+
+        await asyncio.get_running_loop().run_in_executor(None, gdf.to_file, output_path)
+
+        self._print(1, f"Saved to {output_path}")
+
+        return gdf
@@ -14,22 +14,81 @@ Create a database and import a shapefile:
 
 """
 import os
+import re
+import copy
+import gzip
+import json
+import math
+import uuid
+import shutil
+import itertools
+import threading
+import functools
+import tempfile
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import pandas as pd
 import geopandas as gpd
 
-import psycopg2
 import sqlalchemy
 from geoalchemy2 import Geometry, WKTElement
 
-from typing import Union
+from typing import Union, Iterator
 from pathlib import Path
+from contextlib import contextmanager
 
 from .sql_helpers import sql_hex_grid_function_definition
-from .general_helpers import now, report_time_delta, dt_as_time
-from .geopandas_helpers import spatialize_point_dataframe
-from .console import _console, RichStyle, RichSyntax
+from .general_helpers import (
+    now,
+    report_time_delta,
+    dt_as_time,
+    dependency_levels,
+    detect_pgdump_format,
+    pgdump_compression_extension,
+    epsg_from_prj,
+    size_on_disk,
+    human_readable_size,
+)
+from .geopandas_helpers import (
+    GEOMETRY_CODECS,
+    spatialize_point_dataframe,
+    xy_arrays,
+    points_to_hex_ewkb,
+    encode_geometries,
+    decode_geometries,
+)
+from .copy_helpers import (
+    COPY_CHUNK_SIZE,
+    TYPE_INFERENCE_SAMPLE_SIZE,
+    dataframe_chunks,
+    conform_dtypes,
+    widen_type,
+    postgres_type,
+    create_table_sql,
+    copy_chunk,
+    quote_identifier,
+    pipe_copy,
+    range_conditions,
+    ctid_conditions,
+)
+from .console import _console, RichStyle, RichSyntax, RichProgress
 from .config_helpers import DEFAULT_DATA_INBOX, DEFAULT_DATA_OUTBOX
+from .connection_helpers import ConnectionPool, shared_pool, close_shared_pool, pool_engine
+from .cache_helpers import QueryResultCache, normalize_sql
+from .io_helpers import (
+    ARROW_BATCH_SIZE,
+    arrow_schema,
+    batch_to_dataframe,
+    copy_to_arrow,
+    dataframe_to_batch,
+    epsg_from_crs,
+    flatgeobuf_batches,
+    geoparquet_batches,
+    ogr_geometry_type,
+    postgis_geometry_type,
+    write_flatgeobuf,
+    write_geoparquet,
+)
 
 
 class PostgreSQL:
@@ -43,6 +102,9 @@ class PostgreSQL:
         - superusername & password
         - the SQL cluster's master database
         - ``verbosity`` level, which controls how much gets printed out
+
+    Connections are pooled and reused by every query. The normal
+    and super-user credentials each get their own pool.
     """
 
     def __init__(
@@ -60,6 +122,14 @@ class PostgreSQL:
         verbosity: str = "full",
         data_inbox: Path = DEFAULT_DATA_INBOX,
         data_outbox: Path = DEFAULT_DATA_OUTBOX,
+        pool_min_size: int = 0,
+        pool_max_size: int = 5,
+        pool_idle_timeout: float = 300,
+        pool_health_check: bool = True,
+        pool_shared: bool = False,
+        create_if_missing: bool = True,
+        catalog_cache_ttl: float = 60,
+        query_cache: Union[bool, QueryResultCache] = False,
     ):
         """
         Initialize a database object with placeholder values.
@@ -86,6 +156,42 @@ class PostgreSQL:
                           defaults to ``"full"``. Other options include
                           ``"minimal"`` and ``"errors"``
         :type verbosity: str, optional
+        :param pool_min_size: number of idle connections to keep open
+                              regardless of the idle timeout, defaults to 0
+        :type pool_min_size: int, optional
+        :param pool_max_size: maximum number of open connections per
+                              set of credentials, defaults to 5
+        :type pool_max_size: int, optional
+        :param pool_idle_timeout: seconds before an idle connection gets
+                                  closed, defaults to 300
+        :type pool_idle_timeout: float, optional
+        :param pool_health_check: flag to ping stale connections before
+                                  reusing them, defaults to True
+        :type pool_health_check: bool, optional
+        :param pool_shared: flag to share connection pools with every other
+                            ``PostgreSQL()`` in this process that uses the
+                            same URI, defaults to False
+        :type pool_shared: bool, optional
+        :param create_if_missing: flag to check that the database exists,
+                                  and create it if not, defaults to True.
+                                  Skip this check when you already know
+                                  the database exists.
+        :type create_if_missing: bool, optional
+        :param catalog_cache_ttl: seconds that lookups of tables, columns
+                                  and databases are cached for, defaults
+                                  to 60. Use 0 to turn the cache off.
+        :type catalog_cache_ttl: float, optional
+        :param query_cache: flag to save the results of ``query_as_df()``
+                            and ``query_as_geo_df()`` to local Parquet files
+                            and reuse them until the tables they read from
+                            change. Every lookup reads the row versions of
+                            those tables, so a committed write from any
+                            session is noticed right away, at the cost of a
+                            pass over each table. Writes made through this
+                            object also clear the cache. Pass a
+                            ``QueryResultCache`` to choose the folder and
+                            size limit. Defaults to False
+        :type query_cache: Union[bool, QueryResultCache], optional
 
         TODO: add data box, print style, schema params
         """
@@ -116,7 +222,27 @@ class PostgreSQL:
             msg = f"verbosity must be one of: {verbosity_options}"
             raise ValueError(msg)
 
-        if not self.exists():
+        self.POOL_SETTINGS = {
+            "min_size": int(pool_min_size),
+            "max_size": int(pool_max_size),
+            "idle_timeout": float(pool_idle_timeout),
+            "health_check": pool_health_check,
+        }
+        self.POOL_SHARED = pool_shared
+
+        self._pools = {}
+        self._engines = {}
+
+        if query_cache is True:
+            query_cache = QueryResultCache()
+
+        self.QUERY_CACHE = query_cache or None
+
+        self.CATALOG_CACHE_TTL = float(catalog_cache_ttl)
+        self._catalog_cache = {}
+        self._catalog_cache_lock = threading.Lock()
+
+        if create_if_missing and not self.exists():
             self.db_create()
 
         msg = f":person_surfing::water_wave: {self.DATABASE} @ {self.HOST} :water_wave::water_wave:"
@@ -227,6 +353,49 @@ class PostgreSQL:
 
         return magic
 
+    def catalog_cache(func):
+        """
+        Decorator function that caches the result of a catalog lookup
+        (tables, columns, etc.) for ``CATALOG_CACHE_TTL`` seconds.
+
+        The cache is cleared by ``execute()`` and by every other method
+        in this class that changes the database, so it only goes stale
+        when the database is changed from outside of this object.
+
+        :param func: the lookup function to cache
+        :type func: function
+        """
+
+        @functools.wraps(func)
+        def magic(self, *args, **kwargs):
+            if self.CATALOG_CACHE_TTL <= 0:
+                return func(self, *args, **kwargs)
+
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+
+            with self._catalog_cache_lock:
+                cached = self._catalog_cache.get(key)
+
+            if cached and now().timestamp() - cached[0] < self.CATALOG_CACHE_TTL:
+                return copy.copy(cached[1])
+
+            function_return_value = func(self, *args, **kwargs)
+
+            with self._catalog_cache_lock:
+                self._catalog_cache[key] = (now().timestamp(), function_return_value)
+
+            return copy.copy(function_return_value)
+
+        return magic
+
+    def clear_catalog_cache(self) -> None:
+        """
+        Forget every cached catalog lookup. Call this after changing
+        the database outside of this object (i.e. with ``psql``).
+        """
+        with self._catalog_cache_lock:
+            self._catalog_cache = {}
+
     def add_schema(self, schema: str) -> None:
         """
         Add a schema if it does not yet exist.
@@ -236,6 +405,95 @@ class PostgreSQL:
         """
         self.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
 
+    # CONNECTIONS to the database
+    # ---------------------------
+
+    def _pool(self, super_uri: bool = False) -> ConnectionPool:
+        """
+        Get the connection pool for the normal or super-user URI,
+        creating it the first time it's needed.
+
+        :param super_uri: flag to use the super db/user, defaults to False
+        :type super_uri: bool, optional
+        :return: connection pool for this URI
+        :rtype: ConnectionPool
+        """
+        uri = self.uri(super_uri=super_uri)
+
+        if uri not in self._pools:
+            if self.POOL_SHARED:
+                self._pools[uri] = shared_pool(uri, **self.POOL_SETTINGS)
+            else:
+                self._pools[uri] = ConnectionPool(uri, **self.POOL_SETTINGS)
+
+        return self._pools[uri]
+
+    @contextmanager
+    def connection(self, super_uri: bool = False, autocommit: bool = False):
+        """
+        Borrow a pooled ``psycopg2`` connection. The transaction is
+        committed when the ``with`` block finishes, or rolled back
+        if it raises an error.
+
+            >>> with db.connection() as connection:
+            ...     cursor = connection.cursor()
+
+        :param super_uri: flag that will connect to the
+                          super db/user, defaults to False
+        :type super_uri: bool, optional
+        :param autocommit: flag to run outside of a transaction block,
+                           defaults to False
+        :type autocommit: bool, optional
+        """
+        with self._pool(super_uri=super_uri).connection(autocommit=autocommit) as connection:
+            yield connection
+
+    def _engine(self, super_uri: bool = False) -> sqlalchemy.engine.Engine:
+        """
+        Get a ``sqlalchemy`` engine for this database. The engine
+        borrows its connections from this object's connection pool,
+        so ``pool_max_size`` caps both.
+
+        :param super_uri: flag to use the super db/user, defaults to False
+        :type super_uri: bool, optional
+        :return: sqlalchemy engine
+        :rtype: sqlalchemy.engine.Engine
+        """
+        uri = self.uri(super_uri=super_uri)
+
+        if uri not in self._engines:
+            self._engines[uri] = pool_engine(self._pool(super_uri=super_uri))
+
+        return self._engines[uri]
+
+    def close_connections(self, super_uri: bool = None) -> None:
+        """
+        Close all pooled connections. They will be reopened
+        automatically by the next query.
+
+        :param super_uri: only close the super-user connections if True,
+                          or only the normal ones if False. Defaults to
+                          None, which closes both.
+        :type super_uri: bool, optional
+        """
+
+        if super_uri is None:
+            uris = [self.uri(super_uri=False), self.uri(super_uri=True)]
+        else:
+            uris = [self.uri(super_uri=super_uri)]
+
+        for uri in uris:
+            pool = self._pools.pop(uri, None)
+            if pool:
+                if self.POOL_SHARED:
+                    close_shared_pool(uri)
+                else:
+                    pool.close()
+
+            engine = self._engines.pop(uri, None)
+            if engine:
+                engine.dispose()
+
     # QUERY the database
     # ------------------
 
@@ -255,22 +513,20 @@ class PostgreSQL:
         code_w_highlight = RichSyntax(query, "sql", theme="monokai", line_numbers=True)
         self._print(1, code_w_highlight)
 
-        uri = self.uri(super_uri=super_uri)
-
-        connection = psycopg2.connect(uri)
-
-        cursor = connection.cursor()
+        with self.connection(super_uri=super_uri) as connection:
+            cursor = connection.cursor()
 
-        cursor.execute(query)
+            cursor.execute(query)
 
-        result = cursor.fetchall()
+            result = cursor.fetchall()
 
-        cursor.close()
-        connection.close()
+            cursor.close()
 
         return result
 
-    def query_as_df(self, query: str, super_uri: bool = False) -> pd.DataFrame:
+    def query_as_df(
+        self, query: str, super_uri: bool = False, use_cache: bool = True, arrow: bool = False
+    ) -> pd.DataFrame:
         """
         Query the database and get the result as a ``pandas.DataFrame``
 
@@ -279,6 +535,14 @@ class PostgreSQL:
         :param super_uri: flag that will execute against the
                           super db/user, defaults to False
         :type super_uri: bool, optional
+        :param use_cache: flag to use the ``query_cache`` (if this object
+                          has one), defaults to True
+        :type use_cache: bool, optional
+        :param arrow: flag to read the result with ``query_as_arrow()``,
+                      which is faster and leaner for large results.
+                      Geometry columns then hold EWKB bytes instead
+                      of hex strings. Defaults to False
+        :type arrow: bool, optional
         :return: dataframe with the query result
         :rtype: pd.DataFrame
         """
@@ -287,23 +551,54 @@ class PostgreSQL:
         code_w_highlight = RichSyntax(query, "sql", theme="monokai", line_numbers=True)
         self._print(1, code_w_highlight)
 
-        uri = self.uri(super_uri=super_uri)
+        if use_cache and self.QUERY_CACHE and not super_uri:
+            cache_key, tables = self._query_cache_key(query, "df", arrow)
+            df = self.QUERY_CACHE.get(cache_key)
+
+            if df is not None:
+                self._print(1, "Loaded the result from the query cache")
+                return df
 
-        engine = sqlalchemy.create_engine(uri)
-        df = pd.read_sql(query, engine)
-        engine.dispose()
+        if arrow:
+            df = self.query_as_arrow(query, super_uri=super_uri).to_pandas()
+        else:
+            df = pd.read_sql(query, self._engine(super_uri))
+
+        if use_cache and self.QUERY_CACHE and not super_uri:
+            self._query_cache_put(cache_key, df, tables)
 
         return df
 
-    def query_as_geo_df(self, query: str, geom_col: str = "geom") -> gpd.GeoDataFrame:
+    def query_as_geo_df(
+        self,
+        query: str,
+        geom_col: str = "geom",
+        geometry_codec: str = "wkb",
+        use_cache: bool = True,
+        arrow: bool = False,
+    ) -> gpd.GeoDataFrame:
         """
         Query the database and get the result as a ``geopandas.GeoDataFrame``
 
+        With the default ``"wkb"`` codec the geometry is decoded from the
+        EWKB that PostGIS sends, all at once instead of row by row.
+        The ``"wkt"`` codec asks PostGIS for EWKT text instead.
+
         :param query: any valid SQL query string
         :type query: str
         :param geom_col: name of the column that holds the geometry,
                          defaults to 'geom'
         :type geom_col: str
+        :param geometry_codec: ``"wkb"`` or ``"wkt"``, defaults to "wkb"
+        :type geometry_codec: str, optional
+        :param use_cache: flag to use the ``query_cache`` (if this object
+                          has one), defaults to True
+        :type use_cache: bool, optional
+        :param arrow: flag to read the result with ``query_as_arrow()``,
+                      which is faster and leaner for large results.
+                      The geometry always travels as EWKB in this case,
+                      so ``geometry_codec`` is ignored. Defaults to False
+        :type arrow: bool, optional
         :return: geodataframe with the query result
         :rtype: gpd.GeoDataFrame
         """
@@ -311,14 +606,305 @@ class PostgreSQL:
         code_w_highlight = RichSyntax(query, "sql", theme="monokai", line_numbers=True)
         self._print(1, code_w_highlight)
 
-        connection = psycopg2.connect(self.uri())
+        if use_cache and self.QUERY_CACHE:
+            cache_key, tables = self._query_cache_key(query, "geo_df", geom_col)
+            gdf = self.QUERY_CACHE.get(cache_key)
+
+            if gdf is not None:
+                self._print(1, "Loaded the result from the query cache")
+                return gdf
+
+        if arrow:
+            df = self.query_as_arrow(query).to_pandas()
+
+            geoms, srid = decode_geometries(df[geom_col], codec="wkb")
+
+        else:
+            query = self._geo_query(query, geom_col, geometry_codec)
+
+            with self.connection() as connection:
+                cursor = connection.cursor()
 
-        gdf = gpd.GeoDataFrame.from_postgis(query, connection, geom_col=geom_col)
+                cursor.execute(query)
 
-        connection.close()
+                rows = cursor.fetchall()
+                column_names = [c[0] for c in cursor.description]
+
+                cursor.close()
+
+            df = pd.DataFrame.from_records(rows, columns=column_names, coerce_float=True)
+
+            geoms, srid = decode_geometries(df[geom_col], codec=geometry_codec)
+
+        df[geom_col] = geoms
+
+        crs = f"EPSG:{srid}" if srid else None
+
+        gdf = gpd.GeoDataFrame(df, geometry=geom_col, crs=crs)
+
+        if use_cache and self.QUERY_CACHE:
+            self._query_cache_put(cache_key, gdf, tables)
 
         return gdf
 
+    def query_as_arrow(self, query: str, super_uri: bool = False):
+        """
+        Query the database and get the result as a ``pyarrow.Table``.
+
+        The result is streamed with ``COPY ... TO STDOUT`` and parsed
+        by Arrow's multi-threaded CSV reader straight into columnar
+        buffers, so no Python object gets built for each value.
+        Column types come from PostgreSQL rather than being guessed.
+        Geometry and geography columns are returned as EWKB ``binary``
+        columns, and timestamps with a time zone are returned in UTC.
+
+        Requires ``pyarrow``.
+
+            >>> table = db.query_as_arrow("SELECT * FROM big_table")
+            >>> df = table.to_pandas()
+
+        :param query: any valid SQL query string
+        :type query: str
+        :param super_uri: flag that will execute against the
+                          super db/user, defaults to False
+        :type super_uri: bool, optional
+        :return: table with the query result
+        :rtype: pyarrow.Table
+        """
+        query = self._as_subquery(query)
+
+        with self.connection(super_uri=super_uri) as connection:
+            cursor = connection.cursor()
+
+            columns = self._query_column_types(cursor, query)
+
+            # Make sure dates and times come out in a format that Arrow can parse
+            cursor.execute("SET LOCAL DateStyle = 'ISO'; SET LOCAL TimeZone = 'UTC';")
+
+            table = copy_to_arrow(cursor, query, columns)
+
+            cursor.close()
+
+        return table
+
+    @staticmethod
+    def _query_column_types(cursor, query: str) -> list:
+        """
+        Get the name and type of each column a query would
+        return, without running it.
+
+        :param cursor: ``psycopg2`` cursor
+        :param query: any valid SQL query string, without a trailing semicolon
+        :type query: str
+        :return: list of ``(column name, pg_type.typname)`` tuples
+        :rtype: list
+        """
+        cursor.execute(f"SELECT * FROM ({query}) AS _q LIMIT 0")
+        description = [(c[0], c[1]) for c in cursor.description]
+
+        type_oids = sorted({type_oid for _, type_oid in description}) or [0]
+        cursor.execute("SELECT oid, typname FROM pg_type WHERE oid = ANY(%s)", (type_oids,))
+        type_names = dict(cursor.fetchall())
+
+        return [(name, type_names.get(type_oid, "text")) for name, type_oid in description]
+
+    def _query_cache_key(self, query: str, *variant) -> tuple:
+        """
+        Build the ``query_cache`` key for a query. The key covers the
+        database, the exact SQL text and the current fingerprint of
+        every table the query reads (found with ``EXPLAIN``).
+
+        Each table is fingerprinted by its ``relfilenode`` (which changes
+        on ``TRUNCATE`` and rewrites), its columns, and the hash of its
+        row versions from ``_row_versions()``. All of them change as soon
+        as a write commits, from this session or any other one. Hashing
+        the row versions reads every table the query uses.
+
+        Queries that call volatile functions like ``now()`` or
+        ``random()`` shouldn't be cached.
+
+        :param query: any valid SQL query string
+        :type query: str
+        :return: tuple of (cache key, list of ``schema.table`` names)
+        :rtype: tuple
+        """
+
+        with self.connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute(f"EXPLAIN (VERBOSE, FORMAT JSON) {query}")
+            plan = cursor.fetchone()[0]
+            cursor.close()
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        # Walk the plan for every table that gets scanned
+        tables = set()
+        nodes = [node["Plan"] for node in plan]
+
+        while nodes:
+            node = nodes.pop()
+            if "Relation Name" in node:
+                tables.add(f"{node.get('Schema', self.ACTIVE_SCHEMA)}.{node['Relation Name']}")
+            nodes.extend(node.get("Plans", []))
+
+        tables = sorted(tables)
+        fingerprints = []
+
+        if tables:
+            relations = ", ".join(
+                "'" + ".".join(quote_identifier(part) for part in t.split(".", 1)) + "'::regclass"
+                for t in tables
+            )
+            sql_fingerprints = f"""
+                SELECT c.oid::regclass::text, c.relfilenode,
+                    md5(string_agg(
+                        a.attname || ' ' || format_type(a.atttypid, a.atttypmod),
+                        ',' ORDER BY a.attnum
+                    ))
+                FROM pg_class c
+                JOIN pg_attribute a
+                    ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+                WHERE c.oid IN ({relations})
+                GROUP BY c.oid, c.relfilenode
+                ORDER BY 1;
+            """
+
+            with self.connection() as connection:
+                cursor = connection.cursor()
+
+                # One snapshot for every table
+                cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY;")
+
+                cursor.execute(sql_fingerprints)
+
+                for relation, filenode, columns in cursor.fetchall():
+                    rows, row_hash = self._row_versions(cursor, relation)
+                    fingerprints.append([relation, filenode, columns, rows, row_hash])
+
+                cursor.close()
+
+        cache_key = QueryResultCache.make_key(
+            self.HOST, self.PORT, self.DATABASE, normalize_sql(query), variant, fingerprints
+        )
+
+        return cache_key, tables
+
+    @staticmethod
+    def _row_versions(cursor, full_table_name: str) -> tuple:
+        """
+        Count the rows of a table and hash their ``(ctid, xmin)`` pairs.
+        Every insert and update writes a row version with a new pair and
+        every delete removes one, so the result changes as soon as a
+        write commits. Unlike the ``pg_stat`` counters, it can't lag
+        behind or be reset. This reads the whole table.
+
+        :param cursor: ``psycopg2`` cursor
+        :param full_table_name: quoted ``schema.table`` name
+        :type full_table_name: str
+        :return: tuple of (row count, row version hash)
+        :rtype: tuple
+        """
+        cursor.execute(
+            f"""
+            SELECT COUNT(*), COALESCE(SUM(hashtext(ctid::text || ':' || xmin::text)), 0)
+            FROM {full_table_name};
+        """
+        )
+        rows, row_hash = cursor.fetchone()
+
+        return int(rows), int(row_hash)
+
+    def _query_cache_put(self, cache_key: str, result: pd.DataFrame, tables: list) -> None:
+        """
+        Save a result to the ``query_cache``. Not every result can be
+        written to Parquet (duplicate column names, UUID objects, mixed
+        types, etc.), so a failure here is reported and otherwise ignored.
+        """
+        try:
+            self.QUERY_CACHE.put(cache_key, result, tables)
+        except Exception as error:
+            self._print(3, f"Could not save the result to the query cache: {error}")
+
+    def invalidate_query_cache(self, tables: list = None) -> int:
+        """
+        Delete cached query results. Results are already ignored once the
+        tables they read from change, and writes made through this object
+        call this for you, so it's only needed to free up disk space or
+        to refresh results that call volatile functions.
+
+        :param tables: ``schema.table`` names to invalidate, defaults to
+                       None which clears the whole cache
+        :type tables: list, optional
+        :return: number of results that were deleted
+        :rtype: int
+        """
+
+        if not self.QUERY_CACHE:
+            return 0
+
+        return self.QUERY_CACHE.invalidate(tables)
+
+    def _geo_query(self, query: str, geom_col: str, geometry_codec: str) -> str:
+        """
+        Wrap a query so that its geometry column comes back in the
+        format of the requested codec. PostGIS already sends geometry
+        as hex EWKB, so the ``"wkb"`` codec leaves the query alone.
+
+        :param query: any valid SQL query string
+        :type query: str
+        :param geom_col: name of the column that holds the geometry
+        :type geom_col: str
+        :param geometry_codec: one of ``GEOMETRY_CODECS``
+        :type geometry_codec: str
+        :return: SQL query
+        :rtype: str
+        """
+        if geometry_codec not in GEOMETRY_CODECS:
+            raise ValueError(f"geometry_codec must be one of: {GEOMETRY_CODECS}")
+
+        if geometry_codec == "wkb":
+            return query
+
+        select_list = []
+        for col in self._query_columns(query):
+            col = quote_identifier(col)
+            if col == quote_identifier(geom_col):
+                select_list.append(f"ST_AsEWKT(_q.{col}) AS {col}")
+            else:
+                select_list.append(f"_q.{col}")
+
+        return f"SELECT {', '.join(select_list)} FROM ({self._as_subquery(query)}) AS _q"
+
+    @staticmethod
+    def _as_subquery(query: str) -> str:
+        """ Strip trailing whitespace and semicolons so a query can be nested.
+        The query ends on a new line so a trailing ``-- comment``
+        can't swallow whatever is written after it. """
+        return query.strip().rstrip(";").strip() + "\n"
+
+    def _query_columns(self, query: str, super_uri: bool = False) -> list:
+        """
+        Get the column names a query would return, without running it.
+
+        :param query: any valid SQL query string
+        :type query: str
+        :param super_uri: flag that will execute against the
+                          super db/user, defaults to False
+        :type super_uri: bool, optional
+        :return: list of column names
+        :rtype: list
+        """
+        sql_no_rows = f"SELECT * FROM ({self._as_subquery(query)}) AS _q LIMIT 0"
+
+        with self.connection(super_uri=super_uri) as connection:
+            cursor = connection.cursor()
+            cursor.execute(sql_no_rows)
+            column_names = [c[0] for c in cursor.description]
+            cursor.close()
+
+        return column_names
+
     def query_as_single_item(self, query: str, super_uri: bool = False):
         """
         Query the database and get the result as a SINGLETON.
@@ -340,6 +926,121 @@ class PostgreSQL:
 
         return result[0][0]
 
+    # STREAM query results in chunks
+    # ------------------------------
+
+    def _query_in_chunks(self, query: str, itersize: int, super_uri: bool = False):
+        """
+        Run a query with a named (server-side) cursor and yield
+        ``(column_names, rows)`` for every ``itersize`` rows.
+        Only one chunk of the result is held in memory at a time.
+        """
+        self._print(1, "... querying in chunks ...")
+        code_w_highlight = RichSyntax(query, "sql", theme="monokai", line_numbers=True)
+        self._print(1, code_w_highlight)
+
+        with self.connection(super_uri=super_uri) as connection:
+            cursor = connection.cursor(name=f"pgis_{uuid.uuid4().hex}")
+            cursor.itersize = itersize
+
+            cursor.execute(query)
+
+            while True:
+                rows = cursor.fetchmany(itersize)
+                if not rows:
+                    break
+
+                # Named cursors only have a description after the first fetch
+                column_names = [c[0] for c in cursor.description]
+
+                yield column_names, rows
+
+            cursor.close()
+
+    def query_as_df_chunks(
+        self, query: str, itersize: int = 10_000, super_uri: bool = False
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Query the database and iterate over the result as a
+        series of ``pandas.DataFrame`` chunks. Results are streamed
+        from a server-side cursor, so the full result set never
+        has to fit in memory.
+
+            >>> for df in db.query_as_df_chunks("SELECT * FROM big_table"):
+            ...     print(df.shape)
+
+        :param query: any valid SQL query string
+        :type query: str
+        :param itersize: number of rows per chunk, defaults to 10,000
+        :type itersize: int, optional
+        :param super_uri: flag that will execute against the
+                          super db/user, defaults to False
+        :type super_uri: bool, optional
+        :return: iterator of dataframes that share the same dtypes
+        :rtype: Iterator[pd.DataFrame]
+        """
+
+        first_dtypes = None
+
+        for column_names, rows in self._query_in_chunks(query, itersize, super_uri=super_uri):
+            df = pd.DataFrame.from_records(rows, columns=column_names, coerce_float=True)
+
+            if first_dtypes is None:
+                first_dtypes = df.dtypes
+            else:
+                df = conform_dtypes(df, first_dtypes)
+
+            yield df
+
+    def query_as_geo_df_chunks(
+        self,
+        query: str,
+        geom_col: str = "geom",
+        itersize: int = 10_000,
+        geometry_codec: str = "wkb",
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """
+        Query the database and iterate over the result as a
+        series of ``geopandas.GeoDataFrame`` chunks. Results are
+        streamed from a server-side cursor, so the full result set
+        never has to fit in memory.
+
+        The CRS is read from the first chunk and used for every chunk.
+
+        :param query: any valid SQL query string
+        :type query: str
+        :param geom_col: name of the column that holds the geometry,
+                         defaults to 'geom'
+        :type geom_col: str
+        :param itersize: number of rows per chunk, defaults to 10,000
+        :type itersize: int, optional
+        :param geometry_codec: ``"wkb"`` or ``"wkt"``, defaults to "wkb"
+        :type geometry_codec: str, optional
+        :return: iterator of geodataframes
+        :rtype: Iterator[gpd.GeoDataFrame]
+        """
+
+        first_dtypes = None
+        crs = None
+
+        query = self._geo_query(query, geom_col, geometry_codec)
+
+        for column_names, rows in self._query_in_chunks(query, itersize):
+            df = pd.DataFrame.from_records(rows, columns=column_names, coerce_float=True)
+
+            geoms, srid = decode_geometries(df[geom_col], codec=geometry_codec)
+
+            if first_dtypes is None:
+                first_dtypes = df.dtypes.drop(geom_col)
+                if srid:
+                    crs = f"EPSG:{srid}"
+            else:
+                df = conform_dtypes(df, first_dtypes)
+
+            df[geom_col] = geoms
+
+            yield gpd.GeoDataFrame(df, geometry=geom_col, crs=crs)
+
     # EXECUTE queries to make them persistent
     # ---------------------------------------
 
@@ -361,19 +1062,17 @@ class PostgreSQL:
             code_w_highlight = RichSyntax(query, "sql", theme="monokai", line_numbers=True)
             self._print(1, code_w_highlight)
 
-        uri = self.uri(super_uri=autocommit)
+        try:
+            with self.connection(super_uri=autocommit, autocommit=autocommit) as connection:
+                cursor = connection.cursor()
 
-        connection = psycopg2.connect(uri)
-        if autocommit:
-            connection.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                cursor.execute(query)
 
-        cursor = connection.cursor()
-
-        cursor.execute(query)
-
-        cursor.close()
-        connection.commit()
-        connection.close()
+                cursor.close()
+        finally:
+            self.clear_catalog_cache()
+            # Any table could have changed
+            self.invalidate_query_cache()
 
     # DATABASE-level helper functions
     # -------------------------------
@@ -408,6 +1107,7 @@ class PostgreSQL:
 
         return connection_string
 
+    @catalog_cache
     def exists(self) -> bool:
         """
         Does this database exist yet? Returns True or False
@@ -458,22 +1158,59 @@ class PostgreSQL:
             self._print(1, "This database does not exist, nothing to delete!")
         else:
             self._print(3, f"Deleting database: {self.DATABASE} on {self.HOST}")
+
+            # Pooled connections would block the DROP
+            self.close_connections(super_uri=False)
+
             sql_drop_db = f"DROP DATABASE {self.DATABASE};"
             self.execute(sql_drop_db, autocommit=True)
 
     @timer
-    def db_export_pgdump_file(self, output_folder: Path = None) -> Path:
+    def db_export_pgdump_file(
+        self,
+        output_folder: Path = None,
+        dump_format: str = "plain",
+        compression: Union[int, str] = None,
+        jobs: int = 1,
+    ) -> Path:
         """
-        Save this database to a ``.sql`` file.
+        Save this database with ``pg_dump``.
         Requires ``pg_dump`` to be accessible via the command line.
 
+        The default ``"plain"`` format writes a ``.sql`` file. The
+        ``"custom"`` (``.dump``), ``"directory"`` and ``"tar"`` archive
+        formats can be restored in parallel with ``db_load_pgdump_file()``.
+        Only the ``"directory"`` format can be dumped with ``jobs > 1``.
 
-        :param output_folder: Folder path to write .sql file to
+        :param output_folder: Folder path to write the dump to
         :type output_folder: pathlib.Path
-        :return: Filepath to SQL file that was created
-        :rtype: str
+        :param dump_format: one of ``"plain"``, ``"custom"``, ``"directory"``
+                            or ``"tar"``, defaults to "plain"
+        :type dump_format: str, optional
+        :param compression: compression level (0-9) or method, passed to
+                            ``pg_dump --compress``. Plain dumps get a
+                            ``.gz``, ``.lz4`` or ``.zst`` extension to
+                            match. Defaults to None
+        :type compression: Union[int, str], optional
+        :param jobs: number of tables to dump at once, defaults to 1
+        :type jobs: int, optional
+        :return: Filepath (or folder path) of the dump that was created
+        :rtype: Path
         """
 
+        formats = {
+            "plain": ".sql",
+            "custom": ".dump",
+            "directory": "",
+            "tar": ".tar",
+        }
+
+        if dump_format not in formats:
+            raise ValueError(f"dump_format must be one of: {list(formats)}")
+
+        if jobs > 1 and dump_format != "directory":
+            raise ValueError("pg_dump can only use jobs > 1 with dump_format='directory'")
+
         if not output_folder:
             output_folder = self.DATA_OUTBOX
 
@@ -483,28 +1220,57 @@ class PostgreSQL:
         today = rightnow.split(" ")[0].replace("-", "_")
         timestamp = rightnow.split(" ")[1].replace(":", "_").split(".")[0]
 
+        extension = formats[dump_format]
+        if dump_format == "plain":
+            extension += pgdump_compression_extension(compression)
+
         # Use pg_dump to save the database to disk
-        sql_name = f"{self.DATABASE}_d_{today}_t_{timestamp}.sql"
+        sql_name = f"{self.DATABASE}_d_{today}_t_{timestamp}{extension}"
         sql_file = output_folder / sql_name
 
         self._print(2, f"Exporting {self.DATABASE} to {sql_file}")
 
-        system_call = f'pg_dump {self.uri()} > "{sql_file}" '
-        os.system(system_call)
+        cmd = [
+            "pg_dump",
+            "--dbname",
+            self.uri(),
+            "--format",
+            dump_format,
+            "--file",
+            str(sql_file),
+        ]
+
+        if compression is not None:
+            cmd += ["--compress", str(compression)]
+
+        if jobs > 1:
+            cmd += ["--jobs", str(jobs)]
+
+        subprocess.run(cmd, check=True)
 
         return sql_file
 
     @timer
-    def db_load_pgdump_file(self, sql_dump_filepath: Path, overwrite: bool = True) -> None:
+    def db_load_pgdump_file(
+        self, sql_dump_filepath: Path, overwrite: bool = True, jobs: int = 1
+    ) -> None:
         """
-        Populate the database by loading from a SQL file that
+        Populate the database by loading from a file (or folder) that
         was previously created by ``pg_dump``.
 
-        :param sql_dump_filepath: filepath to the ``.sql`` dump file
+        The format is detected automatically. Plain SQL files are loaded
+        with ``psql``, and can be compressed with gzip, or with lz4 or zstd
+        if those command line tools are installed. Custom, directory and
+        tar archives are loaded with ``pg_restore``, using ``jobs`` parallel
+        workers for the custom and directory formats.
+
+        :param sql_dump_filepath: filepath to the dump file or folder
         :type sql_dump_filepath: Union[Path, str]
         :param overwrite: flag that controls whether or not this
                           function will replace the existing database
         :type overwrite: bool
+        :param jobs: number of parallel ``pg_restore`` workers, defaults to 1
+        :type jobs: int, optional
         """
 
         if self.exists():
@@ -518,27 +1284,321 @@ class PostgreSQL:
                 )
                 return
 
-        self._print(2, f"Loading {self.DATABASE} from {sql_dump_filepath}")
+        dump_format = detect_pgdump_format(sql_dump_filepath)
 
-        system_command = f'psql "{self.uri()}" <  "{sql_dump_filepath}"'
-        os.system(system_command)
+        self._print(2, f"Loading {self.DATABASE} from {sql_dump_filepath} ({dump_format})")
 
-    # LISTS of things inside this database (or the cluster at large)
-    # --------------------------------------------------------------
+        if dump_format == "plain":
+            cmd = ["psql", self.uri(), "--quiet", "--file", str(sql_dump_filepath)]
+            returncode = subprocess.run(cmd).returncode
 
-    def all_tables_as_list(self, schema: str = None) -> list:
-        """
-        Get a list of all tables in the database.
-        Optionally filter to a schema
+        elif dump_format == "plain-gzip":
+            cmd = ["psql", self.uri(), "--quiet"]
+            with subprocess.Popen(cmd, stdin=subprocess.PIPE) as psql:
+                with gzip.open(sql_dump_filepath, "rb") as sql_file:
+                    shutil.copyfileobj(sql_file, psql.stdin)
+                psql.stdin.close()
+            returncode = psql.returncode
 
-        :param schema: name of the schema to filter by
-        :type schema: str
-        :return: List of tables in the database
-        :rtype: list
-        """
+        elif dump_format in ["plain-lz4", "plain-zstd"]:
+            decompress = "lz4" if dump_format == "plain-lz4" else "zstd"
+            cmd = ["psql", self.uri(), "--quiet"]
+            with subprocess.Popen(
+                [decompress, "-dc", str(sql_dump_filepath)], stdout=subprocess.PIPE
+            ) as source:
+                returncode = subprocess.run(cmd, stdin=source.stdout).returncode
+                source.stdout.close()
 
-        sql_all_tables = """
-            SELECT table_name
+        else:
+            cmd = ["pg_restore", "--dbname", self.uri()]
+
+            # pg_restore can't run tar archives in parallel
+            if jobs > 1 and dump_format != "tar":
+                cmd += ["--jobs", str(jobs)]
+
+            cmd.append(str(sql_dump_filepath))
+            returncode = subprocess.run(cmd).returncode
+
+        self.clear_catalog_cache()
+        self.invalidate_query_cache()
+
+        # Objects that db_create() already made (like PostGIS) will
+        # show up as errors, so report a failure without raising
+        if returncode != 0:
+            self._print(3, f"{cmd[0]} exited with code {returncode} - check the output above")
+
+    def _table_fingerprints(self, previous: dict = None) -> dict:
+        """
+        Describe the current state of every user table so that
+        ``db_export_incremental_backup()`` can tell which ones changed.
+
+        Each fingerprint has a cheap ``"marker"`` and the ``"contents"``
+        that decide whether a table changed. The marker is the table's
+        ``relfilenode``, its columns and its ``pg_stat`` insert, update
+        and delete counters, all read from the catalog. Only tables
+        whose marker differs from the one in ``previous`` are read in
+        full, to hash their row versions with ``_row_versions()``. The
+        rest keep their previous contents. On a mostly static database,
+        most runs then only touch the catalog.
+
+        The counters are flushed in the background, so a write that
+        commits just before a backup can be missed. It is picked up by
+        the next backup, once the counters have moved. A stats reset
+        moves every marker, which only costs a rehash. Tables owned by
+        an extension are skipped.
+
+        :param previous: fingerprints from the last backup, defaults to
+                         None which reads every table
+        :type previous: dict, optional
+        :return: ``{"schema.table": {"marker": [...], "contents": [...]}}``
+        :rtype: dict
+        """
+
+        sql_tables = """
+            SELECT
+                n.nspname,
+                c.relname,
+                c.relfilenode,
+                md5(string_agg(
+                    a.attname || ' ' || format_type(a.atttypid, a.atttypmod),
+                    ',' ORDER BY a.attnum
+                )) AS columns,
+                COALESCE(s.n_tup_ins, 0),
+                COALESCE(s.n_tup_upd, 0),
+                COALESCE(s.n_tup_del, 0)
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            JOIN pg_attribute a
+                ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+            LEFT JOIN pg_stat_all_tables s ON s.relid = c.oid
+            WHERE c.relkind IN ('r', 'p', 'm')
+                AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+                AND n.nspname NOT LIKE 'pg_toast%'
+                AND NOT EXISTS (
+                    SELECT 1 FROM pg_depend d
+                    WHERE d.objid = c.oid AND d.deptype = 'e'
+                )
+            GROUP BY n.nspname, c.relname, c.relfilenode, s.n_tup_ins, s.n_tup_upd, s.n_tup_del;
+        """
+
+        previous = previous or {}
+        fingerprints = {}
+        hashed = 0
+
+        with self.connection() as connection:
+            cursor = connection.cursor()
+
+            # One snapshot for every table
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY;")
+
+            cursor.execute(sql_tables)
+
+            for schema, table, filenode, columns, *counters in cursor.fetchall():
+                name = f"{schema}.{table}"
+                marker = [filenode, columns, *[int(c) for c in counters]]
+
+                # Manifests written before markers existed hold plain lists
+                last = previous.get(name)
+                if isinstance(last, dict) and last.get("marker") == marker:
+                    fingerprints[name] = last
+                    continue
+
+                full_table_name = f"{quote_identifier(schema)}.{quote_identifier(table)}"
+                rows, row_hash = self._row_versions(cursor, full_table_name)
+                hashed += 1
+
+                fingerprints[name] = {
+                    "marker": marker,
+                    "contents": [filenode, columns, rows, row_hash],
+                }
+
+            cursor.close()
+
+        self._print(1, f"Read the rows of {hashed} of {len(fingerprints)} tables")
+
+        return fingerprints
+
+    @timer
+    def db_export_incremental_backup(
+        self, output_folder: Path = None, full: bool = False, compression: Union[int, str] = None
+    ) -> Path:
+        """
+        Back the database up, only dumping the tables that changed
+        since the last backup.
+
+        Backups go into a ``{database}_incremental`` folder with a
+        ``manifest.json`` that lists the chain of dumps and the
+        fingerprint of every table. The first run (or ``full=True``)
+        writes a full ``pg_dump`` "base". Later runs write a "delta"
+        that only holds the tables that were added or modified, and
+        record any tables that were dropped.
+
+        To find the changes, a delta reads the catalog and then reads
+        every row of each table whose ``pg_stat`` counters moved (see
+        ``_table_fingerprints()``). A base reads every table. A write
+        made a moment before a delta can end up in the next one.
+
+        Changes to objects that aren't tables (views, functions, etc.)
+        are only captured by a full backup.
+
+        :param output_folder: folder where the backup folder lives,
+                              defaults to ``self.DATA_OUTBOX``
+        :type output_folder: Path, optional
+        :param full: flag to force a new base backup, defaults to False
+        :type full: bool, optional
+        :param compression: passed to ``pg_dump --compress``, defaults to None
+        :type compression: Union[int, str], optional
+        :return: path to the dump that was written, or None if nothing changed
+        :rtype: Path
+        """
+
+        if not output_folder:
+            output_folder = self.DATA_OUTBOX
+
+        backup_folder = Path(output_folder) / f"{self.DATABASE}_incremental"
+        backup_folder.mkdir(parents=True, exist_ok=True)
+
+        manifest_path = backup_folder / "manifest.json"
+
+        if manifest_path.exists() and not full:
+            with open(manifest_path) as open_file:
+                manifest = json.load(open_file)
+        else:
+            manifest = {"database": self.DATABASE, "backups": [], "fingerprints": {}}
+
+        # Fingerprint before dumping, so anything that changes
+        # while pg_dump runs gets picked up next time
+        previous = manifest["fingerprints"]
+        fingerprints = self._table_fingerprints(previous)
+
+        def contents(fingerprint):
+            return fingerprint.get("contents") if isinstance(fingerprint, dict) else None
+
+        changed = [
+            t for t, fp in fingerprints.items() if contents(previous.get(t)) != contents(fp)
+        ]
+        dropped = [t for t in previous if t not in fingerprints]
+
+        kind = "delta" if manifest["backups"] else "base"
+
+        if kind == "delta" and not changed and not dropped:
+            self._print(2, f"No tables changed in {self.DATABASE} since the last backup")
+            return None
+
+        timestamp = str(now()).split(".")[0].replace("-", "_").replace(":", "_")
+        timestamp = timestamp.replace(" ", "_t_")
+        dump_file = backup_folder / f"{kind}_d_{timestamp}.dump"
+
+        cmd = ["pg_dump", "--dbname", self.uri(), "--format", "custom", "--file", str(dump_file)]
+
+        if compression is not None:
+            cmd += ["--compress", str(compression)]
+
+        if kind == "delta":
+            for table in changed:
+                schema, table_name = table.split(".", 1)
+                cmd += ["--table", f'"{schema}"."{table_name}"']
+
+        self._print(
+            2,
+            f"Writing {kind} backup of {self.DATABASE} with {len(changed)} changed "
+            + f"and {len(dropped)} dropped tables to {dump_file}",
+        )
+
+        if kind == "base" or changed:
+            subprocess.run(cmd, check=True)
+        else:
+            dump_file = None
+
+        manifest["backups"].append(
+            {
+                "kind": kind,
+                "file": dump_file.name if dump_file else None,
+                "created": str(now()),
+                "tables": changed if kind == "delta" else list(fingerprints),
+                "dropped": dropped,
+            }
+        )
+        manifest["fingerprints"] = fingerprints
+
+        # Write the manifest last, so a failed dump leaves the old one intact
+        with open(manifest_path, "w") as open_file:
+            json.dump(manifest, open_file, indent=2)
+
+        return dump_file
+
+    @timer
+    def db_load_incremental_backup(
+        self, backup_folder: Path, overwrite: bool = True, jobs: int = 1
+    ) -> None:
+        """
+        Rebuild the database from a folder written by
+        ``db_export_incremental_backup()``.
+
+        The base backup is loaded first. Each delta is then restored
+        in order with ``pg_restore --clean``, which replaces the tables
+        it holds, and tables that were dropped along the way are removed.
+
+        :param backup_folder: folder that holds ``manifest.json``
+        :type backup_folder: Path
+        :param overwrite: flag that controls whether or not this
+                          function will replace the existing database
+        :type overwrite: bool
+        :param jobs: number of parallel ``pg_restore`` workers, defaults to 1
+        :type jobs: int, optional
+        """
+
+        backup_folder = Path(backup_folder)
+
+        with open(backup_folder / "manifest.json") as open_file:
+            manifest = json.load(open_file)
+
+        base, *deltas = manifest["backups"]
+
+        if self.exists() and not overwrite:
+            self._print(3, f"Database named {self.DATABASE} already exists and overwrite=False!")
+            return
+
+        self.db_load_pgdump_file(backup_folder / base["file"], overwrite=True, jobs=jobs)
+
+        for delta in deltas:
+            if delta["file"]:
+                self._print(2, f"Applying {delta['file']}")
+
+                cmd = ["pg_restore", "--dbname", self.uri(), "--clean", "--if-exists"]
+                if jobs > 1:
+                    cmd += ["--jobs", str(jobs)]
+                cmd.append(str(backup_folder / delta["file"]))
+
+                returncode = subprocess.run(cmd).returncode
+                self.clear_catalog_cache()
+                self.invalidate_query_cache()
+
+                if returncode != 0:
+                    msg = f"pg_restore exited with code {returncode} - check the output above"
+                    self._print(3, msg)
+
+            for table in delta["dropped"]:
+                schema, table_name = table.split(".", 1)
+                self.execute(f'DROP TABLE IF EXISTS "{schema}"."{table_name}" CASCADE;')
+
+    # LISTS of things inside this database (or the cluster at large)
+    # --------------------------------------------------------------
+
+    @catalog_cache
+    def all_tables_as_list(self, schema: str = None) -> list:
+        """
+        Get a list of all tables in the database.
+        Optionally filter to a schema
+
+        :param schema: name of the schema to filter by
+        :type schema: str
+        :return: List of tables in the database
+        :rtype: list
+        """
+
+        sql_all_tables = """
+            SELECT table_name
             FROM information_schema.tables
         """
 
@@ -551,6 +1611,7 @@ class PostgreSQL:
 
         return [t[0] for t in tables]
 
+    @catalog_cache
     def all_spatial_tables_as_dict(self, schema: str = None) -> dict:
         """
         Get a dictionary of all spatial tables in the database.
@@ -575,6 +1636,7 @@ class PostgreSQL:
 
         return {t[0]: t[1] for t in spatial_tables}
 
+    @catalog_cache
     def all_databases_on_cluster_as_list(self) -> list:
         """
         Get a list of all databases on this SQL cluster.
@@ -594,9 +1656,23 @@ class PostgreSQL:
 
         return [d[0] for d in database_list]
 
+    @catalog_cache
+    def postgis_version(self) -> tuple:
+        """
+        Get the version of PostGIS installed in this database.
+
+        :return: version numbers, like ``(3, 1, 4)``
+        :rtype: tuple
+        """
+
+        version = self.query_as_single_item("SELECT postgis_lib_version();")
+
+        return tuple(int(n) for n in re.findall(r"\d+", version)[:3])
+
     # TABLE-level helper functions
     # ----------------------------
 
+    @catalog_cache
     def table_columns_as_list(self, table_name: str, schema: str = None) -> list:
         """
         Get a list of all columns in a table.
@@ -679,6 +1755,36 @@ class PostgreSQL:
         """
         self.execute(sql_unique_id_column)
 
+    def _table_add_uid_sequence(
+        self, table_name: str, schema: str = None, uid_col: str = "uid"
+    ) -> None:
+        """
+        Give an existing integer ``uid_col`` the same sequence-backed
+        default that ``table_add_uid_column()`` would, without
+        rewriting the table.
+
+        :param table_name: Name of the table
+        :type table_name: str
+        """
+
+        if not schema:
+            schema = self.ACTIVE_SCHEMA
+
+        sequence = f"{schema}.{table_name}_{uid_col}_seq"
+
+        sql_uid_sequence = f"""
+            CREATE SEQUENCE {sequence} OWNED BY {schema}.{table_name}.{uid_col};
+            ALTER TABLE {schema}.{table_name}
+                ALTER COLUMN {uid_col} SET DEFAULT nextval('{sequence}'),
+                ALTER COLUMN {uid_col} SET NOT NULL;
+            SELECT setval(
+                '{sequence}',
+                COALESCE((SELECT MAX({uid_col}) FROM {schema}.{table_name}), 0) + 1,
+                false
+            );
+        """
+        self.execute(sql_uid_sequence)
+
     def table_add_spatial_index(self, table_name: str, schema: str = None) -> None:
         """
         Add a spatial index to the 'geom' column in the table.
@@ -705,13 +1811,27 @@ class PostgreSQL:
         new_epsg: Union[int, str],
         geom_type: str,
         schema: str = None,
+        batch_size: int = None,
     ) -> None:
         """
         Transform spatial data from one EPSG into another EPSG.
 
-        This can also be used with the same old and new EPSG. This
-        is useful when making a new geotable, as this SQL code
-        will update the table's entry in the ``geometry_columns`` table.
+        This can also be used with the same old and new EPSG to register
+        a column in the ``geometry_columns`` table. Nothing is rewritten
+        if the column is already declared with that type and EPSG.
+
+        By default the column is transformed with a single
+        ``ALTER COLUMN ... TYPE``. With ``batch_size``, the transformed
+        geometry is written into a new column ``batch_size`` rows at a
+        time, each in its own transaction, and then swapped in for
+        ``geom`` with the spatial index built once at the end.
+        The ``geom`` column moves to the end of the table in that case.
+
+        Every batch leaves the old version of its rows behind, so the
+        table takes up about twice its size until it's vacuumed. A plain
+        ``VACUUM`` runs at the end, which makes that space reusable but
+        doesn't hand it back to the operating system. Run
+        ``VACUUM FULL`` afterwards if you need the disk space back.
 
         :param table_name: name of the table
         :type table_name: str
@@ -722,20 +1842,87 @@ class PostgreSQL:
         :param geom_type: PostGIS-valid name of the
                           geometry you're transforming
         :type geom_type: str
+        :param batch_size: rows to transform per transaction, defaults to None
+        :type batch_size: int, optional
         """
 
         if not schema:
             schema = self.ACTIVE_SCHEMA
 
-        msg = f"Reprojecting {schema}.{table_name} from {old_epsg} to {new_epsg}"
-        self._print(1, msg)
+        full_table_name = f"{schema}.{table_name}"
+        geom_type = geom_type.upper()
 
-        sql_transform_geom = f"""
-            ALTER TABLE {schema}.{table_name}
-            ALTER COLUMN geom TYPE geometry({geom_type}, {new_epsg})
-            USING ST_Transform( ST_SetSRID( geom, {old_epsg} ), {new_epsg} );
+        sql_current = f"""
+            SELECT UPPER(type), srid FROM geometry_columns
+            WHERE f_table_schema = '{schema}'
+                AND f_table_name = '{table_name}'
+                AND f_geometry_column = 'geom';
         """
-        self.execute(sql_transform_geom)
+        current = self.query_as_list(sql_current)
+
+        if current and tuple(current[0]) == (geom_type, int(new_epsg)):
+            if int(old_epsg) == int(new_epsg):
+                self._print(1, f"{full_table_name} is already {geom_type} in {new_epsg}")
+                return
+
+        msg = f"Reprojecting {full_table_name} from {old_epsg} to {new_epsg}"
+        self._print(1, msg)
+
+        if int(old_epsg) == int(new_epsg):
+            sql_new_geom = f"ST_SetSRID(geom, {new_epsg})"
+        else:
+            sql_new_geom = f"ST_Transform( ST_SetSRID( geom, {old_epsg} ), {new_epsg} )"
+
+        if not batch_size:
+            sql_transform_geom = f"""
+                ALTER TABLE {full_table_name}
+                ALTER COLUMN geom TYPE geometry({geom_type}, {new_epsg})
+                USING {sql_new_geom};
+            """
+            self.execute(sql_transform_geom)
+            return
+
+        temp_col = "geom_reprojected"
+
+        self.execute(
+            f"""
+            ALTER TABLE {full_table_name} DROP COLUMN IF EXISTS {temp_col};
+            ALTER TABLE {full_table_name} ADD COLUMN {temp_col} geometry({geom_type}, {new_epsg});
+            """
+        )
+
+        rows = self.query_as_single_item(f"SELECT COUNT(*) FROM {full_table_name};")
+        pages = self.query_as_single_item(
+            f"SELECT pg_relation_size('{full_table_name}') / current_setting('block_size')::int;"
+        )
+
+        conditions = ctid_conditions(pages, math.ceil(rows / batch_size))
+
+        # Updated rows can land in pages that haven't been visited yet,
+        # so skip anything that's already been transformed
+        for i, condition in enumerate(conditions, start=1):
+            self._print(1, f"Reprojecting batch {i} of {len(conditions)}")
+
+            where = f"{temp_col} IS NULL AND geom IS NOT NULL"
+            if condition:
+                where += f" AND {condition}"
+
+            self.execute(f"UPDATE {full_table_name} SET {temp_col} = {sql_new_geom} WHERE {where};")
+
+        # Dropping the old column also drops its spatial index
+        self.execute(
+            f"""
+            ALTER TABLE {full_table_name} DROP COLUMN geom;
+            ALTER TABLE {full_table_name} RENAME COLUMN {temp_col} TO geom;
+            CREATE INDEX ON {full_table_name} USING GIST (geom);
+            """
+        )
+
+        # VACUUM can't run inside a transaction block
+        with self.connection(autocommit=True) as connection:
+            cursor = connection.cursor()
+            cursor.execute(f"VACUUM (ANALYZE) {full_table_name};")
+            cursor.close()
 
     def table_delete(self, table_name: str, schema: str = None) -> None:
         """
@@ -764,7 +1951,40 @@ class PostgreSQL:
         if_exists: str = "replace",
         new_table: str = None,
         schema: str = None,
-    ) -> gpd.GeoDataFrame:
+        in_database: bool = False,
+        chunk_size: int = None,
+    ) -> None:
+        """
+        Make a new point table out of a table with X/Y coordinate columns.
+
+        By default the whole table is pulled into ``geopandas`` and
+        imported back. Use ``in_database=True`` to build the points with
+        ``ST_MakePoint()`` in a single ``CREATE TABLE AS``, without any
+        data leaving the database. Use ``chunk_size`` to stream the table
+        through the client ``chunk_size`` rows at a time, encoding the
+        points straight from the coordinate arrays.
+
+        :param src_table: name of the table with coordinate columns
+        :type src_table: str
+        :param x_lon_col: name of the X / longitude column
+        :type x_lon_col: str
+        :param y_lat_col: name of the Y / latitude column
+        :type y_lat_col: str
+        :param epsg: EPSG code of the coordinates
+        :type epsg: int
+        :param if_exists: one of ``"fail"``, ``"replace"``, or ``"append"``,
+                          defaults to "replace"
+        :type if_exists: str, optional
+        :param new_table: name of the new table, defaults to ``{src_table}_spatial``
+        :type new_table: str, optional
+        :param schema: schema of both tables, defaults to the active schema
+        :type schema: str, optional
+        :param in_database: flag to do all of the work in SQL, defaults to False
+        :type in_database: bool, optional
+        :param chunk_size: rows per chunk in the client, defaults to None
+                           which loads the whole table at once
+        :type chunk_size: int, optional
+        """
 
         if not schema:
             schema = self.ACTIVE_SCHEMA
@@ -772,14 +1992,85 @@ class PostgreSQL:
         if not new_table:
             new_table = f"{src_table}_spatial"
 
-        df = self.query_as_df(f"SELECT * FROM {schema}.{src_table};")
+        if if_exists not in ["fail", "replace", "append"]:
+            raise ValueError(f"'{if_exists}' is not valid for if_exists")
+
+        if in_database:
+            self._spatialize_points_in_database(
+                src_table, x_lon_col, y_lat_col, epsg, if_exists, new_table, schema
+            )
+
+        elif chunk_size:
+            query = f"SELECT * FROM {schema}.{src_table}"
+
+            def point_chunks():
+                for df in self.query_as_df_chunks(query, itersize=chunk_size):
+                    x, y = xy_arrays(df, x_lon_col, y_lat_col)
+                    yield df.assign(geom=points_to_hex_ewkb(x, y, epsg))
 
-        gdf = spatialize_point_dataframe(df, x_lon_col=x_lon_col, y_lat_col=y_lat_col, epsg=epsg)
+            self._copy_chunks(
+                point_chunks(),
+                new_table,
+                schema,
+                if_exists=if_exists,
+                column_types={"geom": f"geometry(POINT, {epsg})"},
+            )
+
+            if if_exists != "append":
+                self.table_add_uid_column(new_table, schema=schema)
+                self.table_add_spatial_index(new_table, schema=schema)
+
+        else:
+            df = self.query_as_df(f"SELECT * FROM {schema}.{src_table};")
 
-        self.import_geodataframe(gdf, new_table, if_exists=if_exists)
+            gdf = spatialize_point_dataframe(
+                df, x_lon_col=x_lon_col, y_lat_col=y_lat_col, epsg=epsg
+            )
+
+            self.import_geodataframe(gdf, new_table, if_exists=if_exists, schema=schema)
 
         self._print(2, f"Spatialized points from {src_table} into {new_table}")
 
+    def _spatialize_points_in_database(
+        self,
+        src_table: str,
+        x_lon_col: str,
+        y_lat_col: str,
+        epsg: int,
+        if_exists: str,
+        new_table: str,
+        schema: str,
+    ) -> None:
+        """
+        Build the points for ``table_spatialize_points(in_database=True)``
+        """
+
+        columns = self.table_columns_as_list(src_table, schema=schema)
+        columns = [c for c in columns if c not in ["uid", "geom"]]
+        column_list = ", ".join(quote_identifier(c) for c in columns)
+
+        sql_points = f"""
+            SELECT
+                {column_list},
+                ST_SetSRID(
+                    ST_MakePoint({x_lon_col}::float8, {y_lat_col}::float8),
+                    {epsg}
+                ) AS geom
+            FROM {schema}.{src_table}
+        """
+
+        table_exists = new_table in self.all_tables_as_list(schema=schema)
+
+        if table_exists and if_exists == "fail":
+            raise ValueError(f"Table '{new_table}' already exists.")
+
+        if table_exists and if_exists == "append":
+            self.execute(
+                f"INSERT INTO {schema}.{new_table} ({column_list}, geom) {sql_points};"
+            )
+        else:
+            self.make_geotable_from_query(sql_points, new_table, "POINT", epsg, schema=schema)
+
     # IMPORT data into the database
     # -----------------------------
 
@@ -789,6 +2080,7 @@ class PostgreSQL:
         table_name: str,
         if_exists: str = "fail",
         schema: str = None,
+        use_copy: bool = True,
     ) -> None:
         """
         Import an in-memory ``pandas.DataFrame`` to the SQL database.
@@ -802,6 +2094,9 @@ class PostgreSQL:
         :param if_exists: pandas argument to handle overwriting data,
                           defaults to "fail"
         :type if_exists: str, optional
+        :param use_copy: flag to load the data with ``COPY`` instead of
+                         ``DataFrame.to_sql()``, defaults to True
+        :type use_copy: bool, optional
         """
 
         if not schema:
@@ -809,6 +2104,35 @@ class PostgreSQL:
 
         self._print(2, f"Importing dataframe to: {schema}.{table_name}")
 
+        self._sanitize_column_names(dataframe)
+
+        # Write to database after making sure schema exists
+        self.add_schema(schema)
+
+        if use_copy:
+            self._copy_dataframe(
+                dataframe,
+                table_name,
+                schema=schema,
+                if_exists=if_exists,
+                index_label=dataframe.index.name or "index",
+            )
+        else:
+            engine = self._engine()
+            dataframe.to_sql(table_name, engine, if_exists=if_exists, schema=schema)
+            self.clear_catalog_cache()
+            self.invalidate_query_cache([f"{schema}.{table_name}"])
+
+    @staticmethod
+    def _sanitize_column_names(dataframe: pd.DataFrame) -> None:
+        """
+        Enforce clean column names (without spaces, caps, or weird symbols).
+        The dataframe's columns are renamed in place.
+
+        :param dataframe: dataframe to clean up
+        :type dataframe: pd.DataFrame
+        """
+
         # Replace "Column Name" with "column_name"
         dataframe.columns = dataframe.columns.str.replace(" ", "_")
         dataframe.columns = [x.lower() for x in dataframe.columns]
@@ -818,101 +2142,431 @@ class PostgreSQL:
         for s in [".", "-", "(", ")", "+"]:
             dataframe.columns = dataframe.columns.str.replace(s, "")
 
-        # Write to database after making sure schema exists
-        self.add_schema(schema)
-
-        engine = sqlalchemy.create_engine(self.uri())
-        dataframe.to_sql(table_name, engine, if_exists=if_exists, schema=schema)
-        engine.dispose()
-
-    def import_geodataframe(
+    def _copy_dataframe(
         self,
-        gdf: gpd.GeoDataFrame,
+        dataframe: pd.DataFrame,
         table_name: str,
-        src_epsg: Union[int, bool] = False,
-        if_exists: str = "replace",
-        schema: str = None,
-        uid_col: str = "uid",
-    ):
+        schema: str,
+        if_exists: str = "fail",
+        index_label: str = None,
+        rename: dict = None,
+        converters: dict = None,
+        column_types: dict = None,
+        chunk_size: int = COPY_CHUNK_SIZE,
+        unlogged: bool = False,
+    ) -> int:
         """
-        Import an in-memory ``geopandas.GeoDataFrame`` to the SQL database.
+        Write a dataframe to SQL with ``COPY ... FROM STDIN``.
+        The table is created from the inferred column types if needed,
+        and the whole load happens inside a single transaction.
 
-        :param gdf: geodataframe with data you want to save
-        :type gdf: gpd.GeoDataFrame
-        :param table_name: name of the table that will get created
+        :param dataframe: data to write
+        :type dataframe: pd.DataFrame
+        :param table_name: name of the table to write to
         :type table_name: str
-        :param src_epsg: The source EPSG code can be passed as an integer.
-                         By default this function will try to read the EPSG
-                         code directly, but some spatial data is funky and
-                         requires that you explicitly declare its projection.
-                         Defaults to False
-        :type src_epsg: Union[int, bool], optional
-        :param if_exists: pandas argument to handle overwriting data,
-                          defaults to "replace"
+        :param schema: name of the schema
+        :type schema: str
+        :param if_exists: one of ``"fail"``, ``"replace"``, or ``"append"``,
+                          defaults to "fail"
         :type if_exists: str, optional
+        :param index_label: name for the index column, defaults to None
+                            which leaves the index out of the table
+        :type index_label: str, optional
+        :param rename: ``{old: new}`` column names, defaults to None
+        :type rename: dict, optional
+        :param converters: ``{column: function}`` applied to each chunk
+                           before it gets written, defaults to None
+        :type converters: dict, optional
+        :param column_types: ``{column: sql_type}`` to use instead of
+                             the inferred types, defaults to None
+        :type column_types: dict, optional
+        :param chunk_size: rows per COPY chunk, defaults to COPY_CHUNK_SIZE
+        :type chunk_size: int, optional
+        :param unlogged: flag to create the table as ``UNLOGGED``, defaults to False
+        :type unlogged: bool, optional
+        :return: number of rows written
+        :rtype: int
         """
-        if not schema:
-            schema = self.ACTIVE_SCHEMA
 
-        # Read the geometry type. It's possible there are
-        # both MULTIPOLYGONS and POLYGONS. This grabs the MULTI variant
+        chunk_kwargs = {"index_label": index_label, "rename": rename, "converters": converters}
 
-        geom_types = list(gdf.geometry.geom_type.unique())
-        geom_typ = max(geom_types, key=len).upper()
+        # Infer the column types from a small sample of the data
+        sample = dataframe.iloc[:TYPE_INFERENCE_SAMPLE_SIZE]
+        sample = next(dataframe_chunks(sample, **chunk_kwargs))
 
-        self._print(2, f"Importing {geom_typ} geodataframe to: {schema}.{table_name}")
+        chunks = dataframe_chunks(dataframe, chunk_size=chunk_size, **chunk_kwargs)
 
-        # Manually set the EPSG if the user passes one
-        if src_epsg:
-            gdf.crs = f"epsg:{src_epsg}"
-            epsg_code = src_epsg
+        return self._copy_chunks(
+            chunks,
+            table_name,
+            schema,
+            if_exists=if_exists,
+            sample=sample,
+            column_types=column_types,
+            unlogged=unlogged,
+        )
 
-        # Otherwise, try to get the EPSG value directly from the geodataframe
-        else:
-            # Older gdfs have CRS stored as a dict: {'init': 'epsg:4326'}
-            if type(gdf.crs) == dict:
-                epsg_code = int(gdf.crs["init"].split(" ")[0].split(":")[1])
-            # Now geopandas has a different approach
-            else:
-                epsg_code = int(str(gdf.crs).split(":")[1])
+    def _widen_columns(
+        self,
+        cursor,
+        full_table_name: str,
+        chunk: pd.DataFrame,
+        sql_types: dict,
+        column_types: dict = None,
+    ) -> None:
+        """
+        Change the type of any column that can't hold the values of
+        the next chunk, like an ``INTEGER`` column that's about to get
+        ``1.5`` or text. ``sql_types`` is updated in place. Columns with
+        a type given in ``column_types`` are never changed.
+        """
+        for col in chunk.columns:
+            if col in (column_types or {}) or col not in sql_types:
+                continue
 
-        # Sanitize the columns before writing to the database
-        # Make all column names lower case
-        gdf.columns = [x.lower() for x in gdf.columns]
+            # Missing values fit any type
+            if chunk[col].isna().all():
+                continue
 
-        # Replace the 'geom' column with 'geometry'
-        if "geom" in gdf.columns:
-            gdf["geometry"] = gdf["geom"]
-            gdf.drop("geom", 1, inplace=True)
+            wider = widen_type(sql_types[col], postgres_type(chunk[col]))
 
-        # Drop the 'gid' column
-        if "gid" in gdf.columns:
-            gdf.drop("gid", 1, inplace=True)
+            if wider:
+                self._print(2, f"Changing {col} from {sql_types[col]} to {wider} to fit new data")
 
-        # Rename 'uid' to 'old_uid'
-        if uid_col in gdf.columns:
-            gdf[f"old_{uid_col}"] = gdf[uid_col]
-            gdf.drop(uid_col, 1, inplace=True)
+                cursor.execute(
+                    f"""
+                    ALTER TABLE {full_table_name}
+                    ALTER COLUMN {quote_identifier(col)} TYPE {wider}
+                    USING {quote_identifier(col)}::{wider};
+                """
+                )
+                sql_types[col] = wider
+
+    def _copy_chunks(
+        self,
+        chunks,
+        table_name: str,
+        schema: str,
+        if_exists: str = "fail",
+        sample: pd.DataFrame = None,
+        column_types: dict = None,
+        unlogged: bool = False,
+    ) -> int:
+        """
+        Write an iterable of dataframe chunks to SQL with ``COPY``.
+        Each chunk must already have the final column names and values.
+
+        :param chunks: iterable that yields ``pd.DataFrame`` chunks
+        :param table_name: name of the table to write to
+        :type table_name: str
+        :param schema: name of the schema
+        :type schema: str
+        :param if_exists: one of ``"fail"``, ``"replace"``, or ``"append"``,
+                          defaults to "fail"
+        :type if_exists: str, optional
+        :param sample: data used to infer the column types, defaults to
+                       None which uses the first chunk
+        :type sample: pd.DataFrame, optional
+        :param column_types: ``{column: sql_type}`` to use instead of
+                             the inferred types, defaults to None
+        :type column_types: dict, optional
+        :param unlogged: flag to create the table as ``UNLOGGED``, defaults to False
+        :type unlogged: bool, optional
+        :return: number of rows written
+        :rtype: int
+        """
+
+        if if_exists not in ["fail", "replace", "append"]:
+            raise ValueError(f"'{if_exists}' is not valid for if_exists")
+
+        full_table_name = f"{schema}.{table_name}"
+
+        chunks = iter(chunks)
+        first_chunk = next(chunks, None)
+
+        if sample is None:
+            sample = first_chunk
+
+        if sample is None:
+            raise ValueError(f"No data found to import into {full_table_name}")
+
+        sql_types = {col: postgres_type(sample[col]) for col in sample.columns}
+        sql_types.update(column_types or {})
+
+        rows = 0
+        start_time = now()
+
+        # The table gets created (or dropped) in this transaction
+        self.clear_catalog_cache()
+
+        with self.connection() as connection:
+            cursor = connection.cursor()
+
+            cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (full_table_name,))
+            table_exists = cursor.fetchone()[0]
+
+            if table_exists and if_exists == "fail":
+                raise ValueError(f"Table '{table_name}' already exists.")
+
+            if table_exists and if_exists == "replace":
+                cursor.execute(f"DROP TABLE {full_table_name};")
+                table_exists = False
+
+            # Only widen the columns of a table that was made here
+            widen = not table_exists
+
+            if not table_exists:
+                cursor.execute(create_table_sql(full_table_name, sql_types, unlogged=unlogged))
+
+            for chunk in itertools.chain([first_chunk], chunks):
+                if chunk is None:
+                    continue
+
+                if widen:
+                    self._widen_columns(cursor, full_table_name, chunk, sql_types, column_types)
+
+                rows += copy_chunk(cursor, chunk, full_table_name)
+
+                seconds = max((now() - start_time).total_seconds(), 1e-6)
+                msg = f"Copied {rows:,} rows into {full_table_name}"
+                self._print(1, f"{msg} ({rows / seconds:,.0f} rows/sec)")
+
+            cursor.close()
+
+        self.clear_catalog_cache()
+        self.invalidate_query_cache([full_table_name])
+
+        return rows
+
+    def _finish_bulk_load(
+        self,
+        table_name: str,
+        schema: str = None,
+        uid_col: str = "uid",
+        concurrently: bool = False,
+        maintenance_work_mem: str = None,
+    ) -> None:
+        """
+        Turn an ``UNLOGGED`` table that was just bulk-loaded into a
+        regular table: switch it to ``LOGGED``, make ``uid_col`` the
+        primary key, add a spatial index on ``geom`` and ``ANALYZE`` it.
+
+        The switch to ``LOGGED`` happens first, since it rewrites the
+        table along with any indexes that already exist.
+
+        :param table_name: name of the table
+        :type table_name: str
+        :param uid_col: column to use as the primary key, defaults to "uid"
+        :type uid_col: str, optional
+        :param concurrently: flag to build the indexes ``CONCURRENTLY``,
+                             outside of a transaction, defaults to False
+        :type concurrently: bool, optional
+        :param maintenance_work_mem: memory for the index builds, like
+                                     ``"2GB"``, defaults to None
+        :type maintenance_work_mem: str, optional
+        """
+
+        if not schema:
+            schema = self.ACTIVE_SCHEMA
+
+        full_table_name = f"{schema}.{table_name}"
+
+        self._print(1, f"Building indexes on {full_table_name}")
+
+        sql_finish = [f"ALTER TABLE {full_table_name} SET LOGGED;"]
+
+        if concurrently:
+            pkey = f"{table_name}_pkey"
+            sql_finish += [
+                f"CREATE UNIQUE INDEX CONCURRENTLY {pkey} ON {full_table_name} ({uid_col});",
+                f"ALTER TABLE {full_table_name} ADD PRIMARY KEY USING INDEX {pkey};",
+                f"CREATE INDEX CONCURRENTLY ON {full_table_name} USING GIST (geom);",
+            ]
+        else:
+            sql_finish += [
+                f"ALTER TABLE {full_table_name} ADD PRIMARY KEY ({uid_col});",
+                f"CREATE INDEX ON {full_table_name} USING GIST (geom);",
+            ]
+
+        sql_finish.append(f"ANALYZE {full_table_name};")
+
+        # CONCURRENTLY can't run inside a transaction, so use a session
+        # setting there and reset it before the connection goes back
+        with self.connection(autocommit=concurrently) as connection:
+            cursor = connection.cursor()
+
+            try:
+                if maintenance_work_mem:
+                    scope = "SESSION" if concurrently else "LOCAL"
+                    cursor.execute(
+                        f"SET {scope} maintenance_work_mem = %s;", (maintenance_work_mem,)
+                    )
+
+                for statement in sql_finish:
+                    cursor.execute(statement)
+
+            finally:
+                if maintenance_work_mem and concurrently:
+                    cursor.execute("RESET maintenance_work_mem;")
+                cursor.close()
+
+        self.clear_catalog_cache()
 
-        # Build a 'geom' column using geoalchemy2
-        # and drop the source 'geometry' column
-        gdf["geom"] = gdf["geometry"].apply(lambda x: WKTElement(x.wkt, srid=epsg_code))
-        gdf.drop("geometry", 1, inplace=True)
+    def import_geodataframe(
+        self,
+        gdf: gpd.GeoDataFrame,
+        table_name: str,
+        src_epsg: Union[int, bool] = False,
+        if_exists: str = "replace",
+        schema: str = None,
+        uid_col: str = "uid",
+        use_copy: bool = True,
+        geometry_codec: str = "wkb",
+        bulk: bool = False,
+        concurrently: bool = False,
+        maintenance_work_mem: str = None,
+    ):
+        """
+        Import an in-memory ``geopandas.GeoDataFrame`` to the SQL database.
+
+        :param gdf: geodataframe with data you want to save
+        :type gdf: gpd.GeoDataFrame
+        :param table_name: name of the table that will get created
+        :type table_name: str
+        :param src_epsg: The source EPSG code can be passed as an integer.
+                         By default this function will try to read the EPSG
+                         code directly, but some spatial data is funky and
+                         requires that you explicitly declare its projection.
+                         Defaults to False
+        :type src_epsg: Union[int, bool], optional
+        :param if_exists: pandas argument to handle overwriting data,
+                          defaults to "replace"
+        :type if_exists: str, optional
+        :param use_copy: flag to load the data with ``COPY`` and hex EWKB
+                         geometry instead of ``to_sql()`` with WKT,
+                         defaults to True
+        :type use_copy: bool, optional
+        :param geometry_codec: how geometry is sent when ``use_copy=True``.
+                               ``"wkb"`` sends hex EWKB, ``"wkt"`` sends EWKT.
+                               Defaults to "wkb"
+        :type geometry_codec: str, optional
+        :param bulk: flag to load into an ``UNLOGGED`` table that already has
+                     the ``uid`` column, then build the indexes once and switch
+                     it to ``LOGGED``. See ``_finish_bulk_load()``. Defaults to False
+        :type bulk: bool, optional
+        :param concurrently: flag to build the indexes ``CONCURRENTLY``
+                             when ``bulk=True``, defaults to False
+        :type concurrently: bool, optional
+        :param maintenance_work_mem: memory for the index builds when
+                                     ``bulk=True``, like ``"2GB"``, defaults to None
+        :type maintenance_work_mem: str, optional
+        """
+        if not schema:
+            schema = self.ACTIVE_SCHEMA
+
+        if bulk and not use_copy:
+            raise ValueError("bulk=True requires use_copy=True")
+
+        if bulk and if_exists == "append":
+            raise ValueError("bulk=True creates a new table, so if_exists can't be 'append'")
+
+        # Read the geometry type. It's possible there are
+        # both MULTIPOLYGONS and POLYGONS. This grabs the MULTI variant
+
+        geom_types = list(gdf.geometry.geom_type.unique())
+        geom_typ = max(geom_types, key=len).upper()
+
+        self._print(2, f"Importing {geom_typ} geodataframe to: {schema}.{table_name}")
+
+        # Manually set the EPSG if the user passes one
+        if src_epsg:
+            gdf.crs = f"epsg:{src_epsg}"
+            epsg_code = src_epsg
+
+        # Otherwise, try to get the EPSG value directly from the geodataframe
+        else:
+            # Older gdfs have CRS stored as a dict: {'init': 'epsg:4326'}
+            if type(gdf.crs) == dict:
+                epsg_code = int(gdf.crs["init"].split(" ")[0].split(":")[1])
+            # Now geopandas has a different approach
+            else:
+                epsg_code = int(str(gdf.crs).split(":")[1])
+
+        # Sanitize the columns before writing to the database
+        # Make all column names lower case
+        gdf.columns = [x.lower() for x in gdf.columns]
+
+        # Replace the 'geom' column with 'geometry'
+        if "geom" in gdf.columns:
+            gdf["geometry"] = gdf["geom"]
+            gdf.drop("geom", 1, inplace=True)
+
+        # Drop the 'gid' column
+        if "gid" in gdf.columns:
+            gdf.drop("gid", 1, inplace=True)
+
+        # Rename 'uid' to 'old_uid'
+        if uid_col in gdf.columns:
+            gdf[f"old_{uid_col}"] = gdf[uid_col]
+            gdf.drop(uid_col, 1, inplace=True)
 
         # Write geodataframe to SQL database
         self.add_schema(schema)
 
-        engine = sqlalchemy.create_engine(self.uri())
-        gdf.to_sql(
-            table_name,
-            engine,
-            if_exists=if_exists,
-            index=True,
-            index_label="gid",
-            schema=schema,
-            dtype={"geom": Geometry(geom_typ, srid=epsg_code)},
-        )
-        engine.dispose()
+        if use_copy:
+            if geometry_codec not in GEOMETRY_CODECS:
+                raise ValueError(f"geometry_codec must be one of: {GEOMETRY_CODECS}")
+
+            def encode(geoms):
+                return encode_geometries(geoms, epsg_code, codec=geometry_codec)
+
+            column_types = {"geom": f"geometry({geom_typ}, {epsg_code})"}
+
+            # In bulk mode the uid gets filled in by COPY,
+            # instead of rewriting the table afterwards
+            if bulk:
+                column_types[uid_col] = "SERIAL NOT NULL"
+
+            # Stream the 'geometry' column into 'geom',
+            # encoding one chunk at a time
+            self._copy_dataframe(
+                gdf,
+                table_name,
+                schema=schema,
+                if_exists=if_exists,
+                index_label="gid",
+                rename={"geometry": "geom"},
+                converters={"geom": encode},
+                column_types=column_types,
+                unlogged=bulk,
+            )
+
+            if bulk:
+                self._finish_bulk_load(
+                    table_name,
+                    schema=schema,
+                    uid_col=uid_col,
+                    concurrently=concurrently,
+                    maintenance_work_mem=maintenance_work_mem,
+                )
+                return
+
+        else:
+            # Build a 'geom' column using geoalchemy2
+            # and drop the source 'geometry' column
+            gdf["geom"] = gdf["geometry"].apply(lambda x: WKTElement(x.wkt, srid=epsg_code))
+            gdf.drop("geometry", 1, inplace=True)
+
+            engine = self._engine()
+            gdf.to_sql(
+                table_name,
+                engine,
+                if_exists=if_exists,
+                index=True,
+                index_label="gid",
+                schema=schema,
+                dtype={"geom": Geometry(geom_typ, srid=epsg_code)},
+            )
 
         self.table_add_uid_column(table_name, schema=schema, uid_col=uid_col)
         self.table_add_spatial_index(table_name, schema=schema)
@@ -924,11 +2578,16 @@ class PostgreSQL:
         csv_path: Path,
         if_exists: str = "append",
         schema: str = None,
+        chunk_size: int = None,
         **csv_kwargs,
     ):
         r"""
         Load a CSV into a dataframe, then save the df to SQL.
 
+        Pass a ``chunk_size`` to stream large files instead. The CSV is
+        then read and copied into SQL ``chunk_size`` rows at a time, so
+        memory use does not depend on the size of the file.
+
         :param table_name: Name of the table you want to create
         :type table_name: str
         :param csv_path: Path to data. Anything accepted by Pandas works here.
@@ -936,12 +2595,23 @@ class PostgreSQL:
         :param if_exists: How to handle overwriting existing data,
                           defaults to ``"append"``
         :type if_exists: str, optional
+        :param chunk_size: number of rows to read at a time, defaults to None
+                           which reads the whole file at once
+        :type chunk_size: int, optional
         :param \**csv_kwargs: any kwargs for ``pd.read_csv()`` are valid here.
+        :return: the dataframe, or None when streaming with ``chunk_size``
+        :rtype: pd.DataFrame
         """
 
         if not schema:
             schema = self.ACTIVE_SCHEMA
 
+        if chunk_size:
+            self._import_csv_in_chunks(
+                table_name, csv_path, if_exists, schema, chunk_size, **csv_kwargs
+            )
+            return None
+
         self._print(2, "Loading CSV to dataframe")
 
         # Read the CSV with whatever kwargs were passed
@@ -951,6 +2621,72 @@ class PostgreSQL:
 
         return df
 
+    def _import_csv_in_chunks(
+        self,
+        table_name: str,
+        csv_path: Path,
+        if_exists: str,
+        schema: str,
+        chunk_size: int,
+        **csv_kwargs,
+    ) -> int:
+        r"""
+        Stream a CSV into SQL without ever holding the whole file in memory.
+
+        The column types are inferred from the first
+        ``TYPE_INFERENCE_SAMPLE_SIZE`` rows. Later chunks are coerced
+        to match, so that a column of integers doesn't turn into floats
+        just because a later chunk happens to contain blanks. If a chunk
+        still doesn't fit (like ``1.5`` or text in an integer column),
+        the column is widened to ``DOUBLE PRECISION`` or ``TEXT``.
+
+        :param table_name: Name of the table you want to create
+        :type table_name: str
+        :param csv_path: Path to data. Anything accepted by Pandas works here.
+        :type csv_path: Path
+        :param if_exists: How to handle overwriting existing data
+        :type if_exists: str
+        :param schema: name of the schema
+        :type schema: str
+        :param chunk_size: number of rows to read at a time
+        :type chunk_size: int
+        :param \**csv_kwargs: any kwargs for ``pd.read_csv()`` are valid here.
+        :return: number of rows written
+        :rtype: int
+        """
+
+        self._print(2, f"Streaming CSV to {schema}.{table_name} in chunks of {chunk_size:,} rows")
+
+        # Infer the column types from a sample of the file
+        sample = pd.read_csv(csv_path, nrows=TYPE_INFERENCE_SAMPLE_SIZE, **csv_kwargs)
+        self._sanitize_column_names(sample)
+
+        sample_dtypes = sample.dtypes
+        index_label = sample.index.name or "index"
+        sample = next(
+            dataframe_chunks(sample, chunk_size=len(sample) or 1, index_label=index_label)
+        )
+
+        reader = pd.read_csv(csv_path, chunksize=chunk_size, **csv_kwargs)
+
+        def prepared_chunks():
+            for chunk in reader:
+                self._sanitize_column_names(chunk)
+
+                chunk = conform_dtypes(chunk, sample_dtypes)
+
+                yield from dataframe_chunks(chunk, chunk_size=chunk_size, index_label=index_label)
+
+        self.add_schema(schema)
+
+        rows = self._copy_chunks(
+            prepared_chunks(), table_name, schema, if_exists=if_exists, sample=sample
+        )
+
+        self._print(2, f"Streamed {rows:,} rows into {schema}.{table_name}")
+
+        return rows
+
     def import_geodata(
         self,
         table_name: str,
@@ -995,6 +2731,144 @@ class PostgreSQL:
             gdf, table_name, src_epsg=src_epsg, if_exists=if_exists, schema=schema
         )
 
+    @timer
+    def import_geoparquet(
+        self,
+        table_name: str,
+        data_path: Path,
+        columns: list = None,
+        src_epsg: int = None,
+        if_exists: str = "fail",
+        schema: str = None,
+        chunk_size: int = ARROW_BATCH_SIZE,
+    ) -> int:
+        """
+        Stream a GeoParquet file into SQL, one row group at a time.
+        Column types are kept as they are in the file.
+
+        :param table_name: Name of the table you want to create
+        :type table_name: str
+        :param data_path: path to the GeoParquet file
+        :type data_path: Path
+        :param columns: non-geometry columns to load, defaults to None
+                        which loads them all
+        :type columns: list, optional
+        :param src_epsg: Manually declare the source EPSG if needed,
+                         defaults to None which reads it from the file
+        :type src_epsg: int, optional
+        :param if_exists: one of ``"fail"``, ``"replace"``, or ``"append"``,
+                          defaults to "fail"
+        :type if_exists: str, optional
+        :param chunk_size: rows to read at a time, defaults to ``ARROW_BATCH_SIZE``
+        :type chunk_size: int, optional
+        :return: number of rows written
+        :rtype: int
+        """
+        source = geoparquet_batches(data_path, columns=columns, batch_size=chunk_size)
+
+        return self._import_arrow_batches(table_name, source, src_epsg, if_exists, schema)
+
+    @timer
+    def import_flatgeobuf(
+        self,
+        table_name: str,
+        data_path: Path,
+        columns: list = None,
+        src_epsg: int = None,
+        if_exists: str = "fail",
+        schema: str = None,
+        chunk_size: int = ARROW_BATCH_SIZE,
+    ) -> int:
+        """
+        Stream a FlatGeobuf file into SQL, ``chunk_size`` features at a time.
+        Column types are kept as they are in the file.
+
+        :param table_name: Name of the table you want to create
+        :type table_name: str
+        :param data_path: path to the FlatGeobuf file
+        :type data_path: Path
+        :param columns: non-geometry columns to load, defaults to None
+                        which loads them all
+        :type columns: list, optional
+        :param src_epsg: Manually declare the source EPSG if needed,
+                         defaults to None which reads it from the file
+        :type src_epsg: int, optional
+        :param if_exists: one of ``"fail"``, ``"replace"``, or ``"append"``,
+                          defaults to "fail"
+        :type if_exists: str, optional
+        :param chunk_size: features to read at a time, defaults to ``ARROW_BATCH_SIZE``
+        :type chunk_size: int, optional
+        :return: number of rows written
+        :rtype: int
+        """
+        source = flatgeobuf_batches(data_path, columns=columns, batch_size=chunk_size)
+
+        return self._import_arrow_batches(table_name, source, src_epsg, if_exists, schema)
+
+    def _import_arrow_batches(
+        self,
+        table_name: str,
+        source: tuple,
+        src_epsg: int,
+        if_exists: str,
+        schema: str,
+        uid_col: str = "uid",
+    ) -> int:
+        """
+        COPY a stream of Arrow record batches into a new spatial table,
+        then add the ``uid`` primary key and a spatial index.
+
+        The WKB is copied as-is and gets its SRID from the
+        ``geometry(TYPE, EPSG)`` column type, so when appending, the
+        existing ``geom`` column needs an SRID in its type as well.
+
+        :param source: tuple of (geometry column name, geometry types, CRS,
+                       iterator of batches), as returned by
+                       ``geoparquet_batches()`` or ``flatgeobuf_batches()``
+        :type source: tuple
+        :return: number of rows written
+        :rtype: int
+        """
+
+        if not schema:
+            schema = self.ACTIVE_SCHEMA
+
+        geom_col, geom_types, crs, batches = source
+
+        epsg = src_epsg or epsg_from_crs(crs)
+        geom_type = postgis_geometry_type(geom_types)
+
+        self._print(2, f"Streaming {geom_type} data into {schema}.{table_name}")
+
+        def prepared_chunks():
+            for batch in batches:
+                df = batch_to_dataframe(batch, geom_col)
+                self._sanitize_column_names(df)
+
+                # Same renames as import_geodataframe()
+                df = df.drop(columns=["gid"], errors="ignore")
+                df = df.rename(columns={uid_col: f"old_{uid_col}"})
+
+                yield df
+
+        self.add_schema(schema)
+
+        rows = self._copy_chunks(
+            prepared_chunks(),
+            table_name,
+            schema,
+            if_exists=if_exists,
+            column_types={"geom": f"geometry({geom_type}, {epsg})"},
+        )
+
+        if if_exists != "append":
+            self.table_add_uid_column(table_name, schema=schema, uid_col=uid_col)
+            self.table_add_spatial_index(table_name, schema=schema)
+
+        self._print(2, f"Streamed {rows:,} rows into {schema}.{table_name}")
+
+        return rows
+
     # CREATE data within the database
     # -------------------------------
 
@@ -1006,9 +2880,80 @@ class PostgreSQL:
         epsg: int,
         schema: str = None,
         uid_col: str = "uid",
+        tile_table: str = None,
+        tile_geom: str = "geom",
+        tile_column: str = None,
+        tiles: int = 16,
+        max_workers: int = 4,
+        deduplicate: bool = False,
+        bulk: bool = False,
+        concurrently: bool = False,
+        maintenance_work_mem: str = None,
     ) -> None:
         """
-        TODO: docstring
+        Make a new spatial table out of a query, with a ``uid``
+        primary key and a spatial index.
+
+        Heavy queries can be split into ``tiles`` that run in parallel.
+        The query must then include a ``{tile_filter}`` placeholder in its
+        ``WHERE`` clause, and ``tile_table`` names the driving table whose
+        extent gets split up. Each feature of the driving table goes to
+        the tile that holds the center of its bounding box, found through
+        ``tile_geom`` (the driving geometry as it's written in the query):
+
+            >>> db.make_geotable_from_query(
+            ...     '''
+            ...     SELECT p.parcel_id, ST_Intersection(p.geom, f.geom) AS geom
+            ...     FROM parcels p JOIN flood_zones f ON ST_Intersects(p.geom, f.geom)
+            ...     WHERE {tile_filter}
+            ...     ''',
+            ...     "parcels_in_flood_zones",
+            ...     "MULTIPOLYGON",
+            ...     2272,
+            ...     tile_table="parcels",
+            ...     tile_geom="p.geom",
+            ... )
+
+        Use ``tile_column`` to split by ranges of a numeric column instead.
+        Each tile is written to an unlogged staging table over its own
+        connection, and the tiles are then merged into the final table.
+
+        :param query: any valid SQL query that returns a ``geom`` column
+        :type query: str
+        :param new_table_name: Name of the new table to create
+        :type new_table_name: str
+        :param geom_type: PostGIS-valid geometry type, like "POLYGON"
+        :type geom_type: str
+        :param epsg: EPSG of the geometry
+        :type epsg: int
+        :param uid_col: name of the primary key column, defaults to "uid"
+        :type uid_col: str, optional
+        :param tile_table: name of the driving table to split into tiles,
+                           defaults to None which runs the query in one piece
+        :type tile_table: str, optional
+        :param tile_geom: driving geometry in the query, defaults to "geom"
+        :type tile_geom: str, optional
+        :param tile_column: numeric column (as written in the query) to split
+                            by ranges instead of space, defaults to None
+        :type tile_column: str, optional
+        :param tiles: number of tiles, defaults to 16
+        :type tiles: int, optional
+        :param max_workers: number of tiles to run at once, defaults to 4
+        :type max_workers: int, optional
+        :param deduplicate: flag to drop duplicate rows when merging the
+                            tiles (with ``UNION`` instead of ``UNION ALL``),
+                            defaults to False
+        :type deduplicate: bool, optional
+        :param bulk: flag to create the table ``UNLOGGED`` with the ``uid``
+                     numbered in the same statement, then build the indexes
+                     once and switch it to ``LOGGED``, defaults to False
+        :type bulk: bool, optional
+        :param concurrently: flag to build the indexes ``CONCURRENTLY``
+                             when ``bulk=True``, defaults to False
+        :type concurrently: bool, optional
+        :param maintenance_work_mem: memory for the index builds when
+                                     ``bulk=True``, like ``"2GB"``, defaults to None
+        :type maintenance_work_mem: str, optional
         """
 
         if not schema:
@@ -1034,21 +2979,158 @@ class PostgreSQL:
                 self._print(3, msg)
             return
 
-        sql_make_table_from_query = f"""
-            DROP TABLE IF EXISTS {schema}.{new_table_name};
-            CREATE TABLE {schema}.{new_table_name} AS
-            {query}
+        self.add_schema(schema)
+
+        staging_tables = []
+
+        try:
+            if tile_table:
+                staging_tables = self._run_query_in_tiles(
+                    query, tile_table, tile_geom, tile_column, tiles, max_workers, schema
+                )
+
+                union = " UNION " if deduplicate else " UNION ALL "
+                query = union.join(f"SELECT * FROM {table}" for table in staging_tables)
+
+            # Declare the geometry type and EPSG in the table definition
+            # itself, so the column doesn't need to be rewritten afterwards
+            sql_geom = f"ST_SetSRID(geom, {epsg})::geometry({geom_type.upper()}, {epsg}) AS geom"
+            columns = []
+
+            for column in self._query_columns(query):
+                if column == "geom":
+                    columns.append(sql_geom)
+                elif column != uid_col:
+                    columns.append(quote_identifier(column))
+
+            unlogged = ""
+
+            if bulk:
+                # Number the rows as they're written, instead of
+                # rewriting the whole table to add a serial column
+                columns.append(f"(row_number() OVER ())::int AS {uid_col}")
+                unlogged = "UNLOGGED "
+
+            query = f"""
+                SELECT {", ".join(columns)}
+                FROM ({self._as_subquery(query)}) AS _q
+            """
+
+            sql_make_table_from_query = f"""
+                DROP TABLE IF EXISTS {schema}.{new_table_name};
+                CREATE {unlogged}TABLE {schema}.{new_table_name} AS
+                {query}
+            """
+
+            self.execute(sql_make_table_from_query)
+
+        finally:
+            if staging_tables:
+                self.execute(f"DROP TABLE IF EXISTS {', '.join(staging_tables)};")
+
+        if bulk:
+            self._table_add_uid_sequence(new_table_name, schema=schema, uid_col=uid_col)
+            self._finish_bulk_load(
+                new_table_name,
+                schema=schema,
+                uid_col=uid_col,
+                concurrently=concurrently,
+                maintenance_work_mem=maintenance_work_mem,
+            )
+        else:
+            self.table_add_uid_column(new_table_name, schema=schema, uid_col=uid_col)
+            self.table_add_spatial_index(new_table_name, schema=schema)
+
+    def _run_query_in_tiles(
+        self,
+        query: str,
+        tile_table: str,
+        tile_geom: str,
+        tile_column: str,
+        tiles: int,
+        max_workers: int,
+        schema: str,
+    ) -> list:
         """
+        Run one copy of ``query`` per tile into unlogged staging tables
+        for ``make_geotable_from_query()``.
 
-        self.add_schema(schema)
+        :return: names of the staging tables, including the schema
+        :rtype: list
+        """
 
-        self.execute(sql_make_table_from_query)
+        if "{tile_filter}" not in query:
+            raise ValueError("Tiled queries need a {tile_filter} placeholder")
 
-        self.table_add_uid_column(new_table_name, schema=schema, uid_col=uid_col)
-        self.table_add_spatial_index(new_table_name, schema=schema)
-        self.table_reproject_spatial_data(
-            new_table_name, epsg, epsg, geom_type=geom_type.upper(), schema=schema
-        )
+        if tile_column:
+            # Drop any table alias to look the range up in the driving table
+            column_name = tile_column.split(".")[-1]
+            sql_range = f"SELECT MIN({column_name}), MAX({column_name}) FROM {schema}.{tile_table}"
+            low, high = self.query_as_list(sql_range)[0]
+            conditions = range_conditions(tile_column, low, high, tiles)
+
+        else:
+            table_epsg, (xmin, ymin, xmax, ymax) = self._extent_in_epsg(
+                tile_table, self._table_epsg(tile_table, schema=schema), schema=schema
+            )
+
+            columns = math.ceil(math.sqrt(tiles))
+            rows = math.ceil(tiles / columns)
+
+            # Inner edges of the tiles. The outer tiles are open-ended.
+            x_edges = [None] + [xmin + (xmax - xmin) * i / columns for i in range(1, columns)]
+            x_edges += [None]
+            y_edges = [None] + [ymin + (ymax - ymin) * i / rows for i in range(1, rows)]
+            y_edges += [None]
+
+            center_x = f"(ST_XMin({tile_geom}) + ST_XMax({tile_geom})) / 2"
+            center_y = f"(ST_YMin({tile_geom}) + ST_YMax({tile_geom})) / 2"
+
+            conditions = []
+
+            for (x0, x1), (y0, y1) in itertools.product(
+                zip(x_edges[:-1], x_edges[1:]), zip(y_edges[:-1], y_edges[1:])
+            ):
+                # The && lets the driving table's spatial index find
+                # candidates, then the bounding box center picks one tile
+                envelope = ", ".join(
+                    str(v) for v in [x0 or xmin, y0 or ymin, x1 or xmax, y1 or ymax]
+                )
+                condition = [f"{tile_geom} && ST_MakeEnvelope({envelope}, {table_epsg})"]
+
+                for expression, low, high in [(center_x, x0, x1), (center_y, y0, y1)]:
+                    if low is not None:
+                        condition.append(f"{expression} >= {low}")
+                    if high is not None:
+                        condition.append(f"{expression} < {high}")
+
+                conditions.append("(" + " AND ".join(condition) + ")")
+
+        prefix = f"{schema}._tile_{uuid.uuid4().hex[:8]}"
+        staging_tables = [f"{prefix}_{i}" for i, _ in enumerate(conditions)]
+
+        def run_tile(staging_table, condition):
+            tile_query = query.replace("{tile_filter}", condition or "TRUE")
+            self.execute(f"CREATE UNLOGGED TABLE {staging_table} AS {tile_query};")
+
+        # Every worker needs its own connection from the pool
+        max_workers = max(1, min(max_workers, self._pool().MAX_SIZE))
+
+        self._print(2, f"Running the query in {len(conditions)} tiles on {max_workers} workers")
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for future in [
+                    executor.submit(run_tile, table, condition)
+                    for table, condition in zip(staging_tables, conditions)
+                ]:
+                    future.result()
+
+        except Exception:
+            self.execute(f"DROP TABLE IF EXISTS {', '.join(staging_tables)};")
+            raise
+
+        return staging_tables
 
     def make_hexagon_overlay(
         self,
@@ -1057,12 +3139,17 @@ class PostgreSQL:
         desired_epsg: int,
         hexagon_size: float,
         schema: str = None,
+        clip_to_coverage: bool = False,
     ) -> None:
         """
         Create a new spatial hexagon grid covering another
         spatial table. EPSG must be specified for the hexagons,
         as well as the size in square KM.
 
+        The extent of ``table_to_cover`` is computed once. On PostGIS 3.1+
+        the hexagons are generated set-based with ``ST_HexagonGrid()``,
+        otherwise the ``hex_grid()`` function from ``sql_helpers.py`` is used.
+
         :param new_table_name: Name of the new table to create
         :type new_table_name: str
         :param table_to_cover: Name of the existing table you want to cover
@@ -1071,6 +3158,9 @@ class PostgreSQL:
         :type desired_epsg: int
         :param hexagon_size: Size of the hexagons, 1 = 1 square KM
         :type hexagon_size: float
+        :param clip_to_coverage: flag to only keep the hexagons that intersect
+                                 a feature in ``table_to_cover``, defaults to False
+        :type clip_to_coverage: bool, optional
         """
 
         if not schema:
@@ -1078,6 +3168,48 @@ class PostgreSQL:
 
         self._print(2, f"Creating hexagon table named: {schema}.{new_table_name}")
 
+        cover_table = f"{schema}.{table_to_cover}"
+        cover_epsg = self._table_epsg(table_to_cover, schema=schema)
+
+        # Get the extent in one pass over the cover table. Transforming
+        # each bounding box (instead of the extent's four corners) keeps
+        # curved edges of the projected extent inside the grid.
+        if int(cover_epsg) == int(desired_epsg):
+            sql_extent = "ST_Extent(geom)"
+        else:
+            sql_extent = f"ST_Extent(ST_Transform(ST_Envelope(geom), {desired_epsg}))"
+
+        if self.postgis_version() >= (3, 1):
+            # ST_HexagonGrid() wants the edge length, and a regular
+            # hexagon's area is (3 * sqrt(3) / 2) * edge ^ 2
+            edge_length = math.sqrt(2 * hexagon_size * 1_000_000 / (3 * math.sqrt(3)))
+
+            sql_hexagons = f"""
+                SELECT hex.geom
+                FROM extent, ST_HexagonGrid({edge_length}, extent.geom) AS hex
+            """
+        else:
+            sql_hexagons = f"""
+                SELECT hex_grid(
+                    {hexagon_size},
+                    ST_XMin(extent.geom), ST_YMin(extent.geom),
+                    ST_XMax(extent.geom), ST_YMax(extent.geom),
+                    {desired_epsg}, {desired_epsg}, {desired_epsg}
+                ) AS geom
+                FROM extent
+            """
+
+        # Use the cover table's spatial index to skip empty hexagons
+        if clip_to_coverage:
+            sql_hexagons = f"""
+                SELECT hex.geom
+                FROM ({sql_hexagons}) hex
+                WHERE EXISTS (
+                    SELECT 1 FROM {cover_table} cover
+                    WHERE ST_Intersects(cover.geom, ST_Transform(hex.geom, {cover_epsg}))
+                )
+            """
+
         sql_create_hex_grid = f"""
 
             DROP TABLE IF EXISTS {schema}.{new_table_name};
@@ -1085,25 +3217,14 @@ class PostgreSQL:
             CREATE TABLE {schema}.{new_table_name} (
                 gid SERIAL NOT NULL PRIMARY KEY,
                 geom GEOMETRY('POLYGON', {desired_epsg}, 2) NOT NULL
-            )
-            WITH (OIDS=FALSE);
+            );
 
+            WITH extent AS (
+                SELECT ST_SetSRID({sql_extent}::geometry, {desired_epsg}) AS geom
+                FROM {cover_table}
+            )
             INSERT INTO {schema}.{new_table_name} (geom)
-            SELECT
-                hex_grid(
-                    {hexagon_size},
-                    (select st_xmin(st_transform(st_collect(geom), 4326))
-                     from {schema}.{table_to_cover}),
-                    (select st_ymin(st_transform(st_collect(geom), 4326))
-                     from {schema}.{table_to_cover}),
-                    (select st_xmax(st_transform(st_collect(geom), 4326))
-                     from {schema}.{table_to_cover}),
-                    (select st_ymax(st_transform(st_collect(geom), 4326))
-                     from {schema}.{table_to_cover}),
-                    4326,
-                    {desired_epsg},
-                    {desired_epsg}
-            );
+            {sql_hexagons};
         """
 
         self.add_schema(schema)
@@ -1114,65 +3235,633 @@ class PostgreSQL:
 
         # TODO: reproject?
 
+    def _table_epsg(self, table_name: str, schema: str = None, geom_col: str = "geom") -> int:
+        """
+        Get the EPSG of a spatial table's geometry column.
+
+        :param table_name: name of the spatial table
+        :type table_name: str
+        :return: EPSG code, from ``geometry_columns``
+        :rtype: int
+        """
+
+        if not schema:
+            schema = self.ACTIVE_SCHEMA
+
+        sql_srid = f"SELECT Find_SRID('{schema}', '{table_name}', '{geom_col}');"
+
+        return int(self.query_as_single_item(sql_srid))
+
+    def _extent_in_epsg(self, table_name: str, epsg: int, schema: str = None) -> tuple:
+        """
+        Get the bounding box of a spatial table in another EPSG,
+        with a single pass over the table.
+
+        :param table_name: name of the spatial table
+        :type table_name: str
+        :param epsg: EPSG to report the extent in
+        :type epsg: int
+        :return: tuple of (table EPSG, (xmin, ymin, xmax, ymax))
+        :rtype: tuple
+        """
+
+        if not schema:
+            schema = self.ACTIVE_SCHEMA
+
+        table_epsg = self._table_epsg(table_name, schema=schema)
+
+        if int(table_epsg) == int(epsg):
+            sql_extent = "ST_Extent(geom)"
+        else:
+            sql_extent = f"ST_Extent(ST_Transform(ST_Envelope(geom), {epsg}))"
+
+        sql_bounds = f"""
+            SELECT ST_XMin(extent), ST_YMin(extent), ST_XMax(extent), ST_YMax(extent)
+            FROM (SELECT {sql_extent} AS extent FROM {schema}.{table_name}) e;
+        """
+        bounds = self.query_as_list(sql_bounds)[0]
+
+        if bounds[0] is None:
+            raise ValueError(f"{schema}.{table_name} has no geometries to cover")
+
+        return table_epsg, bounds
+
+    def make_grid_pyramid(
+        self,
+        new_table_name: str,
+        table_to_cover: str,
+        desired_epsg: int,
+        cell_sizes: list,
+        shape: str = "hexagon",
+        schema: str = None,
+        clip_to_coverage: bool = False,
+    ) -> None:
+        """
+        Create a multi-resolution grid covering another spatial table,
+        with every resolution stored in one table and linked together.
+        Requires PostGIS 3.1+.
+
+        Levels are numbered from ``0`` (the largest cells) up to the
+        smallest cells. Every cell has a deterministic ``cell_id`` like
+        ``"{level}_{i}_{j}"``, where ``i`` and ``j`` are the column and row
+        of the cell in its grid. Each cell points to the coarser cell
+        that holds its centroid with ``parent_id``, and the columns
+        ``l0_id``, ``l1_id``, etc. hold the IDs of all of its ancestors.
+        Metrics can be computed once for the smallest cells and then
+        rolled up with a plain ``GROUP BY l{level}_id``.
+
+        Square grids nest exactly when each size is a square multiple
+        of the next (i.e. 4 and 1). Hexagons never nest exactly, so a
+        coarse hexagon's children are the hexagons whose centroids it holds.
+
+        :param new_table_name: Name of the new table to create
+        :type new_table_name: str
+        :param table_to_cover: Name of the existing table you want to cover
+        :type table_to_cover: str
+        :param desired_epsg: integer for EPSG you want the cells to be in
+        :type desired_epsg: int
+        :param cell_sizes: Size of the cells at each level, 1 = 1 square KM
+        :type cell_sizes: list
+        :param shape: ``"hexagon"`` or ``"square"``, defaults to "hexagon"
+        :type shape: str, optional
+        :param clip_to_coverage: flag to only keep the smallest cells that
+                                 intersect a feature in ``table_to_cover``
+                                 (and their ancestors), defaults to False
+        :type clip_to_coverage: bool, optional
+        """
+
+        grid_functions = {"hexagon": "ST_HexagonGrid", "square": "ST_SquareGrid"}
+
+        if shape not in grid_functions:
+            raise ValueError(f"shape must be one of: {list(grid_functions)}")
+
+        if self.postgis_version() < (3, 1):
+            raise ValueError("make_grid_pyramid() requires PostGIS 3.1 or newer")
+
+        if not schema:
+            schema = self.ACTIVE_SCHEMA
+
+        self._print(2, f"Creating grid pyramid named: {schema}.{new_table_name}")
+
+        # Level 0 has the largest cells
+        cell_sizes = sorted(set(cell_sizes), reverse=True)
+        levels = list(range(len(cell_sizes)))
+
+        def edge_length(size):
+            area = size * 1_000_000
+            if shape == "hexagon":
+                return math.sqrt(2 * area / (3 * math.sqrt(3)))
+            return math.sqrt(area)
+
+        cover_table = f"{schema}.{table_to_cover}"
+        cover_epsg, bounds = self._extent_in_epsg(table_to_cover, desired_epsg, schema=schema)
+
+        sql_envelope = f"ST_MakeEnvelope({', '.join(map(str, bounds))}, {desired_epsg})"
+
+        grid_table = f"{schema}.{new_table_name}"
+        ancestor_columns = [f"l{level}_id" for level in levels]
+
+        sql_pyramid = [
+            f"DROP TABLE IF EXISTS {grid_table};",
+            f"""
+            CREATE TABLE {grid_table} (
+                cell_id TEXT PRIMARY KEY,
+                level INTEGER NOT NULL,
+                i INTEGER NOT NULL,
+                j INTEGER NOT NULL,
+                cell_size FLOAT8 NOT NULL,
+                parent_id TEXT,
+                {", ".join(f"{col} TEXT" for col in ancestor_columns)},
+                geom GEOMETRY('POLYGON', {desired_epsg}) NOT NULL
+            );
+            """,
+            f"CREATE INDEX ON {grid_table} USING GIST (geom);",
+            f"CREATE INDEX ON {grid_table} (parent_id);",
+        ]
+
+        # Work from the smallest cells up. Each coarser level covers
+        # a slightly bigger extent so that it holds every child centroid.
+        margin = 0
+
+        for level in reversed(levels):
+            size = cell_sizes[level]
+
+            sql_cells = f"""
+                INSERT INTO {grid_table} (cell_id, level, i, j, cell_size, geom)
+                SELECT
+                    '{level}_' || cell.i || '_' || cell.j,
+                    {level}, cell.i, cell.j, {size}, cell.geom
+                FROM {grid_functions[shape]}(
+                    {edge_length(size)},
+                    ST_Expand({sql_envelope}, {margin})
+                ) AS cell
+            """
+
+            if clip_to_coverage and level == levels[-1]:
+                sql_cells += f"""
+                WHERE EXISTS (
+                    SELECT 1 FROM {cover_table} cover
+                    WHERE ST_Intersects(cover.geom, ST_Transform(cell.geom, {cover_epsg}))
+                )
+                """
+
+            sql_pyramid += [sql_cells + ";", f"ANALYZE {grid_table};"]
+
+            if level != levels[-1]:
+                sql_pyramid += [
+                    f"""
+                    UPDATE {grid_table} child
+                    SET parent_id = parents.parent_id
+                    FROM (
+                        SELECT DISTINCT ON (c.cell_id) c.cell_id, p.cell_id AS parent_id
+                        FROM {grid_table} c
+                        JOIN {grid_table} p
+                            ON p.level = {level}
+                            AND ST_Intersects(p.geom, ST_Centroid(c.geom))
+                        WHERE c.level = {level + 1}
+                        ORDER BY c.cell_id, p.cell_id
+                    ) parents
+                    WHERE child.cell_id = parents.cell_id;
+                    """,
+                    f"""
+                    DELETE FROM {grid_table} p
+                    WHERE p.level = {level}
+                        AND NOT EXISTS (
+                            SELECT 1 FROM {grid_table} c WHERE c.parent_id = p.cell_id
+                        );
+                    """,
+                ]
+
+            margin += edge_length(size)
+
+        # Copy the ancestor IDs down one level at a time
+        sql_pyramid.append(f"UPDATE {grid_table} SET l0_id = cell_id WHERE level = 0;")
+
+        for level in levels[1:]:
+            inherited = [f"{col} = p.{col}" for col in ancestor_columns[:level]]
+            sql_pyramid.append(
+                f"""
+                UPDATE {grid_table} child
+                SET {", ".join(inherited)}, l{level}_id = child.cell_id
+                FROM {grid_table} p
+                WHERE child.level = {level} AND child.parent_id = p.cell_id;
+                """
+            )
+
+        sql_pyramid.append(f"ANALYZE {grid_table};")
+
+        self.add_schema(schema)
+
+        self.execute("\n".join(sql_pyramid))
+
+    def make_grid_aggregation(
+        self,
+        new_table_name: str,
+        grid_table: str,
+        source_table: str,
+        aggregations: dict,
+        grid_id_col: str = "gid",
+        predicate: str = "intersects",
+        weighting: str = None,
+        geom_type: str = "POLYGON",
+        schema: str = None,
+    ) -> None:
+        """
+        Summarize a source table for every cell in a grid (like the
+        output of ``make_hexagon_overlay()``) and save it as a new geotable.
+
+        The join runs in the database and uses the spatial index of
+        the source table (or the grid, for ``predicate="centroid"``).
+        Only cells that match at least one feature are kept.
+
+        ``aggregations`` maps each new column name to an SQL aggregate
+        that can use any column of the source table, along with a
+        ``_grid_weight`` column (named so it can't clash with a column of
+        the source table). When ``weighting`` is ``"length"`` or ``"area"``,
+        ``_grid_weight`` is the share of each line or polygon that falls
+        inside the cell, so that values get apportioned between cells:
+
+            >>> db.make_grid_aggregation(
+            ...     "traffic_by_hex",
+            ...     "hexagons",
+            ...     "road_segments",
+            ...     {"segments": "COUNT(*)", "vmt": "SUM(volume * miles * _grid_weight)"},
+            ...     weighting="length",
+            ... )
+
+        Otherwise ``_grid_weight`` is always 1.
+
+        :param new_table_name: Name of the new table to create
+        :type new_table_name: str
+        :param grid_table: Name of the grid table
+        :type grid_table: str
+        :param source_table: Name of the spatial table to summarize
+        :type source_table: str
+        :param aggregations: ``{new_column: sql_aggregate}``
+        :type aggregations: dict
+        :param grid_id_col: unique ID column of the grid, defaults to "gid"
+        :type grid_id_col: str, optional
+        :param predicate: ``"intersects"``, ``"contains"`` (the cell holds
+                          the whole feature), or ``"centroid"`` (the cell
+                          holds a point on the feature, so each feature
+                          is only counted once), defaults to "intersects"
+        :type predicate: str, optional
+        :param weighting: ``None``, ``"length"``, or ``"area"``, defaults to None
+        :type weighting: str, optional
+        :param geom_type: geometry type of the grid cells, defaults to "POLYGON"
+        :type geom_type: str, optional
+        """
+
+        predicates = ["intersects", "contains", "centroid"]
+        weightings = {
+            None: "1.0",
+            "length": """
+                ST_Length(ST_Intersection(src.geom, cell_geom))
+                / NULLIF(ST_Length(src.geom), 0)
+            """,
+            "area": """
+                ST_Area(ST_Intersection(src.geom, cell_geom))
+                / NULLIF(ST_Area(src.geom), 0)
+            """,
+        }
+
+        if predicate not in predicates:
+            raise ValueError(f"predicate must be one of: {predicates}")
+
+        if weighting not in weightings:
+            raise ValueError(f"weighting must be one of: {list(weightings)}")
+
+        if weighting and predicate != "intersects":
+            raise ValueError("weighting can only be used with predicate='intersects'")
+
+        if not schema:
+            schema = self.ACTIVE_SCHEMA
+
+        grid_epsg = self._table_epsg(grid_table, schema=schema)
+        source_epsg = self._table_epsg(source_table, schema=schema)
+
+        # Transform the cells (not the features) so that the index on
+        # the source table can be used, unless the EPSGs already match
+        if grid_epsg == source_epsg:
+            cell_geom = "g.geom"
+        else:
+            cell_geom = f"ST_Transform(g.geom, {source_epsg})"
+
+        if predicate == "intersects":
+            sql_join = "ST_Intersects(src.geom, cell_geom)"
+        elif predicate == "contains":
+            sql_join = "ST_Contains(cell_geom, src.geom)"
+        else:
+            point = "ST_PointOnSurface(src.geom)"
+            if grid_epsg != source_epsg:
+                point = f"ST_Transform({point}, {grid_epsg})"
+            sql_join = f"ST_Intersects(g.geom, {point})"
+
+        sql_join = sql_join.replace("cell_geom", cell_geom)
+        sql_weight = weightings[weighting].replace("cell_geom", cell_geom)
+
+        sql_aggregations = ",\n".join(
+            f"{expression} AS {column}" for column, expression in aggregations.items()
+        )
+
+        summary_columns = ", ".join(f"summary.{column}" for column in aggregations)
+
+        query = f"""
+            WITH matches AS (
+                SELECT g.{grid_id_col} AS _grid_cell_id, src.*, {sql_weight} AS _grid_weight
+                FROM {schema}.{grid_table} g
+                JOIN {schema}.{source_table} src ON {sql_join}
+            ),
+            summary AS (
+                SELECT _grid_cell_id, {sql_aggregations}
+                FROM matches
+                GROUP BY _grid_cell_id
+            )
+            SELECT g.{grid_id_col}, {summary_columns}, g.geom
+            FROM summary
+            JOIN {schema}.{grid_table} g ON g.{grid_id_col} = summary._grid_cell_id
+        """
+
+        self._print(2, f"Summarizing {source_table} by {grid_table} into {new_table_name}")
+
+        self.make_geotable_from_query(query, new_table_name, geom_type, grid_epsg, schema=schema)
+
     # EXPORT data to file / disk
     # --------------------------
 
     @timer
-    def export_shapefile(
+    def export_shapefile(
+        self,
+        table_name: str,
+        output_folder: Path,
+        where_clause: str = None,
+        schema: str = None,
+        chunk_size: int = None,
+    ) -> gpd.GeoDataFrame:
+        """Save a spatial SQL table to shapefile.
+           Add an optional filter with the ``where_clause``:
+               ``'WHERE speed_limit <= 35'``
+
+           Use ``chunk_size`` to stream the table from a server-side
+           cursor and append it to the shapefile one chunk at a time,
+           so that large tables don't have to fit in memory.
+
+        :param table_name: Name of the table to export
+        :type table_name: str
+        :param output_folder: Folder path to write to
+        :type output_folder: Path
+        :param where_clause: Any valid SQL where clause, defaults to False
+        :type where_clause: str, optional
+        :param chunk_size: number of rows to write at a time,
+                           defaults to None which loads the whole table
+        :type chunk_size: int, optional
+        :return: the exported data, or None when ``chunk_size`` is used
+        :rtype: gpd.GeoDataFrame
+        """
+
+        if not schema:
+            schema = self.ACTIVE_SCHEMA
+
+        self._print(2, f"Exporting {schema}.{table_name} to shapefile")
+
+        query = f"SELECT * FROM {schema}.{table_name} "
+
+        if where_clause:
+            query += where_clause
+            self._print(1, f"WHERE clause applied: {where_clause}")
+
+        output_path = os.path.join(output_folder, f"{table_name}.shp")
+
+        # Look the boolean columns up once, since a chunk with
+        # a NULL in one of them won't come back with a bool dtype
+        sql_booleans = f"""
+            SELECT column_name FROM information_schema.columns
+            WHERE table_schema = '{schema}'
+                AND table_name = '{table_name}'
+                AND data_type = 'boolean';
+        """
+        booleans = [row[0] for row in self.query_as_list(sql_booleans)]
+
+        if chunk_size:
+            rows = 0
+
+            for gdf in self.query_as_geo_df_chunks(query, itersize=chunk_size):
+                gdf = _stringify_booleans(gdf, booleans)
+                gdf.to_file(output_path, mode="a" if rows else "w")
+                rows += len(gdf)
+
+            if rows:
+                self._print(1, f"Saved {rows:,} rows to {output_path}")
+            else:
+                self._print(3, f"{schema}.{table_name} has no rows, nothing was saved")
+
+            return None
+
+        gdf = _stringify_booleans(self.query_as_geo_df(query), booleans)
+
+        gdf.to_file(output_path)
+
+        self._print(1, f"Saved to {output_path}")
+
+        return gdf
+
+    def export_all_shapefiles(
+        self, output_folder: Path, max_workers: int = 1, chunk_size: int = None
+    ) -> None:
+        """
+        Save all spatial tables in the database to shapefile.
+
+        With ``max_workers`` > 1 the tables are exported at the
+        same time by a pool of processes, each with its own
+        connection to the database.
+
+        :param output_folder: Folder path to write to
+        :type output_folder: Path
+        :param max_workers: number of tables to export at once, defaults to 1
+        :type max_workers: int, optional
+        :param chunk_size: number of rows to write at a time, defaults to
+                           None. See ``export_shapefile()`` for details.
+        :type chunk_size: int, optional
+        """
+
+        tables = list(self.all_spatial_tables_as_dict())
+
+        if max_workers <= 1 or len(tables) <= 1:
+            for table in tables:
+                self.export_shapefile(table, output_folder, chunk_size=chunk_size)
+            return
+
+        db_kwargs = {
+            "working_db": self.DATABASE,
+            "active_schema": self.ACTIVE_SCHEMA,
+            "verbosity": self.VERBOSITY,
+            "create_if_missing": False,
+            **self.connection_details(),
+        }
+
+        self._print(2, f"Exporting {len(tables)} tables with {max_workers} processes")
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _export_shapefile_in_process, db_kwargs, table, output_folder, chunk_size
+                ): table
+                for table in tables
+            }
+
+            for future in as_completed(futures):
+                # Raise the first error that any of the processes hit
+                future.result()
+                self._print(1, f"Finished exporting {futures[future]}")
+
+    @timer
+    def export_geoparquet(
+        self,
+        table_name: str,
+        output_folder: Path = None,
+        where_clause: str = None,
+        schema: str = None,
+        columns: list = None,
+        chunk_size: int = ARROW_BATCH_SIZE,
+    ) -> Path:
+        """
+        Stream a spatial SQL table to a GeoParquet file, one
+        row group per ``chunk_size`` rows. Column names and
+        types are kept as they are in the database.
+
+        :param table_name: Name of the table to export
+        :type table_name: str
+        :param output_folder: Folder path to write to, defaults to DATA_OUTBOX
+        :type output_folder: Path, optional
+        :param where_clause: Any valid SQL where clause, defaults to None
+        :type where_clause: str, optional
+        :param columns: non-geometry columns to export, defaults to None
+                        which exports them all
+        :type columns: list, optional
+        :param chunk_size: rows to write at a time, defaults to ``ARROW_BATCH_SIZE``
+        :type chunk_size: int, optional
+        :return: path to the new file
+        :rtype: Path
+        """
+        output_folder = Path(output_folder or self.DATA_OUTBOX)
+        output_folder.mkdir(parents=True, exist_ok=True)
+
+        output_path = output_folder / f"{table_name}.parquet"
+
+        epsg, geom_type, batches = self._export_arrow_batches(
+            table_name, where_clause, schema, columns, chunk_size
+        )
+
+        geometry_types = [] if geom_type == "Unknown" else [geom_type]
+
+        rows = write_geoparquet(batches, output_path, "geom", epsg, geometry_types)
+
+        self._print(2, f"Saved {rows:,} rows to {output_path}")
+
+        return output_path
+
+    @timer
+    def export_flatgeobuf(
         self,
         table_name: str,
-        output_folder: Path,
+        output_folder: Path = None,
         where_clause: str = None,
         schema: str = None,
-    ) -> gpd.GeoDataFrame:
-        """Save a spatial SQL table to shapefile.
-           Add an optional filter with the ``where_clause``:
-               ``'WHERE speed_limit <= 35'``
+        columns: list = None,
+        chunk_size: int = ARROW_BATCH_SIZE,
+    ) -> Path:
+        """
+        Stream a spatial SQL table to a FlatGeobuf file. Column
+        names and types are kept as they are in the database.
 
         :param table_name: Name of the table to export
         :type table_name: str
-        :param output_folder: Folder path to write to
-        :type output_folder: Path
-        :param where_clause: Any valid SQL where clause, defaults to False
+        :param output_folder: Folder path to write to, defaults to DATA_OUTBOX
+        :type output_folder: Path, optional
+        :param where_clause: Any valid SQL where clause, defaults to None
         :type where_clause: str, optional
+        :param columns: non-geometry columns to export, defaults to None
+                        which exports them all
+        :type columns: list, optional
+        :param chunk_size: rows to write at a time, defaults to ``ARROW_BATCH_SIZE``
+        :type chunk_size: int, optional
+        :return: path to the new file
+        :rtype: Path
+        """
+        output_folder = Path(output_folder or self.DATA_OUTBOX)
+        output_folder.mkdir(parents=True, exist_ok=True)
+
+        output_path = output_folder / f"{table_name}.fgb"
+
+        epsg, geom_type, batches = self._export_arrow_batches(
+            table_name, where_clause, schema, columns, chunk_size
+        )
+
+        rows = write_flatgeobuf(batches, output_path, "geom", epsg, geom_type)
+
+        self._print(2, f"Saved {rows:,} rows to {output_path}")
+
+        return output_path
+
+    def _export_arrow_batches(
+        self,
+        table_name: str,
+        where_clause: str,
+        schema: str,
+        columns: list,
+        chunk_size: int,
+    ) -> tuple:
+        """
+        Read a spatial table through a server-side cursor as a
+        stream of Arrow record batches, with WKB in the ``geom`` column.
+
+        :return: tuple of (EPSG, OGR geometry type, iterator of batches)
+        :rtype: tuple
         """
 
         if not schema:
             schema = self.ACTIVE_SCHEMA
 
-        self._print(2, f"Exporting {schema}.{table_name} to shapefile")
+        self._print(2, f"Exporting {schema}.{table_name}")
 
-        query = f"SELECT * FROM {schema}.{table_name} "
+        sql_geom_type = f"""
+            SELECT type, coord_dimension, srid FROM geometry_columns
+            WHERE f_table_schema = '{schema}'
+                AND f_table_name = '{table_name}'
+                AND f_geometry_column = 'geom';
+        """
+        result = self.query_as_list(sql_geom_type)
 
-        if where_clause:
-            query += where_clause
-            self._print(1, f"WHERE clause applied: {where_clause}")
+        if not result:
+            raise ValueError(f"{schema}.{table_name} doesn't have a 'geom' column")
 
-        gdf = self.query_as_geo_df(query)
+        postgis_type, coord_dimension, epsg = result[0]
 
-        # Force any boolean columns into strings
-        for c in gdf.columns:
-            datatype = gdf[c].dtype.name
-            if datatype == "bool":
-                gdf[c] = gdf[c].astype(str)
+        if columns is None:
+            columns = self.table_columns_as_list(table_name, schema=schema)
 
-        output_path = os.path.join(output_folder, f"{table_name}.shp")
-        gdf.to_file(output_path)
+        column_list = [quote_identifier(c) for c in columns if c != "geom"]
+        column_list.append("ST_AsBinary(geom) AS geom")
 
-        self._print(1, f"Saved to {output_path}")
+        query = f"SELECT {', '.join(column_list)} FROM {schema}.{table_name} "
 
-        return gdf
+        if where_clause:
+            query += where_clause
+            self._print(1, f"WHERE clause applied: {where_clause}")
 
-    def export_all_shapefiles(self, output_folder: Path) -> None:
-        """
-        Save all spatial tables in the database to shapefile.
+        # Take the Arrow types from the database rather than from the first
+        # chunk, which could have a column that's all NULL or ints with blanks
+        with self.connection() as connection:
+            cursor = connection.cursor()
+            column_types = self._query_column_types(cursor, self._as_subquery(query))
+            batch_schema = arrow_schema(column_types, "geom")
+            cursor.close()
 
-        :param output_folder: Folder path to write to
-        :type output_folder: Path
-        """
+        def batches():
+            for df in self.query_as_df_chunks(query, itersize=chunk_size):
+                yield dataframe_to_batch(df, batch_schema)
 
-        for table in self.all_spatial_tables_as_dict():
-            self.export_shapefile(table, output_folder)
+        return int(epsg), ogr_geometry_type(postgis_type, coord_dimension), batches()
 
     # IMPORT/EXPORT data with shp2pgsql / pgsql2shp
     # ---------------------------------------------
@@ -1243,6 +3932,129 @@ class PostgreSQL:
 
         return output_folder / f"{table_name}.shp"
 
+    def pgsql2shp_many(
+        self,
+        tables: list = None,
+        schema: str = None,
+        output_folder: Path = None,
+        extra_args: list = None,
+        jobs: int = 4,
+        check: bool = False,
+    ) -> list:
+        """
+        Export many spatial tables with ``pgsql2shp``, running up to
+        ``jobs`` exports at the same time. Nothing is loaded into
+        Python, so this uses far less memory than ``export_all_shapefiles()``.
+
+        Each shapefile goes into its own subfolder, just like ``pgsql2shp()``.
+        Every export is checked for its exit code, timed and measured.
+
+        :param tables: names of the tables to export, defaults to None
+                       which exports every spatial table in the schema
+        :type tables: list, optional
+        :param schema: schema of the tables, defaults to the active schema
+        :type schema: str, optional
+        :param output_folder: output folder, defaults to DATA_OUTBOX
+        :type output_folder: Path, optional
+        :param extra_args: ``[(flag, value)]`` added to every command,
+                           see ``pgsql2shp()``. Defaults to None
+        :type extra_args: list, optional
+        :param jobs: number of tables to export at once, defaults to 4
+        :type jobs: int, optional
+        :param check: flag to raise ``subprocess.CalledProcessError`` once
+                      every export is done if any of them failed, defaults to False
+        :type check: bool, optional
+        :return: list with a dict for every table, with keys ``table``,
+                 ``shapefile``, ``returncode``, ``seconds``, ``bytes`` and ``stderr``
+        :rtype: list
+        """
+
+        if not schema:
+            schema = self.ACTIVE_SCHEMA
+
+        if not output_folder:
+            output_folder = self.DATA_OUTBOX
+
+        if tables is None:
+            tables = list(self.all_spatial_tables_as_dict(schema=schema))
+
+        self._print(2, f"Exporting {len(tables)} tables with {jobs} pgsql2shp jobs")
+
+        results = []
+
+        with ThreadPoolExecutor(max_workers=max(int(jobs), 1)) as executor:
+            futures = [
+                executor.submit(
+                    self._pgsql2shp_process, table, schema, Path(output_folder), extra_args
+                )
+                for table in tables
+            ]
+
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+
+                if result["returncode"] == 0:
+                    size = human_readable_size(result["bytes"])
+                    msg = f"Exported {result['table']} ({size}) in {result['seconds']:,.1f} seconds"
+                    self._print(1, msg)
+                else:
+                    self._print(
+                        3,
+                        f"Exporting {result['table']} failed with code "
+                        f"{result['returncode']}:\n{result['stderr']}",
+                    )
+
+        failed = [r for r in results if r["returncode"] != 0]
+        total_bytes = sum(r["bytes"] for r in results)
+
+        msg = f"Exported {len(results) - len(failed)} of {len(results)} tables"
+        self._print(2, f"{msg} ({human_readable_size(total_bytes)})")
+
+        if check and failed:
+            raise subprocess.CalledProcessError(
+                failed[0]["returncode"], "pgsql2shp", stderr=failed[0]["stderr"]
+            )
+
+        return sorted(results, key=lambda r: r["table"])
+
+    def _pgsql2shp_process(
+        self, table_name: str, schema: str, output_folder: Path, extra_args: list = None
+    ) -> dict:
+        """
+        Run one ``pgsql2shp`` export for ``pgsql2shp_many()``
+        """
+
+        start_time = now()
+
+        table_folder = output_folder / table_name
+        table_folder.mkdir(parents=True, exist_ok=True)
+
+        output_file = table_folder / table_name
+
+        # Same connection arguments as pgsql2shp()
+        cmd = ["pgsql2shp", "-f", str(output_file)]
+        cmd += ["-h", str(self.HOST), "-p", str(self.PORT)]
+        cmd += ["-u", self.USER, "-P", self.PASSWORD]
+
+        for flag, val in extra_args or []:
+            cmd += [flag, str(val)] if str(val) else [flag]
+
+        cmd += [self.DATABASE, f"{schema}.{table_name}"]
+
+        process = subprocess.run(
+            cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+
+        return {
+            "table": table_name,
+            "shapefile": output_file.with_suffix(".shp"),
+            "returncode": process.returncode,
+            "seconds": (now() - start_time).total_seconds(),
+            "bytes": size_on_disk(table_folder),
+            "stderr": process.stderr.decode(errors="replace").strip(),
+        }
+
     def shp2pgsql(self, table_name: str, src_shapefile: Path, new_epsg: int = None) -> str:
         """
         TODO: Docstring
@@ -1263,8 +4075,8 @@ class PostgreSQL:
         # TODO: document default settings
         cmd = "shp2pgsql -d -e -I -S"
 
-        # Use geopandas to figure out the source EPSG
-        src_epsg = gpd.read_file(src_shapefile).crs.to_epsg()
+        # Read the source EPSG from the .prj, without loading the shapefile
+        src_epsg = epsg_from_prj(src_shapefile)
         if new_epsg:
             cmd += f" -s {src_epsg}:{new_epsg}"
         else:
@@ -1274,21 +4086,205 @@ class PostgreSQL:
         cmd += f" | psql {self.uri()}"
 
         os.system(cmd)
+        self.clear_catalog_cache()
+        self.invalidate_query_cache()
+
         return cmd
 
+    def shp2pgsql_many(
+        self,
+        shapefiles: Union[Path, list],
+        new_epsg: int = None,
+        schema: str = None,
+        jobs: int = 4,
+        check: bool = False,
+    ) -> list:
+        """
+        Load many shapefiles at once, with ``jobs`` ``shp2pgsql | psql``
+        pipelines running at the same time. Each table is named after
+        its shapefile, in lower case. Each source EPSG is read from the
+        ``.prj`` file, so the shapefiles never get loaded into Python.
+
+        Every pipeline is checked for its exit code and timed. Failed
+        loads are reported with their error output.
+
+            >>> db.shp2pgsql_many(Path("deliveries/counties"), jobs=8)
+
+        :param shapefiles: folder of shapefiles, or a list of ``.shp`` filepaths
+        :type shapefiles: Union[Path, list]
+        :param new_epsg: EPSG to reproject everything to, defaults to None
+        :type new_epsg: int, optional
+        :param schema: schema for the new tables, defaults to the active schema
+        :type schema: str, optional
+        :param jobs: number of shapefiles to load at once, defaults to 4
+        :type jobs: int, optional
+        :param check: flag to raise ``subprocess.CalledProcessError`` once
+                      every load is done if any of them failed, defaults to False
+        :type check: bool, optional
+        :return: list with a dict for every shapefile, with keys
+                 ``table``, ``shapefile``, ``returncode``, ``seconds`` and ``stderr``
+        :rtype: list
+        """
+
+        if not schema:
+            schema = self.ACTIVE_SCHEMA
+
+        if isinstance(shapefiles, (str, Path)) and Path(shapefiles).is_dir():
+            shapefiles = sorted(Path(shapefiles).glob("*.shp"))
+
+        shapefiles = [Path(shp) for shp in shapefiles]
+
+        self.add_schema(schema)
+
+        self._print(2, f"Loading {len(shapefiles)} shapefiles with {jobs} jobs")
+
+        results = []
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(int(jobs), 1)) as executor:
+                futures = [
+                    executor.submit(self._shp2pgsql_pipeline, shp, schema, new_epsg)
+                    for shp in shapefiles
+                ]
+
+                for future in as_completed(futures):
+                    result = future.result()
+                    results.append(result)
+
+                    if result["returncode"] == 0:
+                        self._print(
+                            1, f"Loaded {result['table']} in {result['seconds']:,.1f} seconds"
+                        )
+                    else:
+                        self._print(
+                            3,
+                            f"Loading {result['shapefile']} failed with code "
+                            f"{result['returncode']}:\n{result['stderr']}",
+                        )
+        finally:
+            self.clear_catalog_cache()
+            self.invalidate_query_cache()
+
+        failed = [r for r in results if r["returncode"] != 0]
+
+        self._print(2, f"Loaded {len(results) - len(failed)} of {len(results)} shapefiles")
+
+        if check and failed:
+            raise subprocess.CalledProcessError(
+                failed[0]["returncode"], "shp2pgsql | psql", stderr=failed[0]["stderr"]
+            )
+
+        return sorted(results, key=lambda r: r["table"])
+
+    def _shp2pgsql_pipeline(self, shapefile: Path, schema: str, new_epsg: int = None) -> dict:
+        """
+        Run one ``shp2pgsql | psql`` pipeline for ``shp2pgsql_many()``
+        """
+
+        table_name = shapefile.stem.lower()
+        start_time = now()
+
+        try:
+            src_epsg = epsg_from_prj(shapefile)
+        except ValueError as error:
+            return {
+                "table": table_name,
+                "shapefile": shapefile,
+                "returncode": 1,
+                "seconds": 0.0,
+                "stderr": str(error),
+            }
+
+        srid = f"{src_epsg}:{new_epsg}" if new_epsg else f"{src_epsg}"
+
+        # Drop the old table here instead of with 'shp2pgsql -d', since
+        # older versions drop it without IF EXISTS, which would stop psql
+        self.execute(f"DROP TABLE IF EXISTS {schema}.{quote_identifier(table_name)};")
+
+        # Same settings as shp2pgsql(), with the table in the requested schema
+        shp2pgsql_cmd = ["shp2pgsql", "-c", "-e", "-I", "-S", "-s", srid]
+        shp2pgsql_cmd += [str(shapefile.with_suffix("")), f"{schema}.{table_name}"]
+
+        psql_cmd = ["psql", "--quiet", "--no-psqlrc", "--set", "ON_ERROR_STOP=1"]
+        psql_cmd += ["--dbname", self.uri()]
+
+        with tempfile.TemporaryFile() as shp2pgsql_stderr:
+            shp2pgsql = subprocess.Popen(
+                shp2pgsql_cmd, stdout=subprocess.PIPE, stderr=shp2pgsql_stderr
+            )
+            psql = subprocess.Popen(
+                psql_cmd, stdin=shp2pgsql.stdout, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+            )
+
+            # Let shp2pgsql see a broken pipe if psql exits early
+            shp2pgsql.stdout.close()
+
+            _, psql_stderr = psql.communicate()
+            shp2pgsql.wait()
+
+            shp2pgsql_stderr.seek(0)
+            stderr = shp2pgsql_stderr.read() + psql_stderr
+
+        return {
+            "table": table_name,
+            "shapefile": shapefile,
+            "returncode": shp2pgsql.returncode or psql.returncode,
+            "seconds": (now() - start_time).total_seconds(),
+            "stderr": stderr.decode(errors="replace").strip(),
+        }
+
     # TRANSFER data to another database
     # ---------------------------------
 
     def transfer_data_to_another_db(
-        self, table_name: str, other_postgresql_db, schema: str = None
-    ) -> None:
+        self,
+        table_name: str,
+        other_postgresql_db,
+        schema: str = None,
+        use_copy: bool = True,
+        jobs: int = 1,
+        split_column: str = None,
+        if_exists: str = None,
+        copy_format: str = "binary",
+    ) -> int:
         """
         Copy data from one SQL database to another.
 
+        By default the table is streamed with ``COPY ... TO STDOUT`` from
+        this database directly into ``COPY ... FROM STDIN`` on the other
+        one, without going through ``pandas``. The table definition
+        (including the geometry type and SRID), its constraints, indexes,
+        serial sequences and identity columns are recreated on the target.
+        Rows are loaded into a staging table that only takes the target's
+        name once every row is in, so a failed transfer leaves any existing
+        table untouched.
+
+        Use ``jobs`` to copy a large table over several connections at once.
+        Each worker copies one range of ``split_column`` (a numeric column,
+        like ``uid``) or, if no column is given, one range of the table's
+        physical pages. All workers read from the same snapshot.
+
         :param table_name: Name of the table to copy
         :type table_name: str
         :param other_postgresql_db: ``PostgreSQL()`` object for target database
         :type other_postgresql_db: PostgreSQL
+        :param use_copy: flag to pipe the data with ``COPY`` instead of
+                         going through a (geo)dataframe, defaults to True
+        :type use_copy: bool, optional
+        :param jobs: number of parallel connections, defaults to 1
+        :type jobs: int, optional
+        :param split_column: numeric column used to split the table into
+                             ranges, defaults to None
+        :type split_column: str, optional
+        :param if_exists: ``"fail"`` or ``"replace"``. Defaults to None, which
+                          replaces spatial tables and fails on tabular ones,
+                          the same as ``import_geodataframe()`` and
+                          ``import_dataframe()``
+        :type if_exists: str, optional
+        :param copy_format: ``"binary"`` or ``"text"``, defaults to "binary"
+        :type copy_format: str, optional
+        :return: number of rows copied
+        :rtype: int
         """
 
         if not schema:
@@ -1296,15 +4292,515 @@ class PostgreSQL:
 
         query = f"SELECT * FROM {schema}.{table_name}"
 
-        # If the data is spatial use a geodataframe
-        if table_name in self.all_spatial_tables_as_dict():
-            gdf = self.query_as_geo_df(query)
-            other_postgresql_db.import_geodataframe(gdf, table_name)
+        is_spatial = table_name in self.all_spatial_tables_as_dict(schema=schema)
+
+        if not use_copy:
+            # If the data is spatial use a geodataframe
+            if is_spatial:
+                gdf = self.query_as_geo_df(query)
+                other_postgresql_db.import_geodataframe(gdf, table_name)
+                return len(gdf)
+
+            # Otherwise use a normal dataframe
+            else:
+                df = self.query_as_df(query)
+                other_postgresql_db.import_dataframe(df, table_name)
+                return len(df)
+
+        if not if_exists:
+            if_exists = "replace" if is_spatial else "fail"
 
-        # Otherwise use a normal dataframe
+        return self._transfer_with_copy(
+            table_name,
+            other_postgresql_db,
+            schema=schema,
+            jobs=jobs,
+            split_column=split_column,
+            if_exists=if_exists,
+            copy_format=copy_format,
+        )
+
+    def _table_structure(self, table_name: str, schema: str) -> dict:
+        """
+        Read everything needed to recreate a table somewhere else.
+
+        :param table_name: Name of the table
+        :type table_name: str
+        :param schema: name of the schema
+        :type schema: str
+        :return: dictionary with ``columns``, ``sequences``,
+                 ``identities``, ``constraints`` and ``indexes``
+        :rtype: dict
+        """
+
+        regclass = f"'{schema}.{table_name}'::regclass"
+
+        sql_columns = f"""
+            SELECT a.attname,
+                   format_type(a.atttypid, a.atttypmod),
+                   a.attnotnull,
+                   pg_get_expr(d.adbin, d.adrelid),
+                   a.attidentity
+            FROM pg_attribute a
+            LEFT JOIN pg_attrdef d
+                ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+            WHERE a.attrelid = {regclass}
+                AND a.attnum > 0
+                AND NOT a.attisdropped
+            ORDER BY a.attnum;
+        """
+
+        sql_constraints = f"""
+            SELECT conname, pg_get_constraintdef(oid)
+            FROM pg_constraint
+            WHERE conrelid = {regclass}
+                AND contype IN ('p', 'u', 'c', 'x')
+            ORDER BY contype;
+        """
+
+        sql_indexes = f"""
+            SELECT pg_get_indexdef(i.indexrelid)
+            FROM pg_index i
+            WHERE i.indrelid = {regclass}
+                AND NOT EXISTS (
+                    SELECT 1 FROM pg_constraint c
+                    WHERE c.conindid = i.indexrelid
+                );
+        """
+
+        columns = []
+        sequences = {}
+        identities = {}
+
+        for name, data_type, not_null, default, identity in self.query_as_list(sql_columns):
+            # Serial columns point at a sequence that
+            # will need to be created on the other side
+            if default:
+                match = re.match(r"nextval\('(.+)'::regclass\)", default)
+                if match:
+                    sequences[name] = match.group(1)
+
+            # Identity columns have no default, just a flag
+            if identity == "a":
+                identities[name] = "ALWAYS"
+            elif identity == "d":
+                identities[name] = "BY DEFAULT"
+
+            columns.append(
+                {"name": name, "type": data_type, "not_null": not_null, "default": default}
+            )
+
+        structure = {
+            "columns": columns,
+            "sequences": sequences,
+            "identities": identities,
+            "constraints": self.query_as_list(sql_constraints),
+            "indexes": [i[0] for i in self.query_as_list(sql_indexes)],
+        }
+
+        return structure
+
+    def _transfer_with_copy(
+        self,
+        table_name: str,
+        other_postgresql_db,
+        schema: str,
+        jobs: int = 1,
+        split_column: str = None,
+        if_exists: str = "fail",
+        copy_format: str = "binary",
+        target_schema: str = None,
+    ) -> int:
+        """
+        Pipe a table into another database with ``COPY``.
+        See ``transfer_data_to_another_db()`` for details.
+
+        The table lands in ``target_schema``, which defaults
+        to the other database's active schema.
+        """
+
+        if if_exists not in ["fail", "replace"]:
+            raise ValueError(f"'{if_exists}' is not valid for if_exists")
+
+        if copy_format not in ["binary", "text"]:
+            raise ValueError(f"'{copy_format}' is not valid for copy_format")
+
+        target_db = other_postgresql_db
+
+        if not target_schema:
+            target_schema = target_db.ACTIVE_SCHEMA
+
+        source_table = f"{schema}.{table_name}"
+        target_table = f"{target_schema}.{table_name}"
+
+        same_database = target_db.uri() == self.uri()
+
+        if same_database and target_schema == schema:
+            raise ValueError(f"Can't transfer {source_table} onto itself")
+
+        msg = f"Transferring {source_table} to {target_table} on {target_db.DATABASE}"
+        self._print(2, msg)
+
+        structure = self._table_structure(table_name, schema)
+
+        column_names = ", ".join(quote_identifier(c["name"]) for c in structure["columns"])
+
+        # Build a staging table on the target
+        # -----------------------------------
+        # The rows go into a table with a throwaway name, which only replaces
+        # the target once everything is in. Sequences, identity columns,
+        # constraints and indexes are added at that point too.
+        target_db.add_schema(target_schema)
+
+        staging_name = f"_{table_name}_{uuid.uuid4().hex[:8]}"
+        staging_table = f"{target_schema}.{staging_name}"
+
+        # Serial sequences move into the target schema along with the table
+        sequences = {
+            column: f"{target_schema}.{sequence.split('.')[-1]}"
+            for column, sequence in structure["sequences"].items()
+        }
+
+        column_definitions = []
+        for column in structure["columns"]:
+            definition = f"{quote_identifier(column['name'])} {column['type']}"
+            if column["default"] and column["name"] not in sequences:
+                definition += f" DEFAULT {column['default']}"
+            if column["not_null"]:
+                definition += " NOT NULL"
+            column_definitions.append(definition)
+
+        column_definitions = ",\n    ".join(column_definitions)
+
+        with target_db.connection() as connection:
+            cursor = connection.cursor()
+
+            cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (target_table,))
+            if cursor.fetchone()[0] and if_exists == "fail":
+                raise ValueError(f"Table '{table_name}' already exists.")
+
+            cursor.execute(f"CREATE TABLE {staging_table} (\n    {column_definitions}\n);")
+
+            cursor.close()
+
+        try:
+            rows = self._copy_into_staging_table(
+                source_table,
+                target_db,
+                staging_table,
+                column_names,
+                jobs=jobs,
+                split_column=split_column,
+                copy_format=copy_format,
+            )
+
+            # Swap the staging table in and rebuild everything else
+            # ------------------------------------------------------
+            sql_finish = []
+
+            if if_exists == "replace":
+                sql_finish.append(f"DROP TABLE IF EXISTS {target_table} CASCADE;")
+
+            sql_finish.append(f"ALTER TABLE {staging_table} RENAME TO {table_name};")
+
+            for column, sequence in sequences.items():
+                col = quote_identifier(column)
+                sql_finish.append(
+                    f"""
+                    CREATE SEQUENCE IF NOT EXISTS {sequence};
+                    ALTER TABLE {target_table}
+                        ALTER COLUMN {col} SET DEFAULT nextval('{sequence}'::regclass);
+                    ALTER SEQUENCE {sequence} OWNED BY {target_table}.{col};
+                    SELECT setval('{sequence}', COALESCE(MAX({col}), 1), MAX({col}) IS NOT NULL)
+                    FROM {target_table};
+                """
+                )
+
+            for column, identity in structure["identities"].items():
+                col = quote_identifier(column)
+                literal_column = column.replace("'", "''")
+                sql_finish.append(
+                    f"""
+                    ALTER TABLE {target_table}
+                        ALTER COLUMN {col} ADD GENERATED {identity} AS IDENTITY;
+                    SELECT setval(
+                        pg_get_serial_sequence('{target_table}', '{literal_column}'),
+                        COALESCE(MAX({col}), 1),
+                        MAX({col}) IS NOT NULL
+                    )
+                    FROM {target_table};
+                """
+                )
+
+            for name, definition in structure["constraints"]:
+                sql_finish.append(
+                    f"ALTER TABLE {target_table} "
+                    f"ADD CONSTRAINT {quote_identifier(name)} {definition};"
+                )
+
+            for definition in structure["indexes"]:
+                if target_schema != schema:
+                    definition = definition.replace(f" ON {source_table} ", f" ON {target_table} ")
+                    definition = definition.replace(
+                        f" ON ONLY {source_table} ", f" ON ONLY {target_table} "
+                    )
+                sql_finish.append(f"{definition};")
+
+            sql_finish.append(f"ANALYZE {target_table};")
+
+            target_db.execute("\n".join(sql_finish))
+
+        except Exception:
+            # Nothing was swapped in, so any existing table is untouched
+            target_db.execute(f"DROP TABLE IF EXISTS {staging_table} CASCADE;")
+            raise
+
+        self._print(2, f"Transferred {rows:,} rows into {target_table}")
+
+        return rows
+
+    def _copy_into_staging_table(
+        self,
+        source_table: str,
+        target_db,
+        staging_table: str,
+        column_names: str,
+        jobs: int,
+        split_column: str,
+        copy_format: str,
+    ) -> int:
+        """
+        Stream the rows of ``source_table`` into ``staging_table`` on
+        ``target_db``, over ``jobs`` connections that all read from the
+        same snapshot. See ``transfer_data_to_another_db()``.
+
+        :return: number of rows copied
+        :rtype: int
+        """
+
+        # Decide how to split the work
+        # ----------------------------
+        jobs = max(int(jobs), 1)
+
+        # Each worker needs a source and a target connection. If they come
+        # from the same pool, make sure there's room for both at once.
+        if target_db._pool() is self._pool():
+            jobs = min(jobs, max((self.POOL_SETTINGS["max_size"] - 1) // 2, 1))
+
+        if jobs > 1 and split_column:
+            low, high = self.query_as_list(
+                f"SELECT MIN({split_column}), MAX({split_column}) FROM {source_table};"
+            )[0]
+            conditions = range_conditions(split_column, low, high, jobs)
+
+        elif jobs > 1:
+            pages = self.query_as_single_item(
+                f"""
+                SELECT pg_relation_size('{source_table}')
+                       / current_setting('block_size')::int;
+            """
+            )
+            conditions = ctid_conditions(pages, jobs)
+
+        else:
+            conditions = [None]
+
+        # Copy each range
+        # ---------------
+        with_options = "(FORMAT binary)" if copy_format == "binary" else "(FORMAT text)"
+        sql_copy_from = f"COPY {staging_table} ({column_names}) FROM STDIN WITH {with_options}"
+
+        def copy_range(condition, snapshot=None):
+            where_clause = f"WHERE {condition}" if condition else ""
+            sql_copy_to = f"""
+                COPY (SELECT {column_names} FROM {source_table} {where_clause})
+                TO STDOUT WITH {with_options}
+            """
+
+            with self.connection() as source, target_db.connection() as target:
+                source_cursor = source.cursor()
+                if snapshot:
+                    source_cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ;")
+                    source_cursor.execute("SET TRANSACTION SNAPSHOT %s;", (snapshot,))
+
+                rows = pipe_copy(source_cursor, sql_copy_to, target.cursor(), sql_copy_from)
+
+            self._print(1, f"Copied {rows:,} rows of {source_table} {where_clause}")
+
+            return rows
+
+        if len(conditions) == 1:
+            return copy_range(conditions[0])
+
+        # Hold a transaction open so that every worker sees the same data
+        with self.connection() as coordinator:
+            cursor = coordinator.cursor()
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ;")
+            cursor.execute("SELECT pg_export_snapshot();")
+            snapshot = cursor.fetchone()[0]
+
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                results = executor.map(
+                    lambda condition: copy_range(condition, snapshot), conditions
+                )
+                return sum(results)
+
+    def transfer_tables_to_another_db(
+        self,
+        other_postgresql_db,
+        tables: list = None,
+        schema: str = None,
+        target_schema: str = None,
+        max_workers: int = 4,
+        if_exists: str = "replace",
+        copy_format: str = "binary",
+    ) -> pd.DataFrame:
+        """
+        Copy many tables (or a whole schema) to another database at once.
+
+        Tables are listed once, ordered so that tables referenced by
+        foreign keys go first, and then copied concurrently with up to
+        ``max_workers`` tables in flight. Foreign keys between the copied
+        tables are recreated at the end. A table that fails to copy
+        doesn't stop the others; check the ``status`` column of the report.
+
+        :param other_postgresql_db: ``PostgreSQL()`` object for target database
+        :type other_postgresql_db: PostgreSQL
+        :param tables: names of the tables to copy, defaults to None
+                       which copies every table in the schema
+        :type tables: list, optional
+        :param schema: schema to copy from, defaults to the active schema
+        :type schema: str, optional
+        :param target_schema: schema to copy into, defaults to ``schema``
+        :type target_schema: str, optional
+        :param max_workers: number of tables to copy at once, defaults to 4
+        :type max_workers: int, optional
+        :param if_exists: ``"fail"`` or ``"replace"``, defaults to "replace"
+        :type if_exists: str, optional
+        :param copy_format: ``"binary"`` or ``"text"``, defaults to "binary"
+        :type copy_format: str, optional
+        :return: report with one row per table
+        :rtype: pd.DataFrame
+        """
+
+        if not schema:
+            schema = self.ACTIVE_SCHEMA
+
+        if not target_schema:
+            target_schema = schema
+
+        target_db = other_postgresql_db
+
+        # List the tables once, skipping anything that belongs
+        # to an extension (like PostGIS's spatial_ref_sys)
+        sql_base_tables = f"""
+            SELECT c.relname
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = '{schema}'
+                AND c.relkind = 'r'
+                AND NOT EXISTS (
+                    SELECT 1 FROM pg_depend d
+                    WHERE d.objid = c.oid AND d.deptype = 'e'
+                )
+            ORDER BY c.relname;
+        """
+        base_tables = [t[0] for t in self.query_as_list(sql_base_tables)]
+
+        if tables is None:
+            tables = base_tables
         else:
-            df = self.query_as_df(query)
-            other_postgresql_db.import_dataframe(df, table_name)
+            missing = [t for t in tables if t not in base_tables]
+            if missing:
+                raise ValueError(f"Tables not found in schema '{schema}': {missing}")
+
+        sql_foreign_keys = f"""
+            SELECT child.relname, parent.relname, con.conname, pg_get_constraintdef(con.oid)
+            FROM pg_constraint con
+            JOIN pg_class child ON child.oid = con.conrelid
+            JOIN pg_class parent ON parent.oid = con.confrelid
+            JOIN pg_namespace n ON n.oid = child.relnamespace
+            WHERE con.contype = 'f'
+                AND n.nspname = '{schema}';
+        """
+        foreign_keys = [
+            fk for fk in self.query_as_list(sql_foreign_keys) if fk[0] in tables and fk[1] in tables
+        ]
+
+        dependencies = [(child, parent) for child, parent, _, _ in foreign_keys]
+        levels = dependency_levels(tables, dependencies)
+
+        # Each table needs a source and a target connection. If they come
+        # from the same pool, make sure there's room for both at once.
+        max_workers = max(int(max_workers), 1)
+        if target_db._pool() is self._pool():
+            max_workers = min(max_workers, max(self.POOL_SETTINGS["max_size"] // 2, 1))
+
+        self._print(2, f"Transferring {len(tables)} tables from {schema} to {target_db.DATABASE}")
+
+        def transfer(table_name):
+            start_time = now()
+            result = {"table": table_name, "rows": None, "status": "done", "error": None}
+
+            try:
+                result["rows"] = self._transfer_with_copy(
+                    table_name,
+                    target_db,
+                    schema=schema,
+                    if_exists=if_exists,
+                    copy_format=copy_format,
+                    target_schema=target_schema,
+                )
+            except Exception as error:
+                result["status"] = "failed"
+                result["error"] = str(error)
+
+            result["seconds"] = (now() - start_time).total_seconds()
+
+            return result
+
+        report = []
+
+        with RichProgress(console=_console, disable=self.VERBOSITY == "errors") as progress:
+            task = progress.add_task(
+                total=len(tables), description=f"Transferring {len(tables)} tables"
+            )
+
+            for level in levels:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for result in executor.map(transfer, level):
+                        report.append(result)
+                        progress.advance(task)
+
+        # Recreate foreign keys between tables that made it across
+        copied = {r["table"] for r in report if r["status"] == "done"}
+
+        for child, parent, name, definition in foreign_keys:
+            if child in copied and parent in copied:
+                target_db.execute(
+                    f"""
+                    ALTER TABLE {target_schema}.{child}
+                    ADD CONSTRAINT {quote_identifier(name)} {definition};
+                """
+                )
+
+        report = pd.DataFrame(report, columns=["table", "rows", "seconds", "status", "error"])
+
+        # Failed tables have no row count, which would turn the column into floats
+        report["rows"] = report["rows"].astype("Int64")
+
+        for _, row in report.iterrows():
+            if row["status"] == "done":
+                msg = f"{row['table']}: {int(row['rows']):,} rows in {row['seconds']:.1f}s"
+                self._print(1, msg)
+            else:
+                self._print(3, f"{row['table']}: FAILED - {row['error']}")
+
+        total_rows = int(report["rows"].fillna(0).sum())
+        msg = f"Transferred {len(copied)} of {len(tables)} tables ({total_rows:,} rows)"
+        self._print(2, msg)
+
+        return report
 
 
 def connect_via_uri(
@@ -1367,3 +4863,33 @@ def connect_via_uri(
     }
 
     return PostgreSQL(db_name, **values)
+
+
+def _stringify_booleans(gdf: gpd.GeoDataFrame, columns: list) -> gpd.GeoDataFrame:
+    """ Shapefiles can't hold boolean columns, so write them as
+    ``"True"`` / ``"False"`` strings, keeping NULLs as NULL """
+
+    def stringify(value):
+        return None if pd.isna(value) else str(bool(value))
+
+    columns = [c for c in columns if c in gdf.columns]
+
+    if columns:
+        gdf = gdf.assign(**{c: gdf[c].map(stringify).astype(object) for c in columns})
+
+    return gdf
+
+
+def _export_shapefile_in_process(
+    db_kwargs: dict, table_name: str, output_folder: Path, chunk_size: int = None
+) -> None:
+    """
+    Export one table from a worker process. Connections can't be
+    shared between processes, so each worker opens its own.
+    """
+    db = PostgreSQL(**db_kwargs)
+
+    try:
+        db.export_shapefile(table_name, output_folder, chunk_size=chunk_size)
+    finally:
+        db.close_connections()
@@ -1,4 +1,5 @@
 from .PgSQL import PostgreSQL
+from .AsyncPgSQL import AsyncPostgreSQL
 from .config_helpers import make_config_file, read_config_file, configurations
 from .geopandas_helpers import spatialize_point_dataframe
 from .raw_data import DataSource
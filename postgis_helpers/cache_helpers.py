@@ -0,0 +1,206 @@
+"""
+Summary of ``cache_helpers.py``
+-------------------------------
+
+Re-running the same query over tables that haven't changed
+means pulling the same rows over the network again. This module
+provides an opt-in, size-bounded cache that saves query results
+to local Parquet (or GeoParquet) files.
+
+``PostgreSQL()`` builds each cache key from the normalized SQL and
+a fingerprint of every table the query reads, so any change to
+those tables produces a new key. The least recently used
+results are deleted once the cache grows past ``max_bytes``.
+
+Requires ``pyarrow`` for reading and writing Parquet files.
+"""
+import os
+import json
+import uuid
+import hashlib
+import threading
+
+import pandas as pd
+import geopandas as gpd
+
+from pathlib import Path
+from typing import Union
+
+from .config_helpers import DEFAULT_QUERY_CACHE
+
+
+# Default size limit for the cache folder: 5 GB
+QUERY_CACHE_MAX_BYTES = 5 * 1024 ** 3
+
+
+def normalize_sql(query: str) -> str:
+    """
+    Strip leading/trailing whitespace and trailing semicolons.
+    Nothing inside the query is touched, since whitespace can
+    matter in string literals and newlines end ``--`` comments.
+
+    :param query: any valid SQL query string
+    :type query: str
+    :return: normalized query
+    :rtype: str
+    """
+    return query.strip().rstrip(";").strip()
+
+
+class QueryResultCache:
+    """
+    Save dataframes and geodataframes to a folder of Parquet files,
+    with least-recently-used eviction once the folder is too big.
+
+    Each result ``{key}.parquet`` has a ``{key}.json`` sidecar that
+    lists the tables it was read from, which is used by ``invalidate()``.
+    """
+
+    def __init__(
+        self, folder: Path = DEFAULT_QUERY_CACHE, max_bytes: int = QUERY_CACHE_MAX_BYTES
+    ):
+        """
+        :param folder: where to keep the cached files,
+                       defaults to ``DEFAULT_QUERY_CACHE``
+        :type folder: Path, optional
+        :param max_bytes: size limit for all cached files together,
+                          defaults to ``QUERY_CACHE_MAX_BYTES`` (5 GB)
+        :type max_bytes: int, optional
+        """
+        self.FOLDER = Path(folder)
+        self.MAX_BYTES = int(max_bytes)
+
+        self.FOLDER.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """
+        Hash anything JSON-serializable into a cache key.
+
+        :return: hex digest
+        :rtype: str
+        """
+        return hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()
+
+    def _paths(self, key: str) -> tuple:
+        return self.FOLDER / f"{key}.parquet", self.FOLDER / f"{key}.json"
+
+    def get(self, key: str) -> Union[pd.DataFrame, gpd.GeoDataFrame, None]:
+        """
+        Load a cached result.
+
+        :param key: cache key
+        :type key: str
+        :return: the cached result, or None if there isn't one
+        """
+        data_path, meta_path = self._paths(key)
+
+        try:
+            with open(meta_path) as open_file:
+                meta = json.load(open_file)
+
+            if meta["spatial"]:
+                result = gpd.read_parquet(data_path)
+            else:
+                result = pd.read_parquet(data_path)
+
+            # Mark it as recently used
+            os.utime(data_path)
+
+        except (FileNotFoundError, ValueError):
+            return None
+
+        return result
+
+    def put(self, key: str, result: pd.DataFrame, tables: list = None) -> None:
+        """
+        Save a result, then evict old results if the cache is too big.
+
+        :param key: cache key
+        :type key: str
+        :param result: dataframe or geodataframe to save
+        :type result: pd.DataFrame
+        :param tables: tables the result was read from, defaults to None
+        :type tables: list, optional
+        """
+        data_path, meta_path = self._paths(key)
+
+        meta = {
+            "spatial": isinstance(result, gpd.GeoDataFrame),
+            "tables": sorted(tables or []),
+        }
+
+        # Write to a temporary name first, so that a reader
+        # never sees a half-written file
+        tmp_path = self.FOLDER / f".{key}.{uuid.uuid4().hex}.tmp"
+
+        try:
+            result.to_parquet(tmp_path)
+            os.replace(tmp_path, data_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        with open(meta_path, "w") as open_file:
+            json.dump(meta, open_file)
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """ Delete the least recently used results until the cache fits """
+
+        with self._lock:
+            files = []
+            for data_path in self.FOLDER.glob("*.parquet"):
+                try:
+                    stat = data_path.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, data_path))
+
+            total = sum(size for _, size, _ in files)
+
+            for _, size, data_path in sorted(files):
+                if total <= self.MAX_BYTES:
+                    break
+
+                self._delete(data_path.stem)
+                total -= size
+
+    def _delete(self, key: str) -> None:
+        for path in self._paths(key):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def invalidate(self, tables: list = None) -> int:
+        """
+        Delete cached results. Pass ``tables`` (like ``["public.roads"]``)
+        to only delete the results that were read from those tables.
+
+        :param tables: list of ``schema.table`` names, defaults to None
+                       which deletes everything
+        :type tables: list, optional
+        :return: number of results that were deleted
+        :rtype: int
+        """
+        deleted = 0
+
+        for meta_path in list(self.FOLDER.glob("*.json")):
+            if tables is not None:
+                try:
+                    with open(meta_path) as open_file:
+                        meta = json.load(open_file)
+                except (FileNotFoundError, ValueError):
+                    continue
+
+                if not set(meta["tables"]) & set(tables):
+                    continue
+
+            self._delete(meta_path.stem)
+            deleted += 1
+
+        return deleted
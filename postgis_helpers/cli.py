@@ -1,7 +1,9 @@
 import click
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from postgis_helpers.PgSQL import PostgreSQL
+from postgis_helpers.general_helpers import now, size_on_disk, human_readable_size
 from postgis_helpers.config_helpers import (
     configurations,
     make_config_file,
@@ -55,12 +57,83 @@ def init(filepath, overwrite):
 # -------------------------------------
 
 
+def _pg_dump_options(command):
+    """ Add the options that get passed through to pg_dump """
+
+    options = [
+        click.option(
+            "--format",
+            "dump_format",
+            help="pg_dump output format.",
+            default="plain",
+            show_default=True,
+            type=click.Choice(["plain", "custom", "directory", "tar"]),
+        ),
+        click.option(
+            "--compress",
+            "compression",
+            help="pg_dump compression level (0-9) or method.",
+            default=None,
+        ),
+        click.option(
+            "--dump-jobs",
+            help="Number of tables pg_dump works on at once (directory format only).",
+            default=1,
+            show_default=True,
+            type=click.IntRange(min=1),
+        ),
+    ]
+
+    for option in reversed(options):
+        command = option(command)
+
+    return command
+
+
+def _backup_database(
+    dbname: str, cluster: dict, output_folder: Path, dump_kwargs: dict = None
+) -> dict:
+    """
+    Dump a single database. This runs inside a worker process,
+    so it makes its own connection to the cluster.
+
+    :return: dictionary with the database name, output path,
+             size in bytes, runtime in seconds, and any error
+    :rtype: dict
+    """
+    start_time = now()
+    result = {"dbname": dbname, "path": None, "bytes": 0, "error": None}
+
+    try:
+        # We already know the database exists, so skip that check
+        db = PostgreSQL(
+            dbname, **dict(cluster, verbosity="errors", create_if_missing=False)
+        )
+        result["path"] = db.db_export_pgdump_file(output_folder, **(dump_kwargs or {}))
+        result["bytes"] = size_on_disk(result["path"])
+    except Exception as error:
+        result["error"] = str(error)
+
+    result["seconds"] = (now() - start_time).total_seconds()
+
+    return result
+
+
 @main.command()
 @click.argument("host", default="localhost")
 @click.option(
     "--folder", "-f", help="Folder where the output SQL files will be stored."
 )
-def db_backup_all(host, folder):
+@click.option(
+    "--jobs",
+    "-j",
+    help="Number of databases to back up at the same time.",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+)
+@_pg_dump_options
+def db_backup_all(host, folder, jobs, dump_format, compression, dump_jobs):
     """Back all databases up on a given HOST
     using PostgreSQL().db_export_pgdump_file()
 
@@ -85,19 +158,56 @@ def db_backup_all(host, folder):
     if not output_folder.exists():
         output_folder.mkdir(parents=True)
 
+    dump_kwargs = {"dump_format": dump_format, "compression": compression, "jobs": dump_jobs}
+
     # Loop through all dbs on cluster, exporting all except the super db
-    all_dbs = super_db.all_databases_on_cluster_as_list()
+    all_dbs = [d for d in super_db.all_databases_on_cluster_as_list() if d != super_db_name]
+
+    start_time = now()
+    total_bytes = 0
+    failures = []
 
     with RichProgress(console=_console) as progress:
         task = progress.add_task(
             total=len(all_dbs), description=f"Exporting {len(all_dbs)} dbs"
         )
-        for dbname in all_dbs:
-            if dbname != super_db_name:
-                db = PostgreSQL(dbname, **this_cluster)
-                db.db_export_pgdump_file(output_folder)
 
-                progress.advance(task)
+        def report(result):
+            nonlocal total_bytes
+
+            if result["error"]:
+                failures.append(result["dbname"])
+                msg = f":x: {result['dbname']} failed: {result['error']}"
+            else:
+                total_bytes += result["bytes"]
+                size = human_readable_size(result["bytes"])
+                msg = f":floppy_disk: {result['dbname']}: {size} in {result['seconds']:.1f}s"
+
+            progress.console.print(msg)
+            progress.advance(task)
+
+        if jobs == 1:
+            for dbname in all_dbs:
+                report(_backup_database(dbname, this_cluster, output_folder, dump_kwargs))
+
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [
+                    executor.submit(
+                        _backup_database, dbname, this_cluster, output_folder, dump_kwargs
+                    )
+                    for dbname in all_dbs
+                ]
+                for future in as_completed(futures):
+                    report(future.result())
+
+    seconds = (now() - start_time).total_seconds()
+    msg = f":checkered_flag: Exported {len(all_dbs) - len(failures)} of {len(all_dbs)} dbs"
+    msg += f" ({human_readable_size(total_bytes)}) in {seconds:.1f}s"
+    _console.print(msg)
+
+    if failures:
+        raise click.ClickException(f"Backups failed for: {', '.join(failures)}")
 
 
 # BACK UP A SINGLE DATABASE
@@ -108,7 +218,8 @@ def db_backup_all(host, folder):
 @click.argument("database_name")
 @click.argument("host", default="localhost")
 @click.option("--folder", "-f", help="Folder where the output SQL file will be stored.")
-def db_backup_single(database_name, host, folder):
+@_pg_dump_options
+def db_backup_single(database_name, host, folder, dump_format, compression, dump_jobs):
     """Back up DATABASE_NAME from HOST (to an optional FOLDER)
 
     HOST can be any named profile in the configuration
@@ -136,7 +247,9 @@ def db_backup_single(database_name, host, folder):
     for dbname in super_db.all_databases_on_cluster_as_list():
         if dbname != super_db_name:
             db = PostgreSQL(dbname, **this_cluster)
-            db.db_export_pgdump_file(output_folder)
+            db.db_export_pgdump_file(
+                output_folder, dump_format=dump_format, compression=compression, jobs=dump_jobs
+            )
 
 
 if __name__ == "__main__":
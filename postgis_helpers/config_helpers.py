@@ -20,6 +20,7 @@ from .console import _console
 DATA_ROOT = Path.home() / "sql_data_io"
 DEFAULT_DATA_INBOX = DATA_ROOT / "inbox"
 DEFAULT_DATA_OUTBOX = DATA_ROOT / "outbox"
+DEFAULT_QUERY_CACHE = DATA_ROOT / "query_cache"
 
 DB_CONFIG_FILEPATH = DATA_ROOT / "database_connections.cfg"
 
@@ -0,0 +1,335 @@
+"""
+Summary of ``connection_helpers.py``
+------------------------------------
+
+Opening a new ``psycopg2`` connection means paying for a
+TCP handshake, authentication and (often) SSL negotiation.
+This module provides a small, thread-safe connection pool
+that keeps idle connections around so that they can be
+reused by many small queries.
+
+Pools can be private to a single ``PostgreSQL()`` object,
+or shared across the whole process (keyed by the
+connection URI) via ``shared_pool()``. ``pool_engine()``
+gives ``sqlalchemy`` (and so ``pandas``) a way to borrow
+from the same pool instead of opening its own connections.
+"""
+import os
+import time
+import threading
+from contextlib import contextmanager
+
+import psycopg2
+import psycopg2.extensions
+import sqlalchemy
+
+
+class ConnectionPool:
+    """
+    Keep a bounded number of ``psycopg2`` connections to a single URI.
+
+    Idle connections are closed once they have been idle for
+    longer than ``idle_timeout`` seconds. When ``health_check``
+    is enabled, a connection that has been idle for longer than
+    ``health_check_interval`` seconds is tested with ``SELECT 1``
+    before it is handed back out.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        min_size: int = 0,
+        max_size: int = 5,
+        idle_timeout: float = 300,
+        health_check: bool = True,
+        health_check_interval: float = 30,
+    ):
+        """
+        :param uri: connection string URI for PostgreSQL
+        :type uri: str
+        :param min_size: number of idle connections that are never
+                         closed due to the idle timeout, defaults to 0
+        :type min_size: int, optional
+        :param max_size: maximum number of connections that can be
+                         open at once, defaults to 5
+        :type max_size: int, optional
+        :param idle_timeout: seconds before an idle connection is closed,
+                             defaults to 300
+        :type idle_timeout: float, optional
+        :param health_check: flag to ping stale connections before
+                             reusing them, defaults to True
+        :type health_check: bool, optional
+        :param health_check_interval: seconds of idleness after which
+                                      a connection gets pinged, defaults to 30
+        :type health_check_interval: float, optional
+        """
+
+        if int(max_size) < 1:
+            raise ValueError("max_size must be at least 1")
+
+        if int(min_size) > int(max_size):
+            raise ValueError("min_size cannot be larger than max_size")
+
+        self.URI = uri
+        self.MIN_SIZE = int(min_size)
+        self.MAX_SIZE = int(max_size)
+        self.IDLE_TIMEOUT = float(idle_timeout)
+        self.HEALTH_CHECK = health_check
+        self.HEALTH_CHECK_INTERVAL = float(health_check_interval)
+
+        self._idle = []  # list of (connection, time it was returned)
+        self._in_use = set()
+        self._retired = set()  # in use during close(), closed when returned
+        self._lock = threading.Condition()
+        self._pid = os.getpid()
+
+    def _forget_if_forked(self) -> None:
+        """
+        Connections can't be shared with a forked child process.
+        Drop (but don't close) anything inherited from the parent,
+        since closing it would also close the parent's socket.
+        """
+        if self._pid != os.getpid():
+            self._idle = []
+            self._in_use = set()
+            self._retired = set()
+            self._pid = os.getpid()
+
+    def _is_healthy(self, connection, idle_since: float) -> bool:
+        """ Confirm that an idle connection is still usable """
+
+        if connection.closed:
+            return False
+
+        if not self.HEALTH_CHECK:
+            return True
+
+        if time.monotonic() - idle_since < self.HEALTH_CHECK_INTERVAL:
+            return True
+
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+            connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _close_expired(self) -> None:
+        """ Close idle connections beyond ``MIN_SIZE`` that have timed out """
+
+        cutoff = time.monotonic() - self.IDLE_TIMEOUT
+        keep = []
+
+        # The list is ordered oldest -> newest
+        for position, (connection, idle_since) in enumerate(self._idle):
+            removable = len(self._idle) - position > self.MIN_SIZE
+            if removable and idle_since < cutoff:
+                connection.close()
+            else:
+                keep.append((connection, idle_since))
+
+        self._idle = keep
+
+    def getconn(self):
+        """
+        Check a connection out of the pool. Blocks if ``MAX_SIZE``
+        connections are already in use.
+
+        :return: an open ``psycopg2`` connection
+        """
+        with self._lock:
+            self._forget_if_forked()
+            self._close_expired()
+
+            while True:
+                # Reuse the most recently returned connection first
+                while self._idle:
+                    connection, idle_since = self._idle.pop()
+                    if self._is_healthy(connection, idle_since):
+                        self._in_use.add(connection)
+                        return connection
+                    connection.close()
+
+                if len(self._in_use) < self.MAX_SIZE:
+                    break
+
+                self._lock.wait()
+
+            # Reserve the slot before connecting outside of the lock
+            placeholder = object()
+            self._in_use.add(placeholder)
+
+        try:
+            connection = psycopg2.connect(self.URI)
+        except Exception:
+            with self._lock:
+                self._in_use.discard(placeholder)
+                self._lock.notify()
+            raise
+
+        with self._lock:
+            self._in_use.discard(placeholder)
+            self._in_use.add(connection)
+
+        return connection
+
+    def putconn(self, connection, discard: bool = False) -> None:
+        """
+        Return a connection to the pool.
+
+        Any open transaction is rolled back and the connection is
+        reset to its default (non-autocommit) state.
+
+        :param connection: connection that came from ``getconn()``
+        :param discard: flag to close the connection instead of
+                        keeping it around, defaults to False
+        :type discard: bool, optional
+        """
+
+        if not discard and not connection.closed:
+            try:
+                status = connection.get_transaction_status()
+                if status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                    connection.rollback()
+                connection.autocommit = False
+            except psycopg2.Error:
+                discard = True
+
+        with self._lock:
+            self._forget_if_forked()
+            self._in_use.discard(connection)
+
+            if connection in self._retired:
+                self._retired.discard(connection)
+                discard = True
+
+            if discard or connection.closed:
+                if not connection.closed:
+                    connection.close()
+            else:
+                self._idle.append((connection, time.monotonic()))
+
+            self._lock.notify()
+
+    @contextmanager
+    def connection(self, autocommit: bool = False):
+        """
+        Context manager that checks a connection out of the pool and
+        returns it afterwards. The transaction is committed if the
+        block finishes without error, and rolled back otherwise.
+
+        :param autocommit: flag to put the connection into autocommit
+                           mode (needed for ``CREATE DATABASE`` etc.),
+                           defaults to False
+        :type autocommit: bool, optional
+        """
+        connection = self.getconn()
+        discard = False
+
+        try:
+            if autocommit:
+                connection.autocommit = True
+            yield connection
+            if not connection.autocommit:
+                connection.commit()
+
+        except Exception:
+            if connection.closed:
+                discard = True
+            else:
+                try:
+                    connection.rollback()
+                except psycopg2.Error:
+                    discard = True
+            raise
+
+        finally:
+            self.putconn(connection, discard=discard)
+
+    def close(self) -> None:
+        """ Close all idle connections. Checked-out connections are
+        closed as soon as they are returned. """
+
+        with self._lock:
+            self._forget_if_forked()
+
+            for connection, _ in self._idle:
+                connection.close()
+            self._idle = []
+
+            # Closing a connection that another thread is still
+            # using would break its query, so wait for it to come back
+            self._retired.update(
+                connection
+                for connection in self._in_use
+                if isinstance(connection, psycopg2.extensions.connection)
+            )
+
+            self._lock.notify_all()
+
+
+# Process-wide pools, keyed by connection URI
+_SHARED_POOLS = {}
+_SHARED_POOLS_LOCK = threading.Lock()
+
+
+def shared_pool(uri: str, **pool_kwargs) -> ConnectionPool:
+    """
+    Get the process-wide pool for ``uri``, creating it if needed.
+    ``pool_kwargs`` are only used when the pool is first created.
+
+    :param uri: connection string URI for PostgreSQL
+    :type uri: str
+    :return: the pool that every caller with this URI will share
+    :rtype: ConnectionPool
+    """
+    with _SHARED_POOLS_LOCK:
+        if uri not in _SHARED_POOLS:
+            _SHARED_POOLS[uri] = ConnectionPool(uri, **pool_kwargs)
+
+        return _SHARED_POOLS[uri]
+
+
+def close_shared_pool(uri: str) -> None:
+    """
+    Close and forget the process-wide pool for ``uri`` (if any).
+
+    :param uri: connection string URI for PostgreSQL
+    :type uri: str
+    """
+    with _SHARED_POOLS_LOCK:
+        pool = _SHARED_POOLS.pop(uri, None)
+
+    if pool:
+        pool.close()
+
+
+def pool_engine(pool: ConnectionPool) -> sqlalchemy.engine.Engine:
+    """
+    Make a ``sqlalchemy`` engine that borrows its connections from
+    ``pool`` and hands them back when it's done, so that the engine
+    doesn't keep a second set of connections to the same database.
+
+    :param pool: pool to borrow connections from
+    :type pool: ConnectionPool
+    :return: sqlalchemy engine
+    :rtype: sqlalchemy.engine.Engine
+    """
+
+    class BorrowedConnections(sqlalchemy.pool.NullPool):
+        """ Return connections to ``pool`` instead of closing them """
+
+        def _close_connection(self, connection, *args, **kwargs):
+            pool.putconn(connection)
+
+    # Don't register UUID or hstore typecasters on connections
+    # that plain psycopg2 cursors will use later on
+    return sqlalchemy.create_engine(
+        "postgresql+psycopg2://",
+        creator=pool.getconn,
+        poolclass=BorrowedConnections,
+        use_native_uuid=False,
+        use_native_hstore=False,
+    )
@@ -0,0 +1,387 @@
+"""
+Summary of ``copy_helpers.py``
+------------------------------
+
+``DataFrame.to_sql()`` writes data with row-wise ``INSERT``
+statements, which gets painfully slow for large tables.
+The helpers in this module stream a dataframe into
+``COPY ... FROM STDIN`` instead, one bounded chunk at a time,
+and pipe ``COPY ... TO STDOUT`` from one database straight
+into ``COPY ... FROM STDIN`` on another.
+"""
+import io
+import os
+import threading
+
+import pandas as pd
+from pandas.api import types as pd_types
+
+
+# Number of rows serialized per COPY chunk
+COPY_CHUNK_SIZE = 50_000
+
+# Number of rows used to guess the type of 'object' columns
+TYPE_INFERENCE_SAMPLE_SIZE = 1_000
+
+# Text that gets written (and read by PostgreSQL) for NULL values
+COPY_NULL = r"\N"
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Wrap a column name in double quotes so that
+    SQL keywords and odd characters are safe to use.
+
+    :param name: column name
+    :type name: str
+    :return: quoted name, like ``"my column"``
+    :rtype: str
+    """
+    name = str(name).replace('"', '""')
+    return f'"{name}"'
+
+
+def postgres_type(series: pd.Series) -> str:
+    """
+    Pick a PostgreSQL column type for a ``pandas.Series``.
+    This mirrors the types that ``DataFrame.to_sql()`` would use.
+
+    :param series: column of data
+    :type series: pd.Series
+    :return: PostgreSQL data type
+    :rtype: str
+    """
+    dtype = series.dtype
+
+    if pd_types.is_bool_dtype(dtype):
+        return "BOOLEAN"
+
+    if pd_types.is_integer_dtype(dtype):
+        if dtype.itemsize <= 2:
+            return "SMALLINT"
+        if dtype.itemsize == 4 and pd_types.is_signed_integer_dtype(dtype):
+            return "INTEGER"
+        return "BIGINT"
+
+    if pd_types.is_float_dtype(dtype):
+        if dtype.itemsize == 4:
+            return "REAL"
+        return "DOUBLE PRECISION"
+
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return "TIMESTAMP WITH TIME ZONE"
+
+    if pd_types.is_datetime64_any_dtype(dtype):
+        return "TIMESTAMP WITHOUT TIME ZONE"
+
+    if pd_types.is_timedelta64_dtype(dtype):
+        return "INTERVAL"
+
+    if pd_types.is_object_dtype(dtype):
+        inferred = pd_types.infer_dtype(series, skipna=True)
+        if inferred == "date":
+            return "DATE"
+        if inferred == "time":
+            return "TIME"
+
+    return "TEXT"
+
+
+def dataframe_chunks(
+    dataframe: pd.DataFrame,
+    chunk_size: int = COPY_CHUNK_SIZE,
+    index_label: str = None,
+    rename: dict = None,
+    converters: dict = None,
+):
+    """
+    Yield slices of a dataframe that are ready to be written
+    with COPY. Only one chunk is converted at a time, so
+    memory stays bounded regardless of the dataframe size.
+
+    :param dataframe: data to write
+    :type dataframe: pd.DataFrame
+    :param chunk_size: rows per chunk, defaults to ``COPY_CHUNK_SIZE``
+    :type chunk_size: int, optional
+    :param index_label: include the index as a column with this name.
+                        Use ``"index"`` to match the ``to_sql()`` default.
+                        Defaults to None, which leaves the index out.
+    :type index_label: str, optional
+    :param rename: mapping of ``{old_column_name: new_column_name}``
+    :type rename: dict, optional
+    :param converters: mapping of ``{new_column_name: function}``, where each
+                       function takes a ``pd.Series`` and returns the values
+                       that should be written instead
+    :type converters: dict, optional
+    """
+    rename = rename or {}
+    converters = converters or {}
+
+    # Always yield at least one (possibly empty) chunk
+    starts = range(0, max(len(dataframe), 1), chunk_size)
+
+    for start in starts:
+        chunk = pd.DataFrame(dataframe.iloc[start : start + chunk_size])
+
+        if index_label:
+            chunk = chunk.reset_index()
+            if chunk.columns[0] != index_label and dataframe.index.nlevels == 1:
+                rename = {**rename, chunk.columns[0]: index_label}
+
+        chunk.columns = [rename.get(c, c) for c in chunk.columns]
+
+        if converters:
+            chunk = chunk.assign(**{c: f(chunk[c]) for c, f in converters.items()})
+
+        yield chunk
+
+
+def conform_dtypes(chunk: pd.DataFrame, dtypes: pd.Series) -> pd.DataFrame:
+    """
+    Coerce a chunk of data so that its columns line up with the
+    dtypes of the first chunk. This handles the common cases where
+    ``pandas`` guesses differently from one chunk to the next, like
+    integer columns that contain blanks. Columns that can't be
+    coerced (like an integer column that holds ``1.5`` or text in
+    this chunk) are left as-is, so that ``widen_type()`` can pick
+    a type that fits them.
+
+    :param chunk: data to coerce
+    :type chunk: pd.DataFrame
+    :param dtypes: ``{column: dtype}`` from the first chunk
+    :type dtypes: pd.Series
+    :return: dataframe with coerced columns
+    :rtype: pd.DataFrame
+    """
+    coerced = {}
+
+    for col, target in dtypes.items():
+        if col not in chunk.columns or chunk[col].dtype == target:
+            continue
+
+        current = chunk[col].dtype
+
+        if pd_types.is_integer_dtype(target) and not pd_types.is_integer_dtype(current):
+            target = "Int64"
+
+        elif pd_types.is_bool_dtype(target) and not pd_types.is_bool_dtype(current):
+            target = "boolean"
+
+        elif pd_types.is_float_dtype(target) and not pd_types.is_numeric_dtype(current):
+            continue
+
+        try:
+            coerced[col] = chunk[col].astype(target)
+        except (TypeError, ValueError):
+            pass
+
+    if coerced:
+        chunk = chunk.assign(**coerced)
+
+    return chunk
+
+
+# Numeric types from narrowest to widest
+_NUMERIC_TYPES = ["SMALLINT", "INTEGER", "BIGINT", "REAL", "DOUBLE PRECISION"]
+
+
+def widen_type(current: str, incoming: str) -> str:
+    """
+    Pick a column type that can hold both the values already in a
+    column and a new chunk of values. Integers widen to larger
+    integers, integers mixed with decimals widen to ``DOUBLE PRECISION``,
+    and anything else that doesn't match widens to ``TEXT``.
+
+    :param current: PostgreSQL type of the column, like ``"INTEGER"``
+    :type current: str
+    :param incoming: PostgreSQL type of the new values, from ``postgres_type()``
+    :type incoming: str
+    :return: the wider type, or None if the column already fits
+    :rtype: str
+    """
+    if current == incoming or current == "TEXT":
+        return None
+
+    if current in _NUMERIC_TYPES and incoming in _NUMERIC_TYPES:
+        integers = _NUMERIC_TYPES[:3]
+
+        if current in integers and incoming in integers:
+            wider = max(current, incoming, key=_NUMERIC_TYPES.index)
+        else:
+            wider = "DOUBLE PRECISION"
+
+        return None if wider == current else wider
+
+    return "TEXT"
+
+
+def create_table_sql(
+    table: str, column_types: dict, if_not_exists: bool = False, unlogged: bool = False
+) -> str:
+    """
+    Write a ``CREATE TABLE`` statement.
+
+    :param table: name of the table, including the schema
+    :type table: str
+    :param column_types: ordered mapping of ``{column_name: sql_type}``
+    :type column_types: dict
+    :param if_not_exists: flag to add ``IF NOT EXISTS``, defaults to False
+    :type if_not_exists: bool, optional
+    :param unlogged: flag to make an ``UNLOGGED`` table, defaults to False
+    :type unlogged: bool, optional
+    :return: SQL statement
+    :rtype: str
+    """
+    columns = ",\n    ".join(
+        f"{quote_identifier(col)} {sql_type}" for col, sql_type in column_types.items()
+    )
+
+    if_not_exists = "IF NOT EXISTS " if if_not_exists else ""
+    unlogged = "UNLOGGED " if unlogged else ""
+
+    return f"CREATE {unlogged}TABLE {if_not_exists}{table} (\n    {columns}\n);"
+
+
+def copy_chunk(cursor, chunk: pd.DataFrame, table: str) -> int:
+    """
+    Write one chunk of data into a table with
+    ``COPY ... FROM STDIN`` using the CSV format.
+
+    :param cursor: ``psycopg2`` cursor
+    :param chunk: data to write. Column names must match the table.
+    :type chunk: pd.DataFrame
+    :param table: name of the table, including the schema
+    :type table: str
+    :return: number of rows written
+    :rtype: int
+    """
+    if chunk.empty:
+        return 0
+
+    buffer = io.StringIO()
+    chunk.to_csv(buffer, header=False, index=False, na_rep=COPY_NULL)
+    buffer.seek(0)
+
+    columns = ", ".join(quote_identifier(c) for c in chunk.columns)
+
+    sql_copy = f"""
+        COPY {table} ({columns})
+        FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')
+    """
+    cursor.copy_expert(sql_copy, buffer)
+
+    return len(chunk)
+
+
+def pipe_copy(source_cursor, copy_to_sql: str, target_cursor, copy_from_sql: str) -> int:
+    """
+    Stream ``COPY ... TO STDOUT`` on one connection directly into
+    ``COPY ... FROM STDIN`` on another, through an OS pipe. Nothing
+    is buffered beyond the pipe itself.
+
+    If either side fails the error is raised here, and the caller
+    is expected to roll back the target transaction.
+
+    :param source_cursor: ``psycopg2`` cursor to read from
+    :param copy_to_sql: ``COPY ... TO STDOUT`` statement
+    :type copy_to_sql: str
+    :param target_cursor: ``psycopg2`` cursor to write to
+    :param copy_from_sql: ``COPY ... FROM STDIN`` statement
+    :type copy_from_sql: str
+    :return: number of rows written to the target
+    :rtype: int
+    """
+    read_fd, write_fd = os.pipe()
+    reader = os.fdopen(read_fd, "rb")
+    writer = os.fdopen(write_fd, "wb")
+
+    source_errors = []
+
+    def produce():
+        try:
+            source_cursor.copy_expert(copy_to_sql, writer)
+        except BaseException as error:
+            source_errors.append(error)
+        finally:
+            # Closing the write end sends EOF to the target
+            writer.close()
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    try:
+        target_cursor.copy_expert(copy_from_sql, reader)
+    finally:
+        # Closing the read end unblocks the producer if the target failed
+        reader.close()
+        producer.join()
+
+    if source_errors:
+        raise source_errors[0]
+
+    return target_cursor.rowcount
+
+
+def range_conditions(column: str, low, high, parts: int) -> list:
+    """
+    Split the numeric range ``[low, high]`` of a column into
+    ``parts`` non-overlapping SQL conditions that together
+    cover every row, including rows where the column is NULL.
+
+    :param column: SQL expression for the column
+    :type column: str
+    :param low: smallest value in the column
+    :param high: largest value in the column
+    :param parts: number of conditions to make
+    :type parts: int
+    :return: list of SQL ``WHERE`` conditions
+    :rtype: list
+    """
+    if low is None or high is None or parts <= 1 or low == high:
+        return [None]
+
+    step = (high - low) / parts
+    bounds = [low + step * i for i in range(1, parts)]
+
+    if isinstance(low, int) and isinstance(high, int):
+        bounds = sorted(set(int(b) for b in bounds))
+
+    conditions = [f"({column} < {bounds[0]} OR {column} IS NULL)"]
+
+    for lower, upper in zip(bounds[:-1], bounds[1:]):
+        conditions.append(f"({column} >= {lower} AND {column} < {upper})")
+
+    conditions.append(f"({column} >= {bounds[-1]})")
+
+    return conditions
+
+
+def ctid_conditions(pages: int, parts: int) -> list:
+    """
+    Split a table into ``parts`` ranges of physical pages. On
+    PostgreSQL 14+ each range is read with a TID range scan.
+
+    :param pages: number of pages in the table
+    :type pages: int
+    :param parts: number of conditions to make
+    :type parts: int
+    :return: list of SQL ``WHERE`` conditions
+    :rtype: list
+    """
+    if parts <= 1 or pages <= 1:
+        return [None]
+
+    step = -(-pages // parts)
+    bounds = list(range(step, pages, step))
+
+    if not bounds:
+        return [None]
+
+    conditions = [f"ctid < '({bounds[0]},0)'::tid"]
+
+    for lower, upper in zip(bounds[:-1], bounds[1:]):
+        conditions.append(f"ctid >= '({lower},0)'::tid AND ctid < '({upper},0)'::tid")
+
+    conditions.append(f"ctid >= '({bounds[-1]},0)'::tid")
+
+    return conditions
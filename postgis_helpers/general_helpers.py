@@ -1,5 +1,7 @@
 import datetime
+from pathlib import Path
 from pytz import timezone
+from pyproj import CRS
 
 
 def now(tz: str = None) -> datetime.datetime:
@@ -42,3 +44,175 @@ def dt_as_time(dt: datetime.datetime) -> str:
     h, m, s = dt.strftime("%H:%M:%S").split(":")
 
     return f"{h}:{m}:{s}"
+
+
+def size_on_disk(path: Path) -> int:
+    """
+    Get the size of a file, or the total size
+    of every file inside a folder, in bytes.
+
+    :param path: file or folder
+    :type path: Path
+    :return: number of bytes, or 0 if the path doesn't exist
+    :rtype: int
+    """
+    path = Path(path)
+
+    if path.is_file():
+        return path.stat().st_size
+
+    if path.is_dir():
+        return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+    return 0
+
+
+def detect_pgdump_format(path: Path) -> str:
+    """
+    Figure out which ``pg_dump`` format a backup was written in.
+
+    :param path: filepath (or folder) of the backup
+    :type path: Path
+    :return: one of ``"directory"``, ``"custom"``, ``"tar"``,
+             ``"plain-gzip"``, ``"plain-lz4"``, ``"plain-zstd"``
+             or ``"plain"``
+    :rtype: str
+    """
+    path = Path(path)
+
+    if path.is_dir():
+        if (path / "toc.dat").exists():
+            return "directory"
+        raise ValueError(f"{path} is a folder, but not a pg_dump directory archive")
+
+    with open(path, "rb") as open_file:
+        header = open_file.read(512)
+
+    if header.startswith(b"PGDMP"):
+        return "custom"
+
+    if header[257:262] == b"ustar":
+        return "tar"
+
+    if header.startswith(b"\x1f\x8b"):
+        return "plain-gzip"
+
+    if header.startswith(b"\x04\x22\x4d\x18"):
+        return "plain-lz4"
+
+    if header.startswith(b"\x28\xb5\x2f\xfd"):
+        return "plain-zstd"
+
+    return "plain"
+
+
+def pgdump_compression_extension(compression) -> str:
+    """
+    Get the extension that a plain-format ``pg_dump`` file needs
+    for a ``--compress`` setting, like ``9``, ``"gzip:5"`` or ``"zstd"``.
+
+    :param compression: value passed to ``pg_dump --compress``
+    :type compression: Union[int, str]
+    :return: one of ``".gz"``, ``".lz4"``, ``".zst"`` or ``""``
+    :rtype: str
+    """
+    if compression is None:
+        return ""
+
+    method, _, detail = str(compression).partition(":")
+
+    # A bare level means gzip
+    if method.isdigit():
+        return "" if int(method) == 0 else ".gz"
+
+    extensions = {"none": "", "gzip": ".gz", "lz4": ".lz4", "zstd": ".zst"}
+
+    if method not in extensions:
+        raise ValueError(f"Unknown pg_dump compression method: '{method}'")
+
+    if detail in ["0", "level=0"]:
+        return ""
+
+    return extensions[method]
+
+
+def epsg_from_prj(shapefile: Path) -> int:
+    """
+    Get the EPSG code of a shapefile from its ``.prj`` file,
+    without reading any of the features.
+
+    :param shapefile: filepath of the ``.shp``
+    :type shapefile: Path
+    :return: EPSG code
+    :rtype: int
+    """
+    prj_file = Path(shapefile).with_suffix(".prj")
+
+    if not prj_file.exists():
+        raise ValueError(f"{shapefile} doesn't have a .prj file, so the EPSG is unknown")
+
+    epsg = CRS.from_user_input(prj_file.read_text()).to_epsg()
+
+    if epsg is None:
+        raise ValueError(f"Could not find an EPSG code that matches {prj_file}")
+
+    return int(epsg)
+
+
+def human_readable_size(num_bytes: int) -> str:
+    """
+    Format a number of bytes like ``"12.3 MB"``
+
+    :param num_bytes: number of bytes
+    :type num_bytes: int
+    :return: text with the size and unit
+    :rtype: str
+    """
+    size = float(num_bytes)
+
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size < 1024:
+            return f"{size:,.1f} {unit}"
+        size /= 1024
+
+    return f"{size:,.1f} TB"
+
+
+def dependency_levels(items: list, dependencies: list) -> list:
+    """
+    Group items into levels, so that everything an item
+    depends on is in an earlier level. Items within the
+    same level don't depend on each other.
+
+    Any items that are part of a dependency cycle end up
+    together in the final level.
+
+    :param items: list of things to order, like table names
+    :type items: list
+    :param dependencies: list of ``(item, depends_on)`` pairs
+    :type dependencies: list
+    :return: list of lists
+    :rtype: list
+    """
+    remaining = list(items)
+    depends_on = {item: set() for item in items}
+
+    for item, other in dependencies:
+        if item in depends_on and other in depends_on and item != other:
+            depends_on[item].add(other)
+
+    levels = []
+    done = set()
+
+    while remaining:
+        level = [item for item in remaining if depends_on[item] <= done]
+
+        # Nothing is ready, so there must be a cycle
+        if not level:
+            level = remaining
+
+        levels.append(level)
+        done.update(level)
+        remaining = [item for item in remaining if item not in done]
+
+    return levels
@@ -1,24 +1,263 @@
+import numpy as np
 import pandas as pd
 import geopandas as gpd
+import shapely
+import shapely.wkb
+
+# Shapely 2.0+ ships vectorized functions at the top level.
+# Older stacks can get the same from pygeos if it's installed.
+if hasattr(shapely, "to_wkb"):
+    _vectorized = shapely
+else:
+    try:
+        import pygeos as _vectorized
+    except ImportError:
+        _vectorized = None
+
+
+def xy_arrays(df: pd.DataFrame, x_lon_col: str, y_lat_col: str) -> tuple:
+    """
+    Get the coordinate columns as float NumPy arrays. Columns that
+    are already float64 are returned as views, without a copy.
+
+    :param df: data with coordinate columns
+    :type df: pd.DataFrame
+    :param x_lon_col: name of the X / longitude column
+    :type x_lon_col: str
+    :param y_lat_col: name of the Y / latitude column
+    :type y_lat_col: str
+    :return: tuple of (x array, y array)
+    :rtype: tuple
+    """
+    x = df[x_lon_col].to_numpy(dtype=float, copy=False)
+    y = df[y_lat_col].to_numpy(dtype=float, copy=False)
+
+    return x, y
 
 
 def spatialize_point_dataframe(
     df: pd.DataFrame, x_lon_col: str, y_lat_col: str, epsg: int
 ) -> gpd.GeoDataFrame:
+    """
+    Build point geometries from the X/Y columns of a dataframe.
+
+    The points are made in one vectorized call on the coordinate
+    arrays, and the input dataframe is wrapped without being copied.
+    Rows with a missing coordinate get a missing geometry.
+
+    :param df: data with coordinate columns
+    :type df: pd.DataFrame
+    :param x_lon_col: name of the X / longitude column
+    :type x_lon_col: str
+    :param y_lat_col: name of the Y / latitude column
+    :type y_lat_col: str
+    :param epsg: EPSG code of the coordinates
+    :type epsg: int
+    :return: geodataframe with a point ``geometry`` column
+    :rtype: gpd.GeoDataFrame
+    """
+    x, y = xy_arrays(df, x_lon_col, y_lat_col)
 
-    # Force lat and lon columns into float type
-    df[y_lat_col] = df[y_lat_col].astype(float)
-    df[x_lon_col] = df[x_lon_col].astype(float)
+    point_geom = gpd.points_from_xy(x, y, crs=f"EPSG:{epsg}")
+    point_geom[np.isnan(x) | np.isnan(y)] = None
 
-    point_geom = gpd.points_from_xy(df[x_lon_col], df[y_lat_col])
-    gdf = gpd.GeoDataFrame(df, geometry=point_geom)
-    gdf.crs = f"EPSG:{epsg}"
+    gdf = gpd.GeoDataFrame(df, geometry=point_geom, copy=False)
+
+    # Keep the coordinate columns as floats, like the geometry
+    for col, values in [(x_lon_col, x), (y_lat_col, y)]:
+        if gdf[col].dtype != values.dtype:
+            gdf[col] = values
 
     return gdf
 
 
+def points_to_hex_ewkb(x: np.ndarray, y: np.ndarray, srid: int) -> np.ndarray:
+    """
+    Encode X/Y coordinate arrays straight to hex EWKB points,
+    without building a ``GeoDataFrame`` in between.
+
+    :param x: X / longitude values
+    :type x: np.ndarray
+    :param y: Y / latitude values
+    :type y: np.ndarray
+    :param srid: EPSG code to embed in each geometry
+    :type srid: int
+    :return: array of hex strings, with ``None`` where a coordinate is missing
+    :rtype: np.ndarray
+    """
+    geoms = np.asarray(gpd.points_from_xy(x, y), dtype=object)
+    geoms[np.isnan(x) | np.isnan(y)] = None
+
+    return geometries_to_hex_ewkb(geoms, srid)
+
+
 def get_centroid_xy_of_gdf(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     x = gdf.geometry.unary_union.centroid.x
     y = gdf.geometry.unary_union.centroid.y
 
     return [y, x]
+
+
+# Ways that geometry can be sent to and from PostGIS.
+#   - "wkb" is (hex-encoded) EWKB, which is compact and lossless
+#   - "wkt" is EWKT text, which is larger, slower and rounds coordinates
+GEOMETRY_CODECS = ["wkb", "wkt"]
+
+
+def geometries_to_hex_ewkb(geometries, srid: int) -> np.ndarray:
+    """
+    Encode geometries as hex EWKB strings with the SRID embedded.
+    This is the text format PostGIS reads directly during ``COPY``,
+    and it's much faster (and lossless) compared to building WKT.
+
+    :param geometries: ``GeoSeries`` or array of shapely geometries
+    :param srid: EPSG code to embed in each geometry
+    :type srid: int
+    :return: array of hex strings, with ``None`` for missing geometries
+    :rtype: np.ndarray
+    """
+    geoms = np.asarray(geometries, dtype=object)
+
+    if _vectorized is shapely:
+        geoms = shapely.set_srid(geoms, int(srid))
+        return shapely.to_wkb(geoms, hex=True, include_srid=True)
+
+    if _vectorized is not None:
+        geoms = _vectorized.set_srid(_vectorized.from_shapely(geoms), int(srid))
+        return _vectorized.to_wkb(geoms, hex=True, include_srid=True)
+
+    return np.array(
+        [None if g is None else shapely.wkb.dumps(g, hex=True, srid=int(srid)) for g in geoms],
+        dtype=object,
+    )
+
+
+def hex_ewkb_to_geometries(values) -> tuple:
+    """
+    Decode (E)WKB values into shapely geometries. Values can be hex
+    strings, which is how PostGIS sends ``geometry`` columns as text,
+    or raw bytes from ``ST_AsBinary()`` / ``ST_AsEWKB()``.
+
+    :param values: sequence of hex strings or bytes, with None for NULL
+    :return: tuple of (array of geometries, SRID of the first geometry
+             that has one, or None)
+    :rtype: tuple
+    """
+    values = np.array(
+        [bytes(v) if isinstance(v, memoryview) else v for v in values], dtype=object
+    )
+
+    if _vectorized is not None:
+        geoms = _vectorized.from_wkb(values)
+        srids = _vectorized.get_srid(geoms)
+        srids = srids[srids > 0]
+        srid = int(srids[0]) if len(srids) else None
+
+        if _vectorized is not shapely:
+            geoms = np.array(_vectorized.to_shapely(geoms), dtype=object)
+
+        return geoms, srid
+
+    from shapely.geos import lgeos
+
+    geoms = np.array(
+        [None if v is None else shapely.wkb.loads(v, hex=isinstance(v, str)) for v in values],
+        dtype=object,
+    )
+
+    srid = None
+    for geom in geoms:
+        if geom is not None and lgeos.GEOSGetSRID(geom._geom) > 0:
+            srid = lgeos.GEOSGetSRID(geom._geom)
+            break
+
+    return geoms, srid
+
+
+def geometries_to_ewkt(geometries, srid: int) -> np.ndarray:
+    """
+    Encode geometries as EWKT strings, like ``SRID=4326;POINT(1 2)``
+
+    :param geometries: ``GeoSeries`` or array of shapely geometries
+    :param srid: EPSG code to embed in each geometry
+    :type srid: int
+    :return: array of strings, with ``None`` for missing geometries
+    :rtype: np.ndarray
+    """
+    geoms = np.asarray(geometries, dtype=object)
+
+    if _vectorized is shapely:
+        # Keep every digit, like ``geom.wkt`` does
+        wkt = shapely.to_wkt(geoms, rounding_precision=-1)
+    else:
+        wkt = np.array([None if g is None else g.wkt for g in geoms], dtype=object)
+
+    return np.array(
+        [None if w is None else f"SRID={int(srid)};{w}" for w in wkt], dtype=object
+    )
+
+
+def ewkt_to_geometries(values) -> tuple:
+    """
+    Decode EWKT strings (as returned by ``ST_AsEWKT()``) into shapely geometries.
+
+    :param values: sequence of EWKT strings, with None for NULL
+    :return: tuple of (array of geometries, SRID of the first geometry
+             that has one, or None)
+    :rtype: tuple
+    """
+    srid = None
+    wkt = []
+
+    for value in values:
+        if value is not None and value.upper().startswith("SRID="):
+            prefix, value = value.split(";", 1)
+            srid = srid or int(prefix.split("=")[1])
+        wkt.append(value)
+
+    if _vectorized is shapely:
+        geoms = shapely.from_wkt(np.array(wkt, dtype=object))
+    else:
+        import shapely.wkt
+
+        geoms = np.array([None if w is None else shapely.wkt.loads(w) for w in wkt], dtype=object)
+
+    return geoms, srid
+
+
+def encode_geometries(geometries, srid: int, codec: str = "wkb") -> np.ndarray:
+    """
+    Encode geometries into text that PostGIS can load with ``COPY``.
+
+    :param geometries: ``GeoSeries`` or array of shapely geometries
+    :param srid: EPSG code to embed in each geometry
+    :type srid: int
+    :param codec: one of ``GEOMETRY_CODECS``, defaults to "wkb"
+    :type codec: str, optional
+    :return: array of encoded geometries
+    :rtype: np.ndarray
+    """
+    if codec == "wkb":
+        return geometries_to_hex_ewkb(geometries, srid)
+    if codec == "wkt":
+        return geometries_to_ewkt(geometries, srid)
+
+    raise ValueError(f"geometry codec must be one of: {GEOMETRY_CODECS}")
+
+
+def decode_geometries(values, codec: str = "wkb") -> tuple:
+    """
+    Decode geometries that came back from PostGIS.
+
+    :param values: sequence of encoded geometries
+    :param codec: one of ``GEOMETRY_CODECS``, defaults to "wkb"
+    :type codec: str, optional
+    :return: tuple of (array of geometries, SRID or None)
+    :rtype: tuple
+    """
+    if codec == "wkb":
+        return hex_ewkb_to_geometries(values)
+    if codec == "wkt":
+        return ewkt_to_geometries(values)
+
+    raise ValueError(f"geometry codec must be one of: {GEOMETRY_CODECS}")
@@ -0,0 +1,570 @@
+"""
+Summary of ``io_helpers.py``
+----------------------------
+
+Shapefiles truncate column names to 10 characters, can't hold
+booleans and have to be loaded into memory in one go. This
+module streams spatial data to and from columnar formats instead,
+one Arrow record batch at a time:
+
+    - GeoParquet, read and written with ``pyarrow``
+    - FlatGeobuf, read and written with ``pyogrio`` (GDAL 3.8+)
+
+Geometry travels as WKB the whole way, so it never has to be
+turned into WKT or held as a full ``GeoDataFrame``.
+
+Query results can also be read straight into an Arrow table:
+``COPY ... TO STDOUT`` is parsed by Arrow's multi-threaded CSV
+reader, without building a Python object for every value.
+"""
+import os
+import json
+import binascii
+import threading
+
+import numpy as np
+import pandas as pd
+from pyproj import CRS
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pa_csv = None
+    pq = None
+
+try:
+    import pyogrio
+    import pyogrio.raw
+except ImportError:
+    pyogrio = None
+
+
+# Rows per Arrow record batch
+ARROW_BATCH_SIZE = 65_536
+
+# Version of the GeoParquet spec that gets written
+GEOPARQUET_VERSION = "1.0.0"
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("pyarrow is required to read and write GeoParquet files")
+
+
+def _require_pyogrio() -> None:
+    if pyogrio is None:
+        raise ImportError("pyogrio (with GDAL 3.8+) is required for FlatGeobuf files")
+
+
+def _pandas_types(arrow_type):
+    """
+    Map nullable Arrow types to nullable pandas types, so that an
+    integer column with blanks doesn't get turned into floats.
+    """
+    if pa.types.is_boolean(arrow_type):
+        return pd.BooleanDtype()
+
+    if pa.types.is_integer(arrow_type):
+        return pd.api.types.pandas_dtype(str(arrow_type).capitalize().replace("Uint", "UInt"))
+
+    return None
+
+
+def epsg_from_crs(crs) -> int:
+    """
+    Get the EPSG code of a CRS given as PROJJSON, WKT or a string like ``"EPSG:4326"``.
+
+    :param crs: coordinate reference system
+    :return: EPSG code
+    :rtype: int
+    """
+    if isinstance(crs, dict):
+        crs = json.dumps(crs)
+
+    epsg = CRS.from_user_input(crs).to_epsg()
+
+    if epsg is None:
+        raise ValueError(f"Could not find an EPSG code that matches this CRS: {crs}")
+
+    return int(epsg)
+
+
+def postgis_geometry_type(geometry_types: list) -> str:
+    """
+    Pick the PostGIS type for a column, given a list of geometry
+    types like ``["Polygon", "MultiPolygon Z"]``. A single
+    type and its ``Multi`` variant become the ``Multi`` type,
+    anything else (or nothing at all) becomes ``GEOMETRY``.
+
+    :param geometry_types: geometry types in the data
+    :type geometry_types: list
+    :return: PostGIS geometry type, like ``"MULTIPOLYGONZ"``
+    :rtype: str
+    """
+    names = {g.upper().replace(" ", "") for g in geometry_types or [] if g}
+    names.discard("UNKNOWN")
+
+    if len(names) == 1:
+        return names.pop()
+
+    multi = max(names, key=len) if names else None
+
+    if multi and names == {multi, multi.replace("MULTI", "", 1)}:
+        return multi
+
+    return "GEOMETRY"
+
+
+def ogr_geometry_type(postgis_type: str, coord_dimension: int = 2) -> str:
+    """
+    Spell a PostGIS geometry type the way OGR and GeoParquet do,
+    like ``"MULTIPOLYGON"`` -> ``"MultiPolygon"``. ``GEOMETRY``
+    (i.e. mixed types) becomes ``"Unknown"``.
+
+    :param postgis_type: type from ``geometry_columns``
+    :type postgis_type: str
+    :param coord_dimension: number of dimensions, defaults to 2
+    :type coord_dimension: int, optional
+    :return: OGR geometry type
+    :rtype: str
+    """
+    names = {
+        "POINT": "Point",
+        "LINESTRING": "LineString",
+        "POLYGON": "Polygon",
+        "MULTIPOINT": "MultiPoint",
+        "MULTILINESTRING": "MultiLineString",
+        "MULTIPOLYGON": "MultiPolygon",
+        "GEOMETRYCOLLECTION": "GeometryCollection",
+    }
+
+    name = names.get(postgis_type.upper().rstrip("ZM"), "Unknown")
+
+    if name != "Unknown" and int(coord_dimension) > 2:
+        name += " Z"
+
+    return name
+
+
+def batch_to_dataframe(batch, geom_col: str) -> pd.DataFrame:
+    """
+    Turn an Arrow record batch with a WKB geometry column into a
+    dataframe that's ready for ``COPY``: the WKB is hex-encoded as-is
+    into a ``geom`` column, and every other column keeps its (nullable)
+    type. The WKB has no SRID, so it has to be loaded into a column
+    with an SRID typmod like ``geometry(POLYGON, 4326)``, which
+    PostGIS applies to geometries with an unknown SRID.
+
+    :param batch: ``pyarrow.RecordBatch``
+    :param geom_col: name of the WKB geometry column
+    :type geom_col: str
+    :return: dataframe with a ``geom`` column
+    :rtype: pd.DataFrame
+    """
+    table = pa.Table.from_batches([batch])
+
+    other_columns = [c for c in table.column_names if c != geom_col]
+    df = table.select(other_columns).to_pandas(types_mapper=_pandas_types)
+
+    df["geom"] = binary_to_hex(table.column(geom_col)).to_pandas().to_numpy()
+
+    return df
+
+
+def geoparquet_batches(path, columns: list = None, batch_size: int = ARROW_BATCH_SIZE):
+    """
+    Read a GeoParquet file one record batch at a time.
+
+    :param path: GeoParquet file
+    :param columns: non-geometry columns to read, defaults to None
+                    which reads them all
+    :type columns: list, optional
+    :param batch_size: rows per batch, defaults to ``ARROW_BATCH_SIZE``
+    :type batch_size: int, optional
+    :return: tuple of (geometry column name, geometry types, CRS, iterator of batches)
+    :rtype: tuple
+    """
+    _require_pyarrow()
+
+    parquet_file = pq.ParquetFile(path)
+
+    metadata = parquet_file.schema_arrow.metadata or {}
+
+    if b"geo" not in metadata:
+        raise ValueError(f"{path} is a Parquet file without GeoParquet metadata")
+
+    geo = json.loads(metadata[b"geo"])
+    geom_col = geo["primary_column"]
+    column_meta = geo["columns"][geom_col]
+
+    if column_meta.get("encoding", "WKB").upper() != "WKB":
+        encoding = column_meta["encoding"]
+        raise ValueError(f"Only WKB encoded GeoParquet is supported, not {encoding}")
+
+    # GeoParquet without a CRS is longitude/latitude by definition
+    crs = column_meta.get("crs", "OGC:CRS84") or "OGC:CRS84"
+
+    if columns is not None:
+        columns = [c for c in columns if c != geom_col] + [geom_col]
+
+    batches = parquet_file.iter_batches(batch_size=batch_size, columns=columns)
+
+    return geom_col, column_meta.get("geometry_types", []), crs, batches
+
+
+def flatgeobuf_batches(path, columns: list = None, batch_size: int = ARROW_BATCH_SIZE):
+    """
+    Read a FlatGeobuf file one record batch at a time.
+
+    :param path: FlatGeobuf file
+    :param columns: non-geometry columns to read, defaults to None
+                    which reads them all
+    :type columns: list, optional
+    :param batch_size: rows per batch, defaults to ``ARROW_BATCH_SIZE``
+    :type batch_size: int, optional
+    :return: tuple of (geometry column name, geometry types, CRS, iterator of batches)
+    :rtype: tuple
+    """
+    _require_pyogrio()
+
+    info = pyogrio.read_info(path)
+    geom_types = [info["geometry_type"]]
+
+    def batches():
+        with pyogrio.raw.open_arrow(
+            path, columns=columns, batch_size=batch_size, use_pyarrow=True
+        ) as (meta, reader):
+            for batch in reader:
+                yield batch
+
+    return "wkb_geometry", geom_types, info["crs"], batches()
+
+
+def arrow_schema(columns: list, geom_col: str = None):
+    """
+    Build an Arrow schema from the column types of a query, so that
+    every batch gets the same types no matter which values it holds.
+
+    :param columns: list of ``(column name, pg_type.typname)`` tuples
+    :type columns: list
+    :param geom_col: name of a WKB geometry column, which is
+                     stored as ``binary``. Defaults to None
+    :type geom_col: str, optional
+    :return: ``pyarrow.Schema``
+    """
+    _require_pyarrow()
+
+    return pa.schema(
+        [
+            (name, pa.binary() if name == geom_col else arrow_type(type_name))
+            for name, type_name in columns
+        ]
+    )
+
+
+def dataframe_to_batch(df: pd.DataFrame, schema):
+    """
+    Turn a chunk of query results into an Arrow record batch with
+    the given ``schema``. Missing values become nulls, so integer
+    columns stay integers even when ``pandas`` holds them as floats.
+    Values that Arrow can't turn into text on its own (UUIDs,
+    JSON, arrays, etc.) are written as text first.
+
+    :param df: query results
+    :type df: pd.DataFrame
+    :param schema: ``pyarrow.Schema``, from ``arrow_schema()``
+    :return: ``pyarrow.RecordBatch``
+    """
+    _require_pyarrow()
+
+    converted = {}
+
+    for field in schema:
+        values = df[field.name]
+
+        if pa.types.is_binary(field.type):
+            converted[field.name] = [None if v is None else bytes(v) for v in values]
+
+        elif pa.types.is_string(field.type) and values.dtype == object:
+            converted[field.name] = [
+                v if v is None or isinstance(v, str)
+                else json.dumps(v) if isinstance(v, (dict, list))
+                else str(v)
+                for v in values
+            ]
+
+    if converted:
+        df = df.assign(**converted)
+
+    return pa.RecordBatch.from_pandas(df, schema=schema, preserve_index=False)
+
+
+def write_geoparquet(batches, path, geom_col: str, epsg: int, geometry_types: list) -> int:
+    """
+    Write record batches to a GeoParquet file, one row group per batch.
+
+    :param batches: iterator of ``pyarrow.RecordBatch``
+    :param path: output file
+    :param geom_col: name of the WKB geometry column
+    :type geom_col: str
+    :param epsg: EPSG code of the geometry
+    :type epsg: int
+    :param geometry_types: GeoParquet geometry types, like ``["Polygon"]``
+    :type geometry_types: list
+    :return: number of rows written
+    :rtype: int
+    """
+    _require_pyarrow()
+
+    geo = {
+        "version": GEOPARQUET_VERSION,
+        "primary_column": geom_col,
+        "columns": {
+            geom_col: {
+                "encoding": "WKB",
+                "geometry_types": geometry_types,
+                "crs": CRS.from_epsg(epsg).to_json_dict(),
+            }
+        },
+    }
+
+    rows = 0
+    writer = None
+
+    try:
+        for batch in batches:
+            if writer is None:
+                schema = batch.schema.with_metadata({"geo": json.dumps(geo)})
+                writer = pq.ParquetWriter(path, schema)
+
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return rows
+
+
+def write_flatgeobuf(batches, path, geom_col: str, epsg: int, geometry_type: str) -> int:
+    """
+    Write record batches to a FlatGeobuf file.
+
+    :param batches: iterator of ``pyarrow.RecordBatch``
+    :param path: output file
+    :param geom_col: name of the WKB geometry column
+    :type geom_col: str
+    :param epsg: EPSG code of the geometry
+    :type epsg: int
+    :param geometry_type: OGR geometry type, like ``"Polygon"`` or ``"Unknown"``
+    :type geometry_type: str
+    :return: number of rows written
+    :rtype: int
+    """
+    _require_pyarrow()
+    _require_pyogrio()
+
+    batches = iter(batches)
+    first_batch = next(batches, None)
+
+    if first_batch is None:
+        return 0
+
+    rows = [first_batch.num_rows]
+
+    def counted():
+        yield first_batch
+        for batch in batches:
+            rows.append(batch.num_rows)
+            yield batch
+
+    reader = pa.RecordBatchReader.from_batches(first_batch.schema, counted())
+
+    pyogrio.raw.write_arrow(
+        reader,
+        path,
+        driver="FlatGeobuf",
+        geometry_name=geom_col,
+        geometry_type=geometry_type,
+        crs=f"EPSG:{epsg}",
+    )
+
+    return sum(rows)
+
+
+# PostgreSQL types that have a matching Arrow type. Anything else
+# (including geometry, which gets decoded separately) is read as text.
+_ARROW_TYPE_NAMES = {
+    "bool": "bool_",
+    "int2": "int16",
+    "int4": "int32",
+    "int8": "int64",
+    "oid": "int64",
+    "float4": "float32",
+    "float8": "float64",
+    "numeric": "float64",
+    "date": "date32",
+}
+
+# Types that PostGIS sends as hex EWKB
+GEOMETRY_TYPE_NAMES = ["geometry", "geography"]
+
+
+def arrow_type(type_name: str):
+    """
+    Pick the Arrow type for a PostgreSQL type name (from ``pg_type.typname``).
+
+    :param type_name: PostgreSQL type, like ``"int4"`` or ``"timestamptz"``
+    :type type_name: str
+    :return: ``pyarrow.DataType``
+    """
+    _require_pyarrow()
+
+    if type_name == "timestamp":
+        return pa.timestamp("us")
+
+    if type_name == "timestamptz":
+        return pa.timestamp("us", tz="UTC")
+
+    return getattr(pa, _ARROW_TYPE_NAMES.get(type_name, "string"))()
+
+
+def binary_to_hex(values):
+    """
+    Encode a column of bytes as hex strings, with one ``hexlify()``
+    over the whole buffer instead of one per value.
+
+    :param values: ``pyarrow.ChunkedArray`` of bytes
+    :return: ``pyarrow.ChunkedArray`` of hex strings
+    """
+    _require_pyarrow()
+
+    large = pa.types.is_large_binary(values.type)
+    offset_type = np.int64 if large else np.int32
+    string_type = pa.large_string() if large else pa.string()
+
+    chunks = []
+
+    for chunk in values.chunks:
+        validity, offsets, data = chunk.buffers()
+
+        offsets = np.frombuffer(offsets, dtype=offset_type, count=chunk.offset + len(chunk) + 1)
+        data = binascii.hexlify(data.to_pybytes()[: offsets[-1]]) if data else b""
+
+        chunks.append(
+            pa.Array.from_buffers(
+                string_type,
+                len(chunk),
+                [validity, pa.py_buffer(offsets * 2), pa.py_buffer(data)],
+                chunk.null_count,
+                chunk.offset,
+            )
+        )
+
+    return pa.chunked_array(chunks, type=string_type)
+
+
+def hex_to_binary(values):
+    """
+    Decode a column of hex strings into a binary column, with one
+    ``unhexlify()`` over the whole buffer instead of one per value.
+
+    :param values: ``pyarrow.ChunkedArray`` of hex strings
+    :return: ``pyarrow.ChunkedArray`` of bytes
+    """
+    _require_pyarrow()
+
+    large = pa.types.is_large_string(values.type)
+    offset_type = np.int64 if large else np.int32
+    binary_type = pa.large_binary() if large else pa.binary()
+
+    chunks = []
+
+    for chunk in values.chunks:
+
+        validity, offsets, data = chunk.buffers()
+
+        offsets = np.frombuffer(offsets, dtype=offset_type, count=chunk.offset + len(chunk) + 1)
+        data = binascii.unhexlify(data.to_pybytes()[: offsets[-1]]) if data else b""
+
+        chunks.append(
+            pa.Array.from_buffers(
+                binary_type,
+                len(chunk),
+                [validity, pa.py_buffer(offsets // 2), pa.py_buffer(data)],
+                chunk.null_count,
+                chunk.offset,
+            )
+        )
+
+    return pa.chunked_array(chunks, type=binary_type)
+
+
+def copy_to_arrow(cursor, query: str, columns: list):
+    """
+    Run ``COPY (query) TO STDOUT`` and parse the output into an Arrow
+    table while it streams in, through an OS pipe. Geometry columns
+    come back as EWKB ``binary`` columns.
+
+    :param cursor: ``psycopg2`` cursor
+    :param query: any valid SQL query string
+    :type query: str
+    :param columns: list of ``(column name, pg_type.typname)`` tuples
+    :type columns: list
+    :return: ``pyarrow.Table``
+    """
+    _require_pyarrow()
+
+    column_names = [name for name, _ in columns]
+    geom_cols = [name for name, type_name in columns if type_name in GEOMETRY_TYPE_NAMES]
+
+    convert_options = pa_csv.ConvertOptions(
+        column_types={name: arrow_type(type_name) for name, type_name in columns},
+        null_values=[""],
+        strings_can_be_null=True,
+        quoted_strings_can_be_null=False,
+        true_values=["t"],
+        false_values=["f"],
+    )
+    # The header row is skipped, but it means the output is never
+    # completely empty, which the CSV reader would refuse
+    read_options = pa_csv.ReadOptions(column_names=column_names, skip_rows=1)
+
+    read_fd, write_fd = os.pipe()
+    reader = os.fdopen(read_fd, "rb")
+    writer = os.fdopen(write_fd, "wb")
+
+    source_errors = []
+
+    def produce():
+        try:
+            cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)", writer)
+        except BaseException as error:
+            source_errors.append(error)
+        finally:
+            # Closing the write end sends EOF to the reader
+            writer.close()
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    try:
+        table = pa_csv.read_csv(
+            reader, read_options=read_options, convert_options=convert_options
+        )
+    finally:
+        # Closing the read end unblocks the producer if parsing failed
+        reader.close()
+        producer.join()
+
+    if source_errors:
+        raise source_errors[0]
+
+    for name in geom_cols:
+        position = table.column_names.index(name)
+        table = table.set_column(position, name, hex_to_binary(table.column(name)))
+
+    return table
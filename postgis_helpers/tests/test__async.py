@@ -0,0 +1,48 @@
+import asyncio
+
+from ward import test, using
+
+from postgis_helpers import PostgreSQL, AsyncPostgreSQL
+from postgis_helpers.tests.fixtures import DataForTest, database_1, test_shp_data
+
+
+# Do concurrent async queries match the blocking version?
+# -- ---------- ----- ------- ----- --- -------- -------
+async def _test_async_query_as_geo_df(db: PostgreSQL, shp: DataForTest):
+
+    query = f"SELECT * FROM {shp.NAME}"
+
+    async with AsyncPostgreSQL(db.DATABASE, verbosity="errors", **db.connection_details()) as adb:
+        results = await asyncio.gather(*[adb.query_as_geo_df(query) for _ in range(4)])
+
+    expected_rows = db.query_as_single_item(f"SELECT COUNT(*) FROM {shp.NAME}")
+
+    for gdf in results:
+        assert len(gdf) == expected_rows
+        assert gdf.crs.to_epsg() == shp.EPSG
+
+
+@test("AsyncPostgreSQL().query_as_geo_df() runs concurrently with the right EPSG")
+@using(db=database_1, shp=test_shp_data)
+async def _(db, shp):
+    await _test_async_query_as_geo_df(db, shp)
+
+
+# Can an async import be read back?
+# --- -- ----- ------ -- ---- -----
+async def _test_async_import_geodataframe(db: PostgreSQL, shp: DataForTest):
+
+    table_name = f"{shp.NAME}_async_copy"
+
+    gdf = db.query_as_geo_df(f"SELECT * FROM {shp.NAME}")
+
+    async with AsyncPostgreSQL(db.DATABASE, verbosity="errors", **db.connection_details()) as adb:
+        await adb.import_geodataframe(gdf, table_name)
+
+    assert db.all_spatial_tables_as_dict()[table_name] == shp.EPSG
+
+
+@test("AsyncPostgreSQL().import_geodataframe() creates a spatial table")
+@using(db=database_1, shp=test_shp_data)
+async def _(db, shp):
+    await _test_async_import_geodataframe(db, shp)
@@ -0,0 +1,27 @@
+from ward import test, using
+
+from postgis_helpers import PostgreSQL
+from postgis_helpers.tests.fixtures import database_1
+
+
+# Does the cache notice a table made by this object?
+# ---- --- ----- ------ - ----- ---- -- ---- -------
+def _test_catalog_cache_sees_new_table(db: PostgreSQL):
+
+    table_name = "catalog_cache_test"
+
+    # Prime the cache, then change the database
+    assert table_name not in db.all_tables_as_list()
+
+    db.execute(f"CREATE TABLE {table_name} AS SELECT 1 AS some_value;")
+    assert table_name in db.all_tables_as_list()
+    assert "some_value" in db.table_columns_as_list(table_name)
+
+    db.table_delete(table_name)
+    assert table_name not in db.all_tables_as_list()
+
+
+@test("PostgreSQL() catalog lookups are refreshed after the database changes")
+@using(db=database_1)
+def _(db):
+    _test_catalog_cache_sees_new_table(db)
@@ -0,0 +1,115 @@
+import shutil
+
+from ward import test, using
+
+from postgis_helpers import PostgreSQL
+from postgis_helpers.tests.fixtures import DataForTest, database_1, test_shp_data
+
+
+# Does a table survive a round trip through GeoParquet?
+# ---- - ----- ------- - ----- ---- ------- ----------
+def _test_geoparquet_round_trip(db: PostgreSQL, shp: DataForTest):
+
+    output_path = db.export_geoparquet(shp.NAME, shp.EXPORT_FOLDER)
+    assert output_path.exists()
+
+    new_table = f"{shp.NAME}_from_parquet"
+    rows = db.import_geoparquet(new_table, output_path, if_exists="replace")
+
+    assert rows == db.query_as_single_item(f"SELECT COUNT(*) FROM {shp.NAME}")
+    assert db.all_spatial_tables_as_dict()[new_table] == shp.EPSG
+
+    db.table_delete(new_table)
+
+
+@test("PostgreSQL() round trip through GeoParquet keeps every row and the EPSG")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_geoparquet_round_trip(database, shp)
+
+
+# Does column projection only load the requested columns?
+# ---- ------ ---------- ---- ---- --- --------- -------
+def _test_geoparquet_columns(db: PostgreSQL, shp: DataForTest):
+
+    output_path = db.export_geoparquet(shp.NAME, shp.EXPORT_FOLDER)
+
+    new_table = f"{shp.NAME}_projected"
+    db.import_geoparquet(new_table, output_path, columns=[], if_exists="replace")
+
+    assert set(db.table_columns_as_list(new_table)) == {"geom", "uid"}
+
+    db.table_delete(new_table)
+
+
+@test("PostgreSQL().import_geoparquet() only loads the requested columns")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_geoparquet_columns(database, shp)
+
+
+# Does a table survive a round trip through FlatGeobuf?
+# ---- - ----- ------- - ----- ---- ------- ----------
+def _test_flatgeobuf_round_trip(db: PostgreSQL, shp: DataForTest):
+
+    # The folder doesn't exist yet, so the export has to make it
+    output_folder = shp.EXPORT_FOLDER / "flatgeobuf_export"
+    shutil.rmtree(output_folder, ignore_errors=True)
+
+    output_path = db.export_flatgeobuf(shp.NAME, output_folder)
+    assert output_path.exists()
+
+    new_table = f"{shp.NAME}_from_fgb"
+    rows = db.import_flatgeobuf(new_table, output_path, if_exists="replace")
+
+    assert rows == db.query_as_single_item(f"SELECT COUNT(*) FROM {shp.NAME}")
+
+    db.table_delete(new_table)
+    shutil.rmtree(output_folder)
+
+
+@test("PostgreSQL() round trip through FlatGeobuf keeps every row")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_flatgeobuf_round_trip(database, shp)
+
+
+# Are column types kept when the first chunk is all NULL?
+# --- ------ ----- ---- ---- --- ----- ----- -- --- -----
+def _test_geoparquet_keeps_types(db: PostgreSQL, shp: DataForTest):
+
+    table_name = "geoparquet_types_test"
+    new_table = f"{table_name}_imported"
+
+    query = f"""
+        SELECT
+            g AS some_id,
+            CASE WHEN g > 10 THEN g END AS late_value,
+            ST_SetSRID(ST_MakePoint(g, g), {shp.EPSG}) AS geom
+        FROM generate_series(1, 20) g
+    """
+    db.make_geotable_from_query(query, table_name, "POINT", shp.EPSG)
+
+    try:
+        output_path = db.export_geoparquet(table_name, shp.EXPORT_FOLDER, chunk_size=5)
+        db.import_geoparquet(new_table, output_path, if_exists="replace")
+
+        sql_types = f"""
+            SELECT column_name, data_type
+            FROM information_schema.columns
+            WHERE table_name = '{new_table}'
+        """
+        sql_types = dict(db.query_as_list(sql_types))
+
+        assert sql_types["late_value"] == "integer"
+        assert db.query_as_single_item(f"SELECT COUNT(late_value) FROM {new_table}") == 10
+
+    finally:
+        db.table_delete(table_name)
+        db.table_delete(new_table)
+
+
+@test("PostgreSQL().export_geoparquet() keeps integer columns that start out NULL")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_geoparquet_keeps_types(database, shp)
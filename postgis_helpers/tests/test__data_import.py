@@ -44,3 +44,67 @@ def _test_import_csv_matches(db: PostgreSQL, csv: DataForTest):
 @using(db=database_1, csv=test_csv_data)
 def _(db, csv):
     _test_import_csv_matches(db, csv)
+
+
+# Does streaming the CSV in chunks import all of the rows?
+# ---------- ---------- ---------- ---------- ---------- --
+def _test_import_csv_in_chunks(db: PostgreSQL, csv: DataForTest):
+
+    table_name = f"{csv.NAME}_chunked"
+
+    # Stream the CSV into SQL a few rows at a time
+    db.import_csv(table_name, csv.PATH_URL, if_exists="replace", chunk_size=500)
+
+    # Get the number of rows in the raw dataframe
+    df = pd.read_csv(csv.PATH_URL)
+    csv_row_count, _ = df.shape
+
+    db_table_row_count = db.query_as_single_item(f"SELECT COUNT(*) FROM {table_name}")
+
+    assert csv_row_count == db_table_row_count
+
+
+@test("PostgreSQL().import_csv() with a chunk_size imports a table with all rows")
+@using(db=database_1, csv=test_csv_data)
+def _(db, csv):
+    _test_import_csv_in_chunks(db, csv)
+
+
+# Does a column that changes type partway through the file get widened?
+# ---- - ------ ---- ------- ---- ------- ------- --- ---- --- -------
+def _test_import_csv_in_chunks_widens_types(db: PostgreSQL):
+
+    table_name = "csv_chunked_type_change"
+    csv_path = db.DATA_INBOX / f"{table_name}.csv"
+
+    # Integers well past the type inference sample, then decimals and text
+    df = pd.DataFrame({"some_value": range(3000), "label": range(3000)})
+    df["some_value"] = df["some_value"].astype(object)
+    df.loc[2500:, "some_value"] = 1.5
+    df.loc[2500:, "label"] = "text"
+    df.to_csv(csv_path, index=False)
+
+    try:
+        db.import_csv(table_name, csv_path, if_exists="replace", chunk_size=500)
+
+        assert db.query_as_single_item(f"SELECT COUNT(*) FROM {table_name}") == 3000
+
+        sql_types = f"""
+            SELECT column_name, data_type
+            FROM information_schema.columns
+            WHERE table_name = '{table_name}'
+        """
+        sql_types = dict(db.query_as_list(sql_types))
+
+        assert sql_types["some_value"] == "double precision"
+        assert sql_types["label"] == "text"
+
+    finally:
+        db.table_delete(table_name)
+        csv_path.unlink()
+
+
+@test("PostgreSQL().import_csv() with a chunk_size widens columns that change type")
+@using(db=database_1)
+def _(db):
+    _test_import_csv_in_chunks_widens_types(db)
@@ -54,3 +54,118 @@ def _test_transfer_data_spatial(db1: PostgreSQL, db2: PostgreSQL, shp: DataForTe
 @using(database1=database_1, database2=database_2, shp=test_shp_data)
 def _(database1, database2, shp):
     _test_transfer_data_spatial(database1, database2, shp)
+
+
+# Does a parallel transfer copy every row?
+# ---------- ---------- ---------- -------
+def _test_transfer_data_parallel(db1: PostgreSQL, db2: PostgreSQL, shp: DataForTest):
+
+    table_name = shp.NAME
+
+    # Make sure that this table does not exist in the 2nd database
+    if table_name in db2.all_tables_as_list():
+        db2.table_delete(table_name)
+
+    # Transfer to the 2nd database with several workers
+    db1.transfer_data_to_another_db(table_name, db2, jobs=4, split_column="uid")
+
+    query = f"SELECT COUNT(*) FROM {table_name}"
+
+    assert db1.query_as_single_item(query) == db2.query_as_single_item(query)
+
+
+@test("PostgreSQL().transfer_data_to_another_db() with jobs > 1 copies every row")
+@using(database1=database_1, database2=database_2, shp=test_shp_data)
+def _(database1, database2, shp):
+    _test_transfer_data_parallel(database1, database2, shp)
+
+
+# Can we transfer a list of tables at once?
+# ---------- ---------- ---------- --------
+def _test_transfer_tables(
+    db1: PostgreSQL, db2: PostgreSQL, csv: DataForTest, shp: DataForTest
+):
+
+    tables = [csv.NAME, shp.NAME]
+
+    report = db1.transfer_tables_to_another_db(db2, tables=tables, max_workers=2)
+
+    # Confirm every table made it, and is now in the 2nd database
+    assert list(report["status"]) == ["done", "done"]
+    assert str(report["rows"].dtype) == "Int64"
+
+    for table_name in tables:
+        assert table_name in db2.all_tables_as_list()
+
+
+@test("PostgreSQL().transfer_tables_to_another_db() transfers a list of tables")
+@using(database1=database_1, database2=database_2, csv=test_csv_data, shp=test_shp_data)
+def _(database1, database2, csv, shp):
+    _test_transfer_tables(database1, database2, csv, shp)
+
+
+# Are sequences and identity columns rebuilt, and do failures clean up?
+# --- --------- --- -------- ------- -------- --- -- -------- ----- ---
+def _test_transfer_sequences_and_failures(db1: PostgreSQL, db2: PostgreSQL):
+
+    table_name = "transfer_identity_test"
+    target_schema = "transfer_test"
+
+    db1.execute(
+        f"""
+        DROP TABLE IF EXISTS {table_name};
+        CREATE TABLE {table_name} (
+            id INT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+            serial_id SERIAL,
+            label TEXT
+        );
+        INSERT INTO {table_name} (label) VALUES ('a'), ('b'), ('c');
+    """
+    )
+
+    try:
+        # Into another schema: new rows pick up where the old ones left off
+        db1.transfer_tables_to_another_db(
+            db2, tables=[table_name], target_schema=target_schema, max_workers=1
+        )
+
+        new_row = db2.query_as_list(
+            f"""
+            INSERT INTO {target_schema}.{table_name} (label) VALUES ('d')
+            RETURNING id, serial_id, pg_get_serial_sequence(
+                '{target_schema}.{table_name}', 'serial_id'
+            );
+        """
+        )[0]
+
+        assert new_row[0] == 4
+        assert new_row[1] == 4
+        assert new_row[2].startswith(f"{target_schema}.")
+
+        # A transfer that fails leaves the existing table alone
+        db1.transfer_data_to_another_db(table_name, db2, if_exists="replace")
+
+        failed = False
+        try:
+            db1.transfer_data_to_another_db(
+                table_name, db2, jobs=2, split_column="not_a_column", if_exists="replace"
+            )
+        except Exception:
+            failed = True
+
+        assert failed
+        assert db2.query_as_single_item(f"SELECT COUNT(*) FROM {table_name}") == 3
+
+        leftovers = [t for t in db2.all_tables_as_list() if t.startswith(f"_{table_name}_")]
+        assert not leftovers
+
+    finally:
+        db1.table_delete(table_name)
+        db2.table_delete(table_name)
+        db2.execute(f"DROP SCHEMA IF EXISTS {target_schema} CASCADE;")
+
+
+@test("PostgreSQL().transfer_data_to_another_db() rebuilds sequences and cleans up on failure")
+@using(database1=database_1, database2=database_2)
+def _(database1, database2):
+    _test_transfer_sequences_and_failures(database1, database2)
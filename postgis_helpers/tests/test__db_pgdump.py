@@ -1,6 +1,12 @@
+import time
+import shutil
+import tempfile
+from pathlib import Path
+
 from ward import test, using
 
 from postgis_helpers import PostgreSQL
+from postgis_helpers.general_helpers import detect_pgdump_format
 from postgis_helpers.tests.fixtures import database_1
 
 
@@ -18,3 +24,64 @@ def _test_db_export_pgdump_file(db: PostgreSQL):
 @using(database=database_1)
 def _(database):
     _test_db_export_pgdump_file(database)
+
+
+# Does a compressed plain dump get the right extension?
+# ---- - ---------- ----- ---- --- --- ----- ----------
+def _test_db_export_pgdump_file_compressed(db: PostgreSQL):
+
+    output_sql_file = db.db_export_pgdump_file(db.DATA_OUTBOX, compression="gzip:5")
+
+    try:
+        assert output_sql_file.name.endswith(".sql.gz")
+        assert detect_pgdump_format(output_sql_file) == "plain-gzip"
+    finally:
+        output_sql_file.unlink()
+
+
+@test("PostgreSQL().db_export_pgdump_file(compression=...) names the file after the method")
+@using(database=database_1)
+def _(database):
+    _test_db_export_pgdump_file_compressed(database)
+
+
+# Does a second incremental backup skip unchanged tables?
+# ------ -- ------ ----------- ------ ---- --------- ------
+def _test_db_export_incremental_backup(db: PostgreSQL):
+
+    table_name = "incremental_backup_test"
+    output_folder = Path(tempfile.mkdtemp())
+
+    try:
+        db.execute(f"CREATE TABLE {table_name} AS SELECT 1 AS some_value;")
+
+        base = db.db_export_incremental_backup(output_folder, full=True)
+        assert base.exists()
+
+        # Nothing changed, so there shouldn't be a delta
+        assert db.db_export_incremental_backup(output_folder) is None
+
+        # A write is picked up once the pg_stat counters catch up with it
+        db.execute(f"UPDATE {table_name} SET some_value = 2;")
+
+        delta = None
+        for _ in range(10):
+            delta = db.db_export_incremental_backup(output_folder)
+            if delta:
+                break
+            time.sleep(0.5)
+
+        assert delta.exists()
+
+        # The first delta already holds the write, so the next run is empty
+        assert db.db_export_incremental_backup(output_folder) is None
+
+    finally:
+        db.table_delete(table_name)
+        shutil.rmtree(output_folder, ignore_errors=True)
+
+
+@test("PostgreSQL().db_export_incremental_backup() only dumps changed tables")
+@using(database=database_1)
+def _(database):
+    _test_db_export_incremental_backup(database)
@@ -0,0 +1,43 @@
+import geopandas as gpd
+from shapely.geometry import Point
+from ward import test, using
+
+from postgis_helpers import PostgreSQL
+from postgis_helpers.tests.fixtures import database_1
+
+
+# Do coordinates survive a round trip with each codec?
+# -- ----------- ------- - ----- ---- ---- ---- -----
+def _test_geometry_codec_round_trip(db: PostgreSQL, geometry_codec: str):
+
+    table_name = f"geometry_codec_{geometry_codec}_test"
+
+    points = [Point(-75.123456789012, 39.987654321098), Point(1234567.891234, 7654321.123456)]
+    gdf = gpd.GeoDataFrame({"name": ["a", "b"]}, geometry=points, crs="EPSG:4326")
+
+    db.import_geodataframe(gdf, table_name, geometry_codec=geometry_codec)
+
+    try:
+        result = db.query_as_geo_df(
+            f"SELECT name, geom FROM {table_name} ORDER BY name",
+            geometry_codec=geometry_codec,
+            use_cache=False,
+        )
+
+        for expected, actual in zip(points, result.geometry):
+            assert (actual.x, actual.y) == (expected.x, expected.y)
+
+    finally:
+        db.table_delete(table_name)
+
+
+@test("PostgreSQL() keeps full coordinate precision with the 'wkt' geometry codec")
+@using(db=database_1)
+def _(db):
+    _test_geometry_codec_round_trip(db, "wkt")
+
+
+@test("PostgreSQL() keeps full coordinate precision with the 'wkb' geometry codec")
+@using(db=database_1)
+def _(db):
+    _test_geometry_codec_round_trip(db, "wkb")
@@ -22,3 +22,102 @@ def _test_hexagon_overlay(db: PostgreSQL, shp: DataForTest):
 @using(database=database_1, shp=test_shp_data)
 def _(database, shp):
     _test_hexagon_overlay(database, shp)
+
+
+# Does clipping drop hexagons that don't touch anything?
+# ---- -------- ---- --------- ---- ----- ----- --------
+def _test_hexagon_overlay_clipped(db: PostgreSQL, shp: DataForTest):
+
+    full_table, clipped_table = "test_hexagons_full", "test_hexagons_clipped"
+
+    for table_name, clip in [(full_table, False), (clipped_table, True)]:
+        db.make_hexagon_overlay(
+            table_name,
+            table_to_cover=shp.NAME,
+            desired_epsg=2272,
+            hexagon_size=5,
+            clip_to_coverage=clip,
+        )
+
+    full_count = db.query_as_single_item(f"SELECT COUNT(*) FROM {full_table}")
+    clipped_count = db.query_as_single_item(f"SELECT COUNT(*) FROM {clipped_table}")
+
+    assert 0 < clipped_count <= full_count
+
+
+@test("PostgreSQL().make_hexagon_overlay(clip_to_coverage=True) keeps a subset of hexagons")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_hexagon_overlay_clipped(database, shp)
+
+
+# Does every small cell roll up into a bigger one?
+# ---- ----- ----- ---- ---- -- ---- - ------ ----
+def _test_grid_pyramid(db: PostgreSQL, shp: DataForTest, shape: str):
+
+    table_name = f"test_{shape}_pyramid"
+
+    db.make_grid_pyramid(
+        table_name,
+        table_to_cover=shp.NAME,
+        desired_epsg=2272,
+        cell_sizes=[20, 5],
+        shape=shape,
+        clip_to_coverage=True,
+    )
+
+    orphans = db.query_as_single_item(
+        f"SELECT COUNT(*) FROM {table_name} WHERE level = 1 AND parent_id IS NULL"
+    )
+    levels = db.query_as_single_item(f"SELECT COUNT(DISTINCT level) FROM {table_name}")
+
+    assert orphans == 0
+    assert levels == 2
+
+
+@test("PostgreSQL().make_grid_pyramid() links every hexagon to a parent")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_grid_pyramid(database, shp, "hexagon")
+
+
+@test("PostgreSQL().make_grid_pyramid() links every square to a parent")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_grid_pyramid(database, shp, "square")
+
+
+# Does length-weighting split each line across the hexagons?
+# ---- -------------- ----- ---- ---- ------ --- --- ---------
+def _test_grid_aggregation(db: PostgreSQL, shp: DataForTest):
+
+    hex_table_name = "test_hexagons_for_aggregation"
+    summary_table_name = "test_hexagon_summary"
+
+    db.make_hexagon_overlay(
+        hex_table_name, table_to_cover=shp.NAME, desired_epsg=2272, hexagon_size=5
+    )
+
+    db.make_grid_aggregation(
+        summary_table_name,
+        hex_table_name,
+        shp.NAME,
+        {"segments": "COUNT(*)", "share_of_segments": "SUM(_grid_weight)"},
+        weighting="length",
+    )
+
+    total_share = db.query_as_single_item(
+        f"SELECT SUM(share_of_segments) FROM {summary_table_name}"
+    )
+    total_segments = db.query_as_single_item(
+        f"SELECT COUNT(*) FROM {shp.NAME} WHERE ST_Length(geom) > 0"
+    )
+
+    assert abs(total_share - total_segments) < 0.01 * total_segments
+    assert summary_table_name in db.all_spatial_tables_as_dict()
+
+
+@test("PostgreSQL().make_grid_aggregation() apportions lines by length")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_grid_aggregation(database, shp)
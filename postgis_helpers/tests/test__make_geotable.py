@@ -30,3 +30,117 @@ def _test_make_geotable_from_query(db: PostgreSQL, shp: DataForTest):
 @using(database=database_1, shp=test_shp_data)
 def _(database, shp):
     _test_make_geotable_from_query(database, shp)
+
+
+# Do tiles add up to the same table as a single query?
+# -- ----- --- -- -- --- ---- ----- -- - ------ ------
+def _test_make_geotable_from_query_in_tiles(db: PostgreSQL, shp: DataForTest):
+
+    new_table_name = "test_geotable_from_tiles"
+
+    query = f"""
+        SELECT ST_Buffer(geom, 10) AS geom
+        FROM {shp.NAME}
+        WHERE {{tile_filter}}
+    """
+
+    db.make_geotable_from_query(
+        query, new_table_name, "POLYGON", shp.EPSG, tile_table=shp.NAME, tiles=9
+    )
+
+    src_count = db.query_as_single_item(f"SELECT COUNT(*) FROM {shp.NAME}")
+    new_count = db.query_as_single_item(f"SELECT COUNT(*) FROM {new_table_name}")
+
+    assert src_count == new_count
+
+
+@test("PostgreSQL().make_geotable_from_query(tile_table=...) puts every feature in one tile")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_make_geotable_from_query_in_tiles(database, shp)
+
+
+# Does bulk mode end up with a regular, indexed table?
+# ---- ---- ---- --- -- ---- - -------- ------- ------
+def _test_make_geotable_from_query_bulk(db: PostgreSQL, shp: DataForTest):
+
+    new_table_name = "test_geotable_bulk"
+
+    query = f"SELECT ST_Multi(geom) AS geom FROM {shp.NAME}"
+
+    db.make_geotable_from_query(
+        query, new_table_name, "MULTILINESTRING", shp.EPSG, bulk=True
+    )
+
+    persistence = db.query_as_single_item(
+        f"SELECT relpersistence FROM pg_class WHERE relname = '{new_table_name}'"
+    )
+    uid_is_unique = db.query_as_single_item(
+        f"SELECT COUNT(DISTINCT uid) = COUNT(*) FROM {new_table_name}"
+    )
+    geom_type, srid = db.query_as_list(
+        f"""
+        SELECT type, srid FROM geometry_columns
+        WHERE f_table_name = '{new_table_name}' AND f_geometry_column = 'geom'
+    """
+    )[0]
+
+    assert persistence == "p"
+    assert uid_is_unique
+    assert geom_type == "MULTILINESTRING"
+    assert srid == shp.EPSG
+
+
+@test("PostgreSQL().make_geotable_from_query(bulk=True) makes a logged table with a uid")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_make_geotable_from_query_bulk(database, shp)
+
+
+# Does a batched reprojection move every row to the new EPSG?
+# ---- - ------- ------------ ---- ----- --- -- --- --- -----
+def _test_table_reproject_spatial_data_in_batches(db: PostgreSQL, shp: DataForTest):
+
+    new_table_name = "test_geotable_reprojected"
+
+    query = f"SELECT ST_Multi(geom) AS geom FROM {shp.NAME}"
+    db.make_geotable_from_query(query, new_table_name, "MULTILINESTRING", shp.EPSG)
+
+    db.table_reproject_spatial_data(
+        new_table_name, shp.EPSG, 4326, "MULTILINESTRING", batch_size=500
+    )
+
+    srids = db.query_as_list(f"SELECT DISTINCT ST_SRID(geom) FROM {new_table_name}")
+
+    assert db.all_spatial_tables_as_dict()[new_table_name] == 4326
+    assert srids == [(4326,)]
+
+
+@test("PostgreSQL().table_reproject_spatial_data(batch_size=500) reprojects every row")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_table_reproject_spatial_data_in_batches(database, shp)
+
+
+# Does a trailing comment survive being nested in another query?
+# ---- - -------- ------- ------- ----- ------ -- ------- ------
+def _test_make_geotable_from_query_with_comment(db: PostgreSQL, shp: DataForTest):
+
+    new_table_name = "test_geotable_trailing_comment"
+
+    query = f"SELECT geom FROM {shp.NAME} -- every feature"
+
+    db.make_geotable_from_query(query, new_table_name, "MULTILINESTRING", shp.EPSG)
+
+    src_count = db.query_as_single_item(f"SELECT COUNT(*) FROM {shp.NAME}")
+    new_count = db.query_as_single_item(f"SELECT COUNT(*) FROM {new_table_name}")
+
+    assert src_count == new_count
+
+    db.table_delete(new_table_name)
+
+
+@test("PostgreSQL().make_geotable_from_query() works with a trailing -- comment")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_make_geotable_from_query_with_comment(database, shp)
@@ -42,3 +42,76 @@ def _test_pgsql2shp_epsg(db: PostgreSQL, shp: DataForTest):
 @using(database=database_1, shp=test_shp_data)
 def _(database, shp):
     _test_pgsql2shp_epsg(database, shp)
+
+
+# Does a streamed export hold every row of the table?
+# ---- - -------- ------ ---- ----- --- -- --- -----
+def _test_export_shapefile_in_chunks(db: PostgreSQL, shp: DataForTest):
+
+    output_folder = shp.EXPORT_FOLDER / "chunked_export"
+    output_folder.mkdir(parents=True, exist_ok=True)
+
+    db.export_shapefile(shp.NAME, output_folder, chunk_size=100)
+
+    gdf = gpd.read_file(output_folder / f"{shp.NAME}.shp")
+
+    assert gdf.shape[0] == db.query_as_single_item(f"SELECT COUNT(*) FROM {shp.NAME}")
+
+
+@test("PostgreSQL().export_shapefile() with chunk_size writes every row")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_export_shapefile_in_chunks(database, shp)
+
+
+# Do boolean columns with NULLs come out the same in every chunk?
+# -- ------- ------- ---- ----- ---- --- --- ---- -- ----- ------
+def _test_export_shapefile_booleans_in_chunks(db: PostgreSQL, shp: DataForTest):
+
+    table_name = "shapefile_booleans_test"
+    output_folder = shp.EXPORT_FOLDER / "chunked_booleans_export"
+    output_folder.mkdir(parents=True, exist_ok=True)
+
+    # The first chunk has no NULLs and the second one does
+    query = f"""
+        SELECT
+            CASE WHEN g <= 10 THEN g % 2 = 0 END AS is_even,
+            ST_SetSRID(ST_MakePoint(g, g), {shp.EPSG}) AS geom
+        FROM generate_series(1, 20) g
+    """
+    db.make_geotable_from_query(query, table_name, "POINT", shp.EPSG)
+
+    try:
+        db.export_shapefile(table_name, output_folder, chunk_size=10)
+
+        gdf = gpd.read_file(output_folder / f"{table_name}.shp")
+
+        assert gdf.shape[0] == 20
+        assert set(gdf["is_even"].dropna()) == {"True", "False"}
+        assert gdf["is_even"].isna().sum() == 10
+
+    finally:
+        db.table_delete(table_name)
+
+
+@test("PostgreSQL().export_shapefile() with chunk_size writes booleans the same in every chunk")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_export_shapefile_booleans_in_chunks(database, shp)
+
+
+# Does the batch exporter write a shapefile for each table?
+# ---- --- ----- -------- ----- - --------- --- ---- -----
+def _test_pgsql2shp_many(db: PostgreSQL, shp: DataForTest):
+
+    results = db.pgsql2shp_many([shp.NAME], output_folder=shp.EXPORT_FOLDER, jobs=2, check=True)
+
+    assert results[0]["returncode"] == 0
+    assert results[0]["shapefile"].exists()
+    assert results[0]["bytes"] > 0
+
+
+@test("PostgreSQL().pgsql2shp_many() exports each table and reports its size")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_pgsql2shp_many(database, shp)
@@ -0,0 +1,49 @@
+from ward import test, using
+
+from postgis_helpers import PostgreSQL
+from postgis_helpers.tests.fixtures import (
+    DataForTest,
+    database_1,
+    test_csv_data,
+    test_shp_data,
+)
+
+
+# Does the Arrow reader match pandas.read_sql()?
+# ---- --- ----- ------ ----- ------------------
+def _test_query_as_df_arrow(db: PostgreSQL, csv: DataForTest):
+
+    query = f"SELECT * FROM {csv.NAME}"
+
+    df = db.query_as_df(query, use_cache=False)
+    arrow_df = db.query_as_df(query, use_cache=False, arrow=True)
+
+    assert list(arrow_df.columns) == list(df.columns)
+    assert arrow_df.shape == df.shape
+
+
+@test("PostgreSQL().query_as_df(arrow=True) returns the same shape as pd.read_sql()")
+@using(db=database_1, csv=test_csv_data)
+def _(db, csv):
+    _test_query_as_df_arrow(db, csv)
+
+
+# Is the geometry kept as binary WKB, with the table's EPSG?
+# -- --- -------- ---- -- ------ ---- ---- --- ------- -----
+def _test_query_as_geo_df_arrow(db: PostgreSQL, shp: DataForTest):
+
+    query = f"SELECT * FROM {shp.NAME}"
+
+    table = db.query_as_arrow(query)
+    assert str(table.schema.field("geom").type) == "binary"
+
+    gdf = db.query_as_geo_df(query, use_cache=False, arrow=True)
+
+    assert gdf.crs.to_epsg() == shp.EPSG
+    assert gdf.shape[0] == table.num_rows
+
+
+@test("PostgreSQL().query_as_geo_df(arrow=True) decodes WKB geometry with the right EPSG")
+@using(db=database_1, shp=test_shp_data)
+def _(db, shp):
+    _test_query_as_geo_df_arrow(db, shp)
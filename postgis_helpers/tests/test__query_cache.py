@@ -0,0 +1,54 @@
+from ward import test, using
+
+from postgis_helpers import PostgreSQL
+from postgis_helpers.cache_helpers import QueryResultCache
+from postgis_helpers.config_helpers import DEFAULT_DATA_INBOX
+from postgis_helpers.tests.fixtures import database_1
+
+
+# Is a cached result reused, and refreshed after the table changes?
+# -- - ------ ------ ------- --- --------- ----- --- ----- --------
+def _test_query_cache_refreshes(db: PostgreSQL):
+
+    table_name = "query_cache_test"
+    query = f"SELECT * FROM {table_name} ORDER BY some_value"
+
+    db.QUERY_CACHE = QueryResultCache(DEFAULT_DATA_INBOX / "query_cache_test")
+
+    try:
+        db.execute(f"CREATE TABLE {table_name} AS SELECT 1 AS some_value;")
+
+        first = db.query_as_df(query)
+        second = db.query_as_df(query)
+        assert first.equals(second)
+
+        # Schema changes make a new cache key as soon as they commit
+        db.execute(f"ALTER TABLE {table_name} ADD COLUMN other_value INT;")
+        assert "other_value" in db.query_as_df(query).columns
+
+        # Writes through execute() clear the cache
+        db.execute(f"INSERT INTO {table_name} VALUES (2, 2);")
+        assert db.query_as_df(query).shape[0] == 2
+
+        # Writes that go around this object are caught by the fingerprint
+        db.query_as_df(query)
+        with db.connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute(f"UPDATE {table_name} SET other_value = 3 WHERE some_value = 2;")
+            cursor.close()
+        assert 3 in list(db.query_as_df(query)["other_value"])
+
+        # Results that can't be written to Parquet are returned uncached
+        df = db.query_as_df(f"SELECT some_value, some_value FROM {table_name}")
+        assert df.shape[0] == 2
+
+    finally:
+        db.QUERY_CACHE.invalidate()
+        db.QUERY_CACHE = None
+        db.table_delete(table_name)
+
+
+@test("PostgreSQL.query_as_df() reuses cached results until the table changes")
+@using(db=database_1)
+def _(db):
+    _test_query_cache_refreshes(db)
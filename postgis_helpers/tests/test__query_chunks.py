@@ -0,0 +1,44 @@
+from ward import test, using
+
+from postgis_helpers import PostgreSQL
+from postgis_helpers.tests.fixtures import (
+    DataForTest,
+    database_1,
+    test_csv_data,
+    test_shp_data,
+)
+
+
+# Do the chunks add up to the whole table?
+# ---------- ---------- ---------- -------
+def _test_query_as_df_chunks(db: PostgreSQL, csv: DataForTest):
+
+    query = f"SELECT * FROM {csv.NAME}"
+
+    chunks = list(db.query_as_df_chunks(query, itersize=500))
+
+    db_table_row_count = db.query_as_single_item(f"SELECT COUNT(*) FROM {csv.NAME}")
+
+    assert sum(len(df) for df in chunks) == db_table_row_count
+
+
+@test("PostgreSQL().query_as_df_chunks() yields every row of the table")
+@using(db=database_1, csv=test_csv_data)
+def _(db, csv):
+    _test_query_as_df_chunks(db, csv)
+
+
+# Does every spatial chunk have the table's EPSG?
+# ---------- ---------- ---------- ---------- ---
+def _test_query_as_geo_df_chunks_crs(db: PostgreSQL, shp: DataForTest):
+
+    query = f"SELECT * FROM {shp.NAME}"
+
+    for gdf in db.query_as_geo_df_chunks(query, itersize=100):
+        assert gdf.crs.to_epsg() == shp.EPSG
+
+
+@test("PostgreSQL().query_as_geo_df_chunks() yields chunks with a matching EPSG")
+@using(db=database_1, shp=test_shp_data)
+def _(db, shp):
+    _test_query_as_geo_df_chunks_crs(db, shp)
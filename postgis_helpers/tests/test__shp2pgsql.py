@@ -42,3 +42,21 @@ def _test_shp2pgsql_epsg(db: PostgreSQL, shp: DataForTest):
 @using(database=database_1, shp=test_shp_data)
 def _(database, shp):
     _test_shp2pgsql_epsg(database, shp)
+
+
+# Does the batch loader import every shapefile in the folder?
+# ---- --- ----- ------ ------ ----- --------- -- --- ------
+def _test_shp2pgsql_many(db: PostgreSQL, shp: DataForTest):
+
+    results = db.shp2pgsql_many(shp.IMPORT_FOLDER, jobs=2, check=True)
+
+    assert [r["table"] for r in results] == [shp.NAME]
+    assert results[0]["returncode"] == 0
+
+    assert db.all_spatial_tables_as_dict()[shp.NAME] == shp.EPSG
+
+
+@test("PostgreSQL().shp2pgsql_many() loads a folder of shapefiles with the EPSG from the .prj")
+@using(database=database_1, shp=test_shp_data)
+def _(database, shp):
+    _test_shp2pgsql_many(database, shp)
@@ -0,0 +1,33 @@
+from ward import test, using
+
+from postgis_helpers import PostgreSQL
+from postgis_helpers.tests.fixtures import DataForTest, database_1, test_csv_data
+
+
+# Does every row of the source table get a point?
+# ---- ----- --- -- --- ------ ----- --- - ------
+def _test_table_spatialize_points(db: PostgreSQL, csv: DataForTest, **kwargs):
+
+    new_table = f"{csv.NAME}_points"
+
+    db.table_spatialize_points(csv.NAME, "long_", "lat", 4326, new_table=new_table, **kwargs)
+
+    src_count = db.query_as_single_item(f"SELECT COUNT(*) FROM {csv.NAME}")
+    new_count = db.query_as_single_item(f"SELECT COUNT(*) FROM {new_table}")
+
+    assert src_count == new_count
+    assert db.all_spatial_tables_as_dict()[new_table] == 4326
+
+    db.table_delete(new_table)
+
+
+@test("PostgreSQL().table_spatialize_points(in_database=True) makes a point for every row")
+@using(db=database_1, csv=test_csv_data)
+def _(db, csv):
+    _test_table_spatialize_points(db, csv, in_database=True)
+
+
+@test("PostgreSQL().table_spatialize_points(chunk_size=500) makes a point for every row")
+@using(db=database_1, csv=test_csv_data)
+def _(db, csv):
+    _test_table_spatialize_points(db, csv, chunk_size=500)